@@ -0,0 +1,74 @@
+"""Benchmark: memory & instantiation time of generated dataclass variants.
+
+Generates the same table as plain, slots, slots + frozen and Python 3.9
+compatible slots (`_add_slots` fallback) dataclasses, then creates many
+instances of each variant and reports memory per instance & time.
+
+Run: python example/benchmark_dataclass_variants.py [rows]
+"""
+
+import contextlib
+import io
+import sys
+import timeit
+import tracemalloc
+
+from omymodels import create_models
+
+ddl = """
+CREATE TABLE events (
+    id BIGINT NOT NULL,
+    user_id INTEGER NOT NULL,
+    kind VARCHAR(32) NOT NULL,
+    amount DECIMAL(10, 2),
+    is_test BOOLEAN,
+    payload TEXT
+);
+"""
+
+variants = {
+    "plain": {},
+    "frozen": {"frozen": True},
+    "slots (3.10+)": {"slots": True, "target_python": "3.10"},
+    "slots + frozen (3.10+)": {"slots": True, "frozen": True, "target_python": "3.10"},
+    "slots fallback (3.9)": {"slots": True, "target_python": "3.9"},
+}
+
+
+def load_model(options: dict):
+    # dump=False prints the code, hide it
+    with contextlib.redirect_stdout(io.StringIO()):
+        code = create_models(
+            ddl, models_type="dataclass", generator_options=options, dump=False
+        )["code"]
+    namespace = {}
+    exec(compile(code, "<generated>", "exec"), namespace)
+    return namespace["Events"]
+
+
+def measure(model, rows: int):
+    row = (1, 2, "click", 10.5, False, "payload")
+
+    tracemalloc.start()
+    objects = [model(*row) for _ in range(rows)]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    seconds = min(timeit.repeat(lambda: model(*row), number=rows, repeat=3))
+    return memory / rows, seconds
+
+
+def main(rows: int = 100_000):
+    if sys.version_info < (3, 10):
+        for name in list(variants):
+            if variants[name].get("target_python") == "3.10":
+                del variants[name]
+    print(f"{'variant':<26}{'bytes/instance':>16}{'sec per ' + str(rows):>20}")
+    for name, options in variants.items():
+        per_instance, seconds = measure(load_model(options), rows)
+        print(f"{name:<26}{per_instance:>16.1f}{seconds:>20.4f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
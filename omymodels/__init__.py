@@ -6,11 +6,16 @@ Supports generating models for:
 - Pydantic v1 and v2
 - SQLModel
 - Python Dataclasses
+- msgspec Structs
+- typing.NamedTuple & TypedDict
 - OpenAPI 3 schemas
+- pyarrow, Polars & pandas schemas
+- NumPy structured dtypes
 """
 
 from omymodels.converter import convert_models
 from omymodels.from_ddl import create_models
+from omymodels.indexes import find_unindexed_foreign_keys
 from omymodels.openapi import create_models_from_openapi3
 
 # Plugin system for custom generators
@@ -23,6 +28,7 @@ from omymodels.plugins import (
 # Base classes for creating custom generators
 from omymodels.generation import (
     BaseGenerator,
+    ColumnarGenerator,
     DataModelGenerator,
     ORMGenerator,
 )
@@ -35,6 +41,7 @@ __all__ = [
     "create_models",
     "convert_models",
     "create_models_from_openapi3",
+    "find_unindexed_foreign_keys",
     # Plugin system
     "register_generator",
     "unregister_generator",
@@ -43,5 +50,6 @@ __all__ = [
     "BaseGenerator",
     "ORMGenerator",
     "DataModelGenerator",
+    "ColumnarGenerator",
     "TypeConverter",
 ]
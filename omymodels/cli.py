@@ -1,10 +1,12 @@
 import argparse
 import os
 import pprint
+import re
 import sys
 
 from omymodels import create_models
 from omymodels.generators import supported_models
+from omymodels.indexes import find_unindexed_foreign_keys
 
 
 def version(**kwargs):
@@ -60,9 +62,79 @@ def cli():
         default=False,
         help="Do not add defaults in Pydantic & Dataclass models",
     )
+    omm_cli.add_argument(
+        "--include-tables",
+        nargs="+",
+        default=None,
+        help="Generate models only for tables that match one of the glob patterns "
+        "(matched against 'table' and 'schema.table')",
+    )
+    omm_cli.add_argument(
+        "--exclude-tables",
+        nargs="+",
+        default=None,
+        help="Skip tables that match one of the glob patterns",
+    )
+    omm_cli.add_argument(
+        "--include-schemas",
+        nargs="+",
+        default=None,
+        help="Generate models only for tables from schemas that match one of the glob patterns",
+    )
+    omm_cli.add_argument(
+        "--filters-regex",
+        action="store_true",
+        default=False,
+        help="Treat --include-tables, --exclude-tables & --include-schemas values as regular expressions",
+    )
+    omm_cli.add_argument(
+        "--package-mode",
+        choices=["table", "schema"],
+        default=None,
+        help="Save models as a package (target path without extension) with one module "
+        "per table or per schema and lazy imports in __init__.py",
+    )
+    omm_cli.add_argument(
+        "--dedup-tables",
+        action="store_true",
+        default=False,
+        help="Tables with the same columns share one abstract base model "
+        "(sqlalchemy & sqlalchemy_v2 models)",
+    )
+    omm_cli.add_argument(
+        "--fk-indexes",
+        action="store_true",
+        default=False,
+        help="Add Index() for foreign key columns without index "
+        "(sqlalchemy, sqlalchemy_v2, sqlalchemy_core & gino models)",
+    )
+    omm_cli.add_argument(
+        "--fk-index-report",
+        action="store_true",
+        default=False,
+        help="Print foreign key columns that are not covered by any index",
+    )
     return omm_cli
 
 
+def prepare_filters(patterns, regex: bool):
+    if not patterns or not regex:
+        return patterns
+    return [re.compile(pattern) for pattern in patterns]
+
+
+def print_fk_index_report(unindexed):
+    if not unindexed:
+        print("All foreign key columns are covered by indexes")
+        return
+    print("Foreign key columns without index:")
+    for fk in unindexed:
+        print(
+            f"  {fk['table']}.{fk['column']} -> {fk['ref_table']}.{fk['ref_column']}"
+            f" (suggested index: {fk['index_name']})"
+        )
+
+
 def main():
     omm = cli()
     args = omm.parse_args()
@@ -81,8 +153,17 @@ def main():
         models_type=args.models_type,
         schema_global=not args.no_global_schema,
         defaults_off=args.defaults_off,
+        include_tables=prepare_filters(args.include_tables, args.filters_regex),
+        exclude_tables=prepare_filters(args.exclude_tables, args.filters_regex),
+        include_schemas=prepare_filters(args.include_schemas, args.filters_regex),
+        package_mode=args.package_mode,
+        generator_options={"fk_indexes": True} if args.fk_indexes else None,
+        dedup_tables=args.dedup_tables,
     )
     print(f"File with result was saved to {target_file} file")
 
+    if args.fk_index_report:
+        print_fk_index_report(find_unindexed_foreign_keys(result["metadata"]["tables"]))
+
     if args.v or args.no_dump:
         pprint.pprint(result)
@@ -0,0 +1,166 @@
+"""Foreign key dependency graph between tables."""
+
+import heapq
+from typing import Dict, Iterable, List, Set
+
+from table_meta.model import TableMeta
+
+
+def get_alter_columns(table: TableMeta) -> List:
+    """Get ALTER TABLE columns if they exist."""
+    if hasattr(table, "alter") and table.alter:
+        return table.alter.get("columns", [])
+    return []
+
+
+class ForeignKeyGraph:
+    """Graph of foreign key references between tables.
+
+    Built once per run from inline REFERENCES, table constraints and
+    ALTER TABLE ... FOREIGN KEY statements. Edges go from the table that
+    holds the foreign key to the referenced table.
+    """
+
+    def __init__(self, tables: List[TableMeta]):
+        self.tables: List[str] = []
+        self.references: List[Dict[str, str]] = []
+        self.dependencies: Dict[str, Set[str]] = {}
+        self.dependents: Dict[str, Set[str]] = {}
+        for table in tables:
+            self.add_table(table)
+
+    def add_table(self, table: TableMeta) -> None:
+        if table.name not in self.dependencies:
+            self.tables.append(table.name)
+            self.dependencies[table.name] = set()
+        for column in table.columns:
+            if column.references and column.references.get("table"):
+                self.add_reference(table.name, column.name, column.references)
+        for alter_col in get_alter_columns(table):
+            ref_info = alter_col.get("references")
+            if ref_info and ref_info.get("table"):
+                self.add_reference(table.name, alter_col["name"], ref_info)
+
+    def add_reference(self, table_name: str, column_name: str, reference: Dict) -> None:
+        ref_table = reference["table"]
+        self.references.append(
+            {
+                "table": table_name,
+                "column": column_name,
+                "ref_table": ref_table,
+                "ref_column": reference.get("column") or column_name,
+                "on_delete": reference.get("on_delete"),
+            }
+        )
+        self.dependencies.setdefault(table_name, set()).add(ref_table)
+        self.dependents.setdefault(ref_table, set()).add(table_name)
+
+    def closure(self, roots: Iterable[str]) -> List[str]:
+        """Roots and all tables they reference directly or transitively.
+
+        Tables referenced in FKs but absent in DDL are skipped. Result keeps
+        the original DDL order.
+        """
+        unknown = [name for name in roots if name not in self.dependencies]
+        if unknown:
+            raise ValueError(
+                f"Tables not found in DDL: {unknown}. Available tables: {self.tables}"
+            )
+        seen = set()
+        stack = list(roots)
+        while stack:
+            name = stack.pop()
+            if name in seen or name not in self.dependencies:
+                continue
+            seen.add(name)
+            stack.extend(self.dependencies[name] - seen)
+        return [name for name in self.tables if name in seen]
+
+    def sort(self, names: List[str]) -> List[str]:
+        """Order tables so referenced tables go before tables that reference them.
+
+        Ties keep the original order. Tables that take part in a cycle (or
+        depend on one) are placed at the end in original order, use
+        find_cycles() to report them.
+        """
+        names = list(dict.fromkeys(names))
+        index = {name: num for num, name in enumerate(names)}
+        indegree = {
+            name: len(
+                {dep for dep in self.dependencies.get(name, ()) if dep in index} - {name}
+            )
+            for name in names
+        }
+        heap = [index[name] for name in names if not indegree[name]]
+        heapq.heapify(heap)
+        ordered = []
+        while heap:
+            name = names[heapq.heappop(heap)]
+            ordered.append(name)
+            for child in self.dependents.get(name, ()):
+                if child in index and child != name:
+                    indegree[child] -= 1
+                    if not indegree[child]:
+                        heapq.heappush(heap, index[child])
+        if len(ordered) < len(names):
+            done = set(ordered)
+            ordered.extend(name for name in names if name not in done)
+        return ordered
+
+    def find_cycles(self) -> List[List[str]]:
+        """Groups of tables that reference each other in a cycle.
+
+        Self-references (e.g. parent_id) are not reported, they do not
+        affect the order of models.
+        """
+        state = {"index": {}, "lowlink": {}, "on_stack": set(), "stack": []}
+        cycles = []
+        order = {table: num for num, table in enumerate(self.tables)}
+        for root in self.tables:
+            if root not in state["index"]:
+                for component in self._strong_components(root, state):
+                    if len(component) > 1:
+                        cycles.append(sorted(component, key=order.get))
+        return cycles
+
+    def _visit(self, name: str, state: Dict) -> None:
+        state["index"][name] = state["lowlink"][name] = len(state["index"])
+        state["stack"].append(name)
+        state["on_stack"].add(name)
+
+    def _strong_components(self, root: str, state: Dict) -> List[List[str]]:
+        """Tarjan's algorithm (iterative DFS from root): strongly connected
+        components of tables reachable from root."""
+        index, lowlink, on_stack = state["index"], state["lowlink"], state["on_stack"]
+        components = []
+        self._visit(root, state)
+        work = [(root, iter(sorted(self.dependencies[root])))]
+        while work:
+            name, deps = work[-1]
+            for dep in deps:
+                if dep not in self.dependencies:
+                    continue
+                if dep not in index:
+                    self._visit(dep, state)
+                    work.append((dep, iter(sorted(self.dependencies[dep]))))
+                    break
+                if dep in on_stack:
+                    lowlink[name] = min(lowlink[name], index[dep])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[name])
+                if lowlink[name] == index[name]:
+                    components.append(self._pop_component(name, state))
+        return components
+
+    @staticmethod
+    def _pop_component(name: str, state: Dict) -> List[str]:
+        component = []
+        while True:
+            member = state["stack"].pop()
+            state["on_stack"].discard(member)
+            component.append(member)
+            if member == name:
+                return component
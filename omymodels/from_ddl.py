@@ -1,21 +1,49 @@
 import copy
+import fnmatch
 import os
 import re
 import sys
-from typing import Dict, List, Optional
+import warnings
+from typing import Callable, Dict, List, Optional, Pattern, Set, Tuple, Union
 
 from simple_ddl_parser import DDLParser, parse_from_file
 from table_meta import TableMeta, Type
 
+from omymodels import package
+from omymodels.dependencies import ForeignKeyGraph
 from omymodels.errors import NoTablesError
 from omymodels.generators import get_generator_by_type, render_jinja2_template
 from omymodels.helpers import add_custom_types_to_generator
+from omymodels.indexes import add_index_details, index_name
 from omymodels.models.enum import core as enum
+from omymodels.partitions import add_partitions
+from omymodels.sequences import column_sequences, normalize_sequence
+from omymodels.shapes import group_tables_by_shape
+from omymodels.storage import add_storage_options
+
+# table/schema filter can be a glob string ("events_*") or a compiled regex
+NamePattern = Union[str, Pattern]
+
+
+class DDLTable(TableMeta):
+    """TableMeta with table level details from DDL that TableMeta does not keep."""
+
+    partition_by: Optional[Dict]
+    partitions: List[Dict] = []
+    storage: Dict = {}
+    sequences: Dict[str, Dict] = {}
+    unique_constraints: List[Dict] = []
 
 
 def get_tables_information(
-    ddl: Optional[str] = None, ddl_file: Optional[str] = None
+    ddl: Optional[str] = None,
+    ddl_file: Optional[str] = None,
+    include_tables: Optional[List[NamePattern]] = None,
+    exclude_tables: Optional[List[NamePattern]] = None,
+    include_schemas: Optional[List[NamePattern]] = None,
 ) -> List[Dict]:
+    """Parse DDL & filter tables, index details, partitions & storage options
+    are collected only for tables that passed filters."""
     if not ddl_file and not ddl:
         raise ValueError(
             "You need to provide one of above argument: ddl with string that "
@@ -27,6 +55,12 @@ def get_tables_information(
         tables = parse_from_file(
             ddl_file, parser_settings={"normalize_names": True}, group_by_type=True
         )
+        with open(ddl_file) as f:
+            ddl = f.read()
+    tables = filter_tables(tables, include_tables, exclude_tables, include_schemas)
+    add_index_details(tables["tables"], ddl)
+    tables["tables"] = add_partitions(tables["tables"], ddl)
+    add_storage_options(tables["tables"], ddl)
     return tables
 
 
@@ -46,10 +80,43 @@ def create_models(
     table_suffix: Optional[str] = "",
     relationships: Optional[bool] = False,
     split_by_schema: Optional[bool] = False,
+    include_tables: Optional[List[NamePattern]] = None,
+    exclude_tables: Optional[List[NamePattern]] = None,
+    include_schemas: Optional[List[NamePattern]] = None,
+    tables: Optional[List[str]] = None,
+    with_dependencies: Optional[bool] = False,
+    sort_by_dependencies: Optional[bool] = False,
+    package_mode: Optional[str] = None,
+    generator_options: Optional[Dict] = None,
+    dedup_tables: Optional[bool] = False,
 ):
-    """models_type can be: "gino", "dataclass", "pydantic" """
+    """models_type can be: "gino", "dataclass", "pydantic"
+
+    include_tables, exclude_tables & include_schemas accept glob strings
+    or compiled regexes and are applied right after parsing, so
+    filtered out tables never reach normalization.
+
+    tables - generate models only for these tables, with_dependencies=True
+    also adds all tables they reference by foreign keys.
+    sort_by_dependencies=True emits referenced tables before tables
+    that reference them.
+
+    package_mode - "table" or "schema": save models as a package with one
+    module per table (or schema) and lazy imports in `__init__.py`,
+    dump_path without extension is used as the package folder.
+
+    generator_options - dict with options specific for the models_type
+    generator, passed to generate_model() as keyword arguments.
+
+    dedup_tables=True - tables with the same columns (sharded, monthly or
+    per-tenant copies) share one abstract base model with the columns,
+    models of the tables only set __tablename__ & table args
+    (sqlalchemy & sqlalchemy_v2, single file or split_by_schema mode).
+    """
     # extract data from ddl file
-    data = get_tables_information(ddl, ddl_path)
+    data = get_tables_information(
+        ddl, ddl_path, include_tables, exclude_tables, include_schemas
+    )
     data = prepare_data(data)
     data = convert_ddl_to_models(data, no_auto_snake_case)
     if not data["tables"] and not data["types"]:
@@ -58,6 +125,32 @@ def create_models(
         else:
             raise NoTablesError()
 
+    graph = ForeignKeyGraph(data["tables"])
+    if tables or sort_by_dependencies:
+        data["tables"] = select_tables(
+            data["tables"], graph, tables, with_dependencies, sort_by_dependencies
+        )
+
+    if package_mode:
+        if dedup_tables:
+            raise ValueError("dedup_tables is not supported with package_mode")
+        output = generate_models_package(
+            data,
+            singular,
+            naming_exceptions,
+            models_type,
+            package_mode,
+            schema_global,
+            defaults_off,
+            table_prefix=table_prefix,
+            table_suffix=table_suffix,
+            relationships=relationships,
+            graph=graph,
+            generator_options=generator_options,
+        )
+        dump_models(output, dump, dump_path, package.save_models_package, "# === {}.py ===")
+        return {"metadata": data, "code": output}
+
     # Handle split_by_schema mode
     if split_by_schema:
         output = generate_models_by_schema(
@@ -69,13 +162,11 @@ def create_models(
             table_prefix=table_prefix,
             table_suffix=table_suffix,
             relationships=relationships,
+            graph=graph,
+            generator_options=generator_options,
+            dedup_tables=dedup_tables,
         )
-        if dump:
-            save_models_by_schema(output, dump_path)
-        else:
-            for schema_name, code in output.items():
-                print(f"# === {schema_name} ===")
-                print(code)
+        dump_models(output, dump, dump_path, save_models_by_schema, "# === {} ===")
         return {"metadata": data, "code": output}
 
     # generate code (single file mode)
@@ -89,12 +180,120 @@ def create_models(
         table_prefix=table_prefix,
         table_suffix=table_suffix,
         relationships=relationships,
+        graph=graph,
+        generator_options=generator_options,
+        dedup_tables=dedup_tables,
     )
+    dump_models(output, dump, dump_path, save_models_to_file)
+    return {"metadata": data, "code": output}
+
+
+def dump_models(
+    output: Union[str, Dict[str, str]],
+    dump: bool,
+    dump_path: str,
+    save: Callable,
+    title: str = "",
+) -> None:
+    """Save generated code with save(output, dump_path) or print it,
+    each file of multi-file output is printed after its title."""
     if dump:
-        save_models_to_file(output, dump_path)
+        save(output, dump_path)
+    elif isinstance(output, dict):
+        for name, code in output.items():
+            print(title.format(name))
+            print(code)
     else:
         print(output)
-    return {"metadata": data, "code": output}
+
+
+def _match_name(name: str, patterns: List[NamePattern]) -> bool:
+    for pattern in patterns:
+        if isinstance(pattern, str):
+            if fnmatch.fnmatchcase(name, pattern):
+                return True
+        elif pattern.fullmatch(name):
+            return True
+    return False
+
+
+def _table_matches(table: Dict, patterns: List[NamePattern]) -> bool:
+    """Table matches by its name or by 'schema.name'."""
+    name = clean_value(table["table_name"])
+    if _match_name(name, patterns):
+        return True
+    schema = table.get("schema")
+    return bool(schema) and _match_name(f"{clean_value(schema)}.{name}", patterns)
+
+
+def filter_tables(
+    data: Dict,
+    include_tables: Optional[List[NamePattern]] = None,
+    exclude_tables: Optional[List[NamePattern]] = None,
+    include_schemas: Optional[List[NamePattern]] = None,
+) -> Dict:
+    """Drop tables that do not pass filters from raw parser output.
+
+    Works on the raw dicts from simple-ddl-parser, so it must be called
+    before prepare_data() & convert_ddl_to_models().
+    """
+    if not (include_tables or exclude_tables or include_schemas):
+        return data
+    tables = []
+    for table in data["tables"]:
+        if include_schemas and not _match_name(
+            clean_value(table.get("schema") or ""), include_schemas
+        ):
+            continue
+        if include_tables and not _table_matches(table, include_tables):
+            continue
+        if exclude_tables and _table_matches(table, exclude_tables):
+            continue
+        tables.append(table)
+    data["tables"] = tables
+    return data
+
+
+def select_tables(
+    tables: List[TableMeta],
+    graph: ForeignKeyGraph,
+    names: Optional[List[str]] = None,
+    with_dependencies: Optional[bool] = False,
+    sort_by_dependencies: Optional[bool] = False,
+) -> List[TableMeta]:
+    """Select subset of tables by names (optionally with FK closure) & order them."""
+    if names:
+        unknown = [name for name in names if name not in graph.tables]
+        if unknown:
+            raise NoTablesError(
+                f"Tables not found in DDL: {unknown}. Available tables: {graph.tables}"
+            )
+        if with_dependencies:
+            names = graph.closure(names)
+        selected = set(names)
+        tables = [table for table in tables if table.name in selected]
+    if sort_by_dependencies:
+        warn_about_cycles(graph, [table.name for table in tables])
+        position = {
+            name: num
+            for num, name in enumerate(graph.sort([table.name for table in tables]))
+        }
+        tables = sorted(tables, key=lambda table: position[table.name])
+    return tables
+
+
+def warn_about_cycles(graph: ForeignKeyGraph, names: List[str]) -> None:
+    """Tables of a foreign key cycle can not be created one by one in any order,
+    sort() puts them at the end - warn with the tables of each cycle."""
+    selected = set(names)
+    for cycle in graph.find_cycles():
+        if selected.issuperset(cycle):
+            warnings.warn(
+                f"Tables reference each other in a cycle: {', '.join(cycle)}. "
+                "They are placed after other tables, one of the foreign keys "
+                "needs use_alter=True to create them",
+                stacklevel=3,
+            )
 
 
 def snake_case(string: str) -> str:
@@ -109,6 +308,7 @@ def convert_ddl_to_models(  # noqa: C901
     final_data = {"tables": [], "types": []}
     refs = {}
     tables = []
+    sequences = [normalize_sequence(sequence) for sequence in data.get("sequences", [])]
     for table in data["tables"]:
         for ref in table.get("constraints", {}).get("references", []):
             # References can be compopund references.  Here we split into one
@@ -135,18 +335,29 @@ def convert_ddl_to_models(  # noqa: C901
             # Handle generated columns (GENERATED ALWAYS AS)
             if "generated" in column:
                 column["generated_as"] = column["generated"].get("as")
+            # Column has no field for AUTO_INCREMENT
+            if column.get("autoincrement"):
+                column["properties"] = {**(column.get("properties") or {}), "autoincrement": True}
         if not no_auto_snake_case:
             table["primary_key"] = [snake_case(pk) for pk in table["primary_key"]]
             for uniq in table.get("constraints", {}).get("uniques", []):
                 uniq["columns"] = [snake_case(c) for c in uniq["columns"]]
             # NOTE: We are not going to try and parse check constraint statements
             # and update the snake case.
+            if table.get("partition_by"):
+                table["partition_by"]["columns"] = [
+                    snake_case(c) for c in table["partition_by"]["columns"]
+                ]
             for idx in table.get("index", []):
                 idx["columns"] = [snake_case(c) for c in idx["columns"]]
+                idx["include"] = [snake_case(c) for c in idx.get("include") or []]
                 for col_detail in idx["detailed_columns"]:
                     col_detail["name"] = snake_case(col_detail["name"])
-        tables.append(TableMeta(**table))
+        table["unique_constraints"] = unique_constraints(table)
+        table["sequences"] = column_sequences(table, sequences)
+        tables.append(DDLTable(**table))
     final_data["tables"] = tables
+    final_data["sequences"] = sequences
     _types = []
     for _type in data["types"]:
         _types.append(Type(**_type))
@@ -154,6 +365,19 @@ def convert_ddl_to_models(  # noqa: C901
     return final_data
 
 
+def unique_constraints(table: Dict) -> List[Dict]:
+    """UNIQUE (...) table constraints (TableMeta has no field for them),
+    used as conflict targets of upsert helpers."""
+    return [
+        {
+            "name": uniq.get("constraint_name")
+            or index_name(table["table_name"], uniq["columns"], "uq"),
+            "columns": uniq["columns"],
+        }
+        for uniq in table.get("constraints", {}).get("uniques", [])
+    ]
+
+
 def save_models_to_file(models: str, dump_path: str) -> None:
     folder = os.path.dirname(dump_path)
     if folder:
@@ -206,6 +430,9 @@ def generate_models_by_schema(
     table_prefix: Optional[str] = "",
     table_suffix: Optional[str] = "",
     relationships: Optional[bool] = False,
+    graph: Optional[ForeignKeyGraph] = None,
+    generator_options: Optional[Dict] = None,
+    dedup_tables: Optional[bool] = False,
 ) -> Dict[str, str]:
     """Generate models split by schema, each with its own Base class."""
     from omymodels.generators import get_generator_by_type, render_jinja2_template
@@ -216,22 +443,36 @@ def generate_models_by_schema(
     # Collect relationships across all tables if enabled
     relationships_map = {}
     if relationships:
-        relationships_map = collect_relationships(data["tables"])
+        relationships_map = collect_relationships(data["tables"], graph)
 
     for schema_name, tables in tables_by_schema.items():
         generator = get_generator_by_type(models_type)
-        add_custom_types_to_generator(data["types"], generator)
 
         models_str = ""
         header = ""
 
         # Include types only in the first (or default) schema file
         if data["types"] and schema_name == "":
-            types_generator = enum.ModelGenerator(data["types"])
-            models_str += types_generator.create_types()
-            header += types_generator.create_header()
+            types_str, header = generate_types(data["types"], generator)
+            models_str += types_str
+        # after create_types(): it sets base_type & class names of the types
+        add_custom_types_to_generator(data["types"], generator)
 
+        shape_bases = get_shape_bases(
+            generator,
+            models_type,
+            tables,
+            dedup_tables,
+            singular,
+            exceptions,
+            False,
+            generator_options,
+        )
+        defined = set()
         for table in tables:
+            models_str += generate_shape_base(
+                generator, table, shape_bases, defined, False, generator_options
+            )
             models_str += generator.generate_model(
                 table,
                 singular,
@@ -241,6 +482,8 @@ def generate_models_by_schema(
                 table_prefix=table_prefix,
                 table_suffix=table_suffix,
                 relationships=relationships_map.get(table.name, []) if relationships else [],
+                **shape_base_option(table, shape_bases),
+                **(generator_options or {}),
             )
 
         header += generator.create_header(tables, schema=False, models_str=models_str)
@@ -248,7 +491,11 @@ def generate_models_by_schema(
         # Generate code with schema-specific Base name
         base_name = _schema_to_base_name(schema_name)
         output = render_jinja2_template(
-            models_type, models_str, header, base_name=base_name
+            models_type,
+            models_str,
+            header,
+            base_name=base_name,
+            async_attrs=getattr(generator, "async_attrs", False),
         )
 
         # Replace class inheritance from Base to custom base name
@@ -260,8 +507,130 @@ def generate_models_by_schema(
     return results
 
 
+def group_tables_by_module(tables: List, package_mode: str) -> Dict[str, List]:
+    """Group tables by package module: one module per table or per schema."""
+    if package_mode == "schema":
+        return {
+            package.module_name(schema): schema_tables
+            for schema, schema_tables in group_tables_by_schema(tables).items()
+        }
+    grouped = {}
+    for table in tables:
+        name = package.module_name(table.name)
+        if name in grouped and table.table_schema:
+            name = package.module_name(f"{table.table_schema}_{table.name}")
+        grouped.setdefault(name, []).append(table)
+    return grouped
+
+
+def generate_models_package(
+    data: Dict[str, List],
+    singular: bool = False,
+    exceptions: Optional[List] = None,
+    models_type: str = "sqlalchemy",
+    package_mode: str = "table",
+    schema_global: bool = True,
+    defaults_off: Optional[bool] = False,
+    table_prefix: Optional[str] = "",
+    table_suffix: Optional[str] = "",
+    relationships: Optional[bool] = False,
+    graph: Optional[ForeignKeyGraph] = None,
+    generator_options: Optional[Dict] = None,
+) -> Dict[str, str]:
+    """Generate package modules {module_name: code} with lazy `__init__`.
+
+    ORM models share one Base from `base.py`, enums live in `enums.py`.
+    Related models are imported under TYPE_CHECKING for type checkers only,
+    relationships refer to them by class name and `base.py` imports all
+    modules right before mappers are configured.
+    """
+    package.check_package_options(models_type, package_mode)
+    is_orm = models_type in package.orm_package_models
+    modules = {}
+    exports = {}
+    enum_names = []
+    if data["types"]:
+        types_generator = enum.ModelGenerator(data["types"])
+        types_str = types_generator.create_types()
+        modules[package.enums_module] = render_jinja2_template(
+            "enum", types_str, types_generator.create_header()
+        )
+        enum_names = [_type.name for _type in data["types"]]
+        exports.update({name: package.enums_module for name in enum_names})
+    if is_orm:
+        # rendered after models: generator options can change the Base
+        modules[package.base_module] = ""
+        exports["Base"] = package.base_module
+    async_attrs = False
+    has_related = False
+
+    tables_by_module = group_tables_by_module(data["tables"], package_mode)
+    table_modules = {
+        table.name: module
+        for module, tables in tables_by_module.items()
+        for table in tables
+    }
+    relationships_map = {}
+    if relationships and is_orm:
+        relationships_map = collect_relationships(data["tables"], graph)
+
+    for module, tables in tables_by_module.items():
+        generator = get_generator_by_type(models_type)
+        add_custom_types_to_generator(data["types"], generator)
+        models_str = ""
+        related = {}
+        for table in tables:
+            table_relationships = relationships_map.get(table.name, [])
+            models_str += generator.generate_model(
+                table,
+                singular,
+                exceptions,
+                schema_global=schema_global,
+                defaults_off=defaults_off,
+                table_prefix=table_prefix,
+                table_suffix=table_suffix,
+                relationships=table_relationships,
+                **(generator_options or {}),
+            )
+            for target_module, names in package.related_models(
+                table_relationships, module, table_modules, singular, exceptions
+            ).items():
+                related.setdefault(target_module, set()).update(names)
+        header = package.module_header(
+            generator.create_header(tables, schema=schema_global, models_str=models_str),
+            models_str,
+            enum_names,
+            related,
+        )
+        code = render_jinja2_template(
+            models_type,
+            models_str,
+            header,
+            base_import=package.base_import if is_orm else "",
+        )
+        modules[module] = package.add_future_annotations(code)
+        async_attrs = async_attrs or getattr(generator, "async_attrs", False)
+        has_related = has_related or bool(related)
+        exports.update(
+            {name: module for name in re.findall(r"^class (\w+)", models_str, re.M)}
+        )
+
+    if is_orm:
+        base = render_jinja2_template(models_type, "", "", async_attrs=async_attrs)
+        modules[package.base_module] = (
+            package.add_models_loader(base) if has_related else base
+        )
+    modules["__init__"] = package.create_init(exports)
+    return modules
+
+
 def _add_relationship(
-    relationships: Dict, table_name: str, fk_column: str, ref_table: str, ref_column: str
+    relationships: Dict,
+    table_name: str,
+    fk_column: str,
+    ref_table: str,
+    ref_column: str,
+    on_delete: Optional[str] = None,
 ):
     """Helper to add both sides of a relationship."""
     relationships.setdefault(table_name, []).append({
@@ -270,46 +639,102 @@ def _add_relationship(
         "ref_table": ref_table,
         "ref_column": ref_column,
         "child_table_name": table_name,
+        "on_delete": on_delete,
     })
     relationships.setdefault(ref_table, []).append({
         "type": "one_to_many",
         "child_table": table_name,
         "fk_column": fk_column,
+        "on_delete": on_delete,
     })
 
 
-def _get_alter_columns(table) -> List:
-    """Get ALTER TABLE columns if they exist."""
-    if hasattr(table, 'alter') and table.alter:
-        return table.alter.get("columns", [])
-    return []
+def collect_relationships(
+    tables: List, graph: Optional[ForeignKeyGraph] = None
+) -> Dict:
+    """Collect foreign key relationships between tables.
 
-
-def collect_relationships(tables: List) -> Dict:
-    """Collect foreign key relationships between tables."""
+    If graph is passed - it is reused instead of scanning tables again.
+    Only references from tables in the list are taken, so a subset of
+    tables does not get relationships to models that are not generated.
+    """
+    if graph is None:
+        graph = ForeignKeyGraph(tables)
+    names = {table.name for table in tables}
     relationships = {}
 
-    for table in tables:
-        for column in table.columns:
-            if column.references and column.references.get("table"):
-                _add_relationship(
-                    relationships, table.name, column.name,
-                    column.references["table"],
-                    column.references.get("column") or column.name
-                )
-
-        for alter_col in _get_alter_columns(table):
-            ref_info = alter_col.get("references")
-            if ref_info and ref_info.get("table"):
-                _add_relationship(
-                    relationships, table.name, alter_col["name"],
-                    ref_info["table"],
-                    ref_info.get("column") or alter_col["name"]
-                )
+    for ref in graph.references:
+        if ref["table"] in names and (
+            ref["ref_table"] in names or ref["ref_table"] not in graph.dependencies
+        ):
+            _add_relationship(
+                relationships, ref["table"], ref["column"],
+                ref["ref_table"], ref["ref_column"], ref["on_delete"]
+            )
 
     return relationships
 
 
+def get_shape_bases(
+    generator,
+    models_type: str,
+    tables: List[TableMeta],
+    dedup_tables: bool,
+    singular: bool = False,
+    exceptions: Optional[List] = None,
+    schema_global: bool = True,
+    generator_options: Optional[Dict] = None,
+) -> Dict:
+    """Shared base model names of tables with the same shape, if dedup_tables is on."""
+    if not dedup_tables:
+        return {}
+    if not hasattr(generator, "generate_shape_base"):
+        raise ValueError(f"dedup_tables is not supported for {models_type!r}")
+    options = generator_options or {}
+    return group_tables_by_shape(
+        tables,
+        singular,
+        exceptions,
+        schema_global,
+        options.get("defer_large_columns", False),
+        options.get("deferred_overrides"),
+    )
+
+
+def generate_shape_base(
+    generator,
+    table: TableMeta,
+    shape_bases: Dict,
+    defined: Set[str],
+    schema_global: bool,
+    generator_options: Optional[Dict] = None,
+) -> str:
+    """Base model of the table shape - once, before the first table of the shape."""
+    base_name = shape_bases.get((table.table_schema, table.name))
+    if not base_name or base_name in defined:
+        return ""
+    defined.add(base_name)
+    return generator.generate_shape_base(
+        table, base_name, schema_global, **(generator_options or {})
+    )
+
+
+def shape_base_option(table: TableMeta, shape_bases: Dict) -> Dict[str, str]:
+    base_name = shape_bases.get((table.table_schema, table.name))
+    return {"shape_base": base_name} if base_name else {}
+
+
+def generate_types(types: List, generator) -> Tuple[str, str]:
+    """Enum classes of the types & their imports, empty for generators that do not
+    refer to Enum classes (enum_classes = False). create_types() also sets
+    base types & class names of the types, so it runs for them too."""
+    types_generator = enum.ModelGenerator(types)
+    types_str = types_generator.create_types()
+    if not getattr(generator, "enum_classes", True):
+        return "", ""
+    return types_str, types_generator.create_header()
+
+
 def generate_models_file(
     data: Dict[str, List],
     singular: bool = False,
@@ -320,24 +745,39 @@ def generate_models_file(
     table_prefix: Optional[str] = "",
     table_suffix: Optional[str] = "",
     relationships: Optional[bool] = False,
+    graph: Optional[ForeignKeyGraph] = None,
+    generator_options: Optional[Dict] = None,
+    dedup_tables: Optional[bool] = False,
 ) -> str:
     """method to prepare full file with all Models &"""
     models_str = ""
     generator = get_generator_by_type(models_type)
     header = ""
     if data["types"]:
-        types_generator = enum.ModelGenerator(data["types"])
-        models_str += types_generator.create_types()
-        header += types_generator.create_header()
+        models_str, header = generate_types(data["types"], generator)
     if data["tables"]:
         add_custom_types_to_generator(data["types"], generator)
 
         # Collect relationships if enabled
         relationships_map = {}
         if relationships:
-            relationships_map = collect_relationships(data["tables"])
+            relationships_map = collect_relationships(data["tables"], graph)
 
+        shape_bases = get_shape_bases(
+            generator,
+            models_type,
+            data["tables"],
+            dedup_tables,
+            singular,
+            exceptions,
+            schema_global,
+            generator_options,
+        )
+        defined = set()
         for table in data["tables"]:
+            models_str += generate_shape_base(
+                generator, table, shape_bases, defined, schema_global, generator_options
+            )
             models_str += generator.generate_model(
                 table,
                 singular,
@@ -347,13 +787,20 @@ def generate_models_file(
                 table_prefix=table_prefix,
                 table_suffix=table_suffix,
                 relationships=relationships_map.get(table.name, []) if relationships else [],
+                **shape_base_option(table, shape_bases),
+                **(generator_options or {}),
             )
         header += generator.create_header(
             data["tables"], schema=schema_global, models_str=models_str
         )
     else:
         models_type = "enum"
-    output = render_jinja2_template(models_type, models_str, header)
+    output = render_jinja2_template(
+        models_type,
+        models_str,
+        header,
+        async_attrs=getattr(generator, "async_attrs", False),
+    )
     return output
 
 
@@ -6,5 +6,6 @@ Contains base classes for model generators.
 from omymodels.generation.base import BaseGenerator
 from omymodels.generation.orm_base import ORMGenerator
 from omymodels.generation.datamodel_base import DataModelGenerator
+from omymodels.generation.columnar_base import ColumnarGenerator
 
-__all__ = ["BaseGenerator", "ORMGenerator", "DataModelGenerator"]
+__all__ = ["BaseGenerator", "ORMGenerator", "DataModelGenerator", "ColumnarGenerator"]
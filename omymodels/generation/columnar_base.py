@@ -0,0 +1,120 @@
+"""Base generator for columnar schema generators (pyarrow, Polars, pandas, NumPy)."""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from table_meta.model import Column, TableMeta
+
+from omymodels.generation.base import BaseGenerator
+from omymodels.types import (
+    big_integer_types,
+    binary_types,
+    boolean_types,
+    float_types,
+    integer_types,
+    json_types,
+    numeric_types,
+    populate_types_mapping,
+    string_types,
+    text_types,
+    uuid_types,
+)
+
+# logical column kinds by SQL type, generators map kinds to library types
+kinds_mapping = populate_types_mapping(
+    {
+        string_types: "string",
+        text_types: "text",
+        binary_types: "binary",
+        json_types: "json",
+        integer_types: "int32",
+        big_integer_types: "int64",
+        # float is double precision in PostgreSQL & MySQL
+        float_types: "float64",
+        numeric_types: "decimal",
+        boolean_types: "bool",
+        uuid_types: "uuid",
+    }
+)
+kinds_mapping.update(
+    {
+        "tinyint": "int8",
+        "smallint": "int16",
+        "int2": "int16",
+        "int4": "int32",
+        "int8": "int64",
+        "smallserial": "int16",
+        "real": "float32",
+        "float4": "float32",
+        "float8": "float64",
+        "double": "float64",
+        "double precision": "float64",
+        "date": "date",
+        "timestamp": "timestamp",
+        "datetime": "timestamp",
+        "datetime2": "timestamp",
+        "smalldatetime": "timestamp",
+        "timestamptz": "timestamptz",
+        "time": "time",
+        "interval": "interval",
+        "bytea": "binary",
+    }
+)
+# NUMERIC without precision
+default_decimal_size = (38, 10)
+
+
+class ColumnarGenerator(BaseGenerator):
+    """Base class for columnar schema generators (pyarrow, Polars, pandas, NumPy).
+
+    Columns are resolved to logical kinds (int32, decimal, timestamp, enum, ...)
+    from SQL type groups, each generator maps kinds to its library types.
+    Enums keep their values in the order of generated enum classes.
+    """
+
+    # generators whose schemas do not refer to Enum classes set it to False -
+    # Enum classes of the types are not generated then
+    enum_classes = True
+
+    def __init__(self):
+        super().__init__()
+        self.enum_values: Dict[str, List[str]] = {}
+
+    @staticmethod
+    def sql_type(column: Column) -> str:
+        """SQL type of the column (of array elements for arrays) in lower case."""
+        _type = column.type.split("[")[0]
+        if "." in _type:
+            _type = _type.split(".")[1]
+        return _type.lower().strip('"')
+
+    @staticmethod
+    def is_array(column: Column) -> bool:
+        return "[" in column.type
+
+    def column_enum(self, column: Column) -> Optional[str]:
+        """Enum class name of the column type."""
+        return self.get_custom_type(self.sql_type(column))
+
+    def column_kind(self, column: Column) -> str:
+        """Logical kind of the column (array elements for arrays), unknown types are text."""
+        if self.column_enum(column):
+            return "enum"
+        return kinds_mapping.get(self.sql_type(column), "text")
+
+    def column_enum_values(self, column: Column) -> List[str]:
+        return self.enum_values.get(self.column_enum(column), [])
+
+    @staticmethod
+    def decimal_size(column: Column) -> Tuple[int, int]:
+        """Precision & scale of NUMERIC / DECIMAL column."""
+        if isinstance(column.size, tuple):
+            return int(column.size[0]), int(column.size[1])
+        if isinstance(column.size, int):
+            return column.size, 0
+        return default_decimal_size
+
+    @staticmethod
+    def table_var_name(table: TableMeta) -> str:
+        """Python variable prefix for the table: users, audit_log"""
+        return re.sub(r"\W", "_", table.name)
@@ -88,6 +88,10 @@ class DataModelGenerator(BaseGenerator):
             if default.upper() == "NULL":
                 return "None"
 
+            # Boolean defaults are already converted to Python literals
+            if default in ("True", "False"):
+                return default
+
             # Handle datetime defaults
             if column.type.upper() in datetime_types:
                 if datetime_now_check(default.lower()):
@@ -8,13 +8,21 @@ from jinja2 import Template
 
 from omymodels.models.dataclass import core as d
 from omymodels.models.gino import core as g
+from omymodels.models.msgspec import core as ms
+from omymodels.models.namedtuple import core as nt
+from omymodels.models.numpy import core as npm
 from omymodels.models.openapi3 import core as oas3
+from omymodels.models.pandas import core as pdm
+from omymodels.models.polars import core as plm
 from omymodels.models.pydantic import core as p
 from omymodels.models.pydantic_v2 import core as p2
+from omymodels.models.pyarrow import core as pa
 from omymodels.models.sqlalchemy import core as s
 from omymodels.models.sqlalchemy_core import core as sc
 from omymodels.models.sqlalchemy_v2 import core as s2
 from omymodels.models.sqlmodel import core as sm
+from omymodels.models.tortoise import core as tm
+from omymodels.models.typeddict import core as td
 
 # Built-in generator modules
 models = {
@@ -22,11 +30,19 @@ models = {
     "pydantic": p,
     "pydantic_v2": p2,
     "dataclass": d,
+    "msgspec": ms,
+    "namedtuple": nt,
+    "typeddict": td,
     "sqlalchemy": s,
     "sqlalchemy_v2": s2,
     "sqlalchemy_core": sc,
     "sqlmodel": sm,
+    "tortoise": tm,
     "openapi3": oas3,
+    "pyarrow": pa,
+    "polars": plm,
+    "pandas": pdm,
+    "numpy": npm,
 }
 
 supported_models = list(models.keys())
@@ -86,7 +102,12 @@ def get_supported_models() -> List[str]:
 
 
 def render_jinja2_template(
-    models_type: str, models: str, headers: str, base_name: str = "Base"
+    models_type: str,
+    models: str,
+    headers: str,
+    base_name: str = "Base",
+    base_import: str = "",
+    async_attrs: bool = False,
 ) -> str:
     """Render Jinja2 template for model output.
 
@@ -95,6 +116,9 @@ def render_jinja2_template(
         models: Generated model code
         headers: Generated header/imports code
         base_name: Name for the Base class (default: "Base")
+        base_import: Import of shared Base used instead of defining it
+            (package output mode, ORM templates only)
+        async_attrs: Add AsyncAttrs mixin to the Base class (sqlalchemy_v2)
 
     Returns:
         Rendered template as string
@@ -110,5 +134,11 @@ def render_jinja2_template(
     with open(template_file) as t:
         template = t.read()
         template = Template(template)
-        params = {"models": models, "headers": headers, "base_name": base_name}
+        params = {
+            "models": models,
+            "headers": headers,
+            "base_name": base_name,
+            "base_import": base_import,
+            "async_attrs": async_attrs,
+        }
         return template.render(**params)
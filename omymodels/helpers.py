@@ -1,5 +1,5 @@
 import re
-from typing import List, Optional, Text
+from typing import List, Optional, Text, Tuple, Union
 
 from table_meta import Type
 
@@ -95,9 +95,19 @@ def add_custom_types_to_generator(types: List[Type], generator: object) -> objec
         _type.base_type.lower(): (f"{generator.prefix}Enum", _type.name)
         for _type in types
     }
+    if hasattr(generator, "enum_values"):
+        generator.enum_values = {_type.name: enum_values(_type) for _type in types}
     return generator
 
 
+def enum_values(_type: Type) -> List[str]:
+    """Values of the enum type in the order of the generated enum class."""
+    values = _type.properties.get("values") or []
+    if isinstance(values, dict):
+        values = values.values()
+    return [str(value).strip("'\"") for value in values]
+
+
 def datetime_now_check(string: str) -> bool:
     """Check if string contains datetime 'now' function keywords."""
     now_keywords = [
@@ -114,3 +124,17 @@ def datetime_now_check(string: str) -> bool:
         "curtime",
     ]
     return any(keyword in string.lower() for keyword in now_keywords)
+
+
+def python_version(version: Union[str, Tuple[int, ...], None]) -> Tuple[int, int]:
+    """Parse target Python version: "3.10" or (3, 10). Default is 3.9 - minimal supported."""
+    if not version:
+        return (3, 9)
+    if isinstance(version, str):
+        version = tuple(int(part) for part in version.split("."))
+    return tuple(version[:2])
+
+
+def tuple_literal(items: List[str]) -> str:
+    """Python tuple source from items source, one element tuple gets a trailing comma."""
+    return "(" + ", ".join(items) + ("," if len(items) == 1 else "") + ")"
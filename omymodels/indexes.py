@@ -0,0 +1,328 @@
+"""Index analysis helpers: foreign key columns without index, index details from DDL."""
+
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from table_meta.model import TableMeta
+
+from omymodels.dependencies import get_alter_columns
+
+# PostgreSQL truncates identifiers longer than 63 bytes
+max_identifier_length = 63
+
+
+def index_name(table_name: str, columns: List[str], prefix: str = "ix") -> str:
+    name = f"{prefix}_{table_name}_{'_'.join(columns)}".replace("-", "_")
+    return name[:max_identifier_length]
+
+
+def leading_index_columns(table: TableMeta) -> Set[str]:
+    """Columns that can use an index: first columns of indexes, PK & unique columns.
+    Partial indexes (WHERE ...) cover only some rows and are skipped."""
+    leading = {
+        index["columns"][0]
+        for index in table.indexes or []
+        if index["columns"] and not index.get("where")
+    }
+    if table.primary_key:
+        leading.add(table.primary_key[0])
+    leading.update(column.name for column in table.columns if column.unique)
+    return leading
+
+
+def unindexed_foreign_keys(table: TableMeta) -> List[Dict[str, str]]:
+    """Foreign key columns of the table not covered by a leading index column.
+
+    Checks inline references and ALTER TABLE ... FOREIGN KEY statements.
+    """
+    references = [
+        (column.name, column.references)
+        for column in table.columns
+        if column.references and column.references.get("table")
+    ]
+    references.extend(
+        (alter_col["name"], alter_col["references"])
+        for alter_col in get_alter_columns(table)
+        if alter_col.get("references") and alter_col["references"].get("table")
+    )
+    covered = leading_index_columns(table)
+    # partial indexes keep their names, for example ix_orders_user_id ... WHERE
+    taken = {index["index_name"] for index in table.indexes or []}
+    result = []
+    for column_name, reference in references:
+        if column_name in covered:
+            continue
+        covered.add(column_name)
+        name = index_name(table.name, [column_name])
+        if name in taken:
+            name = index_name(table.name, [column_name, "fk"])
+        result.append(
+            {
+                "table": table.name,
+                "column": column_name,
+                "ref_table": reference["table"],
+                "ref_column": reference.get("column") or column_name,
+                "index_name": name,
+            }
+        )
+    return result
+
+
+def find_unindexed_foreign_keys(tables: List[TableMeta]) -> List[Dict[str, str]]:
+    """Report foreign key columns without index for all tables.
+
+    PostgreSQL does not create indexes for foreign keys, so joins and
+    cascade deletes on such columns end up with sequential scans.
+    """
+    result = []
+    for table in tables:
+        result.extend(unindexed_foreign_keys(table))
+    return result
+
+
+def table_indexes(
+    table: TableMeta, fk_indexes: bool = False, unique_constraints: bool = False
+) -> List[Dict]:
+    """Indexes from DDL plus, if fk_indexes, indexes for unindexed foreign keys
+    and, if unique_constraints, UNIQUE (...) table constraints as unique indexes
+    (upsert conflict targets must exist in tables created from models).
+
+    Added indexes use the same format as indexes from the parser.
+    """
+    indexes = list(table.indexes or [])
+    if unique_constraints:
+        indexes.extend(
+            {
+                "columns": constraint["columns"],
+                "index_name": constraint["name"],
+                "unique": True,
+            }
+            for constraint in getattr(table, "unique_constraints", None) or []
+        )
+    if fk_indexes:
+        indexes.extend(
+            {
+                "columns": [fk["column"]],
+                "index_name": fk["index_name"],
+                "unique": False,
+            }
+            for fk in unindexed_foreign_keys(table)
+        )
+    return indexes
+
+
+def unique_keys(table: TableMeta) -> List[Tuple[str, ...]]:
+    """Column sets that can be a conflict target for upsert:
+    primary key, unique columns, UNIQUE (...) constraints and unique indexes.
+
+    Partial unique indexes (with WHERE) are skipped: the columns are unique
+    only for some rows, ON CONFLICT needs the predicate to use such index.
+    """
+    keys = []
+    if table.primary_key:
+        keys.append(tuple(table.primary_key))
+    keys.extend((column.name,) for column in table.columns if column.unique)
+    keys.extend(
+        tuple(constraint["columns"])
+        for constraint in getattr(table, "unique_constraints", None) or []
+    )
+    keys.extend(
+        tuple(index["columns"])
+        for index in table.indexes or []
+        if index["unique"] and index["columns"] and not index.get("where")
+    )
+    return list(dict.fromkeys(keys))
+
+
+create_index_head = re.compile(
+    r"CREATE\s+(?P<unique>UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?"
+    r"(?P<name>[\w\"`\[\].]+)\s+ON\s+(?:ONLY\s+)?(?P<table>[\w\"`\[\].]+)\s*"
+    r"(?:USING\s+(?P<using>\w+)\s*)?\(",
+    re.IGNORECASE,
+)
+index_column = re.compile(
+    r"^(?P<name>[\w\"`\[\]]+)\s*(?:\(\s*(?P<length>\d+)\s*\))?"
+    r"(?:\s+COLLATE\s+\S+)?(?:\s+(?P<opclass>(?!ASC\b|DESC\b|NULLS\b)\w+))?"
+    r"(?:\s+(?P<order>ASC|DESC))?(?:\s+NULLS\s+(?P<nulls>FIRST|LAST))?$",
+    re.IGNORECASE,
+)
+
+
+def _strip_quotes(name: str) -> str:
+    return name.strip('"`[]')
+
+
+def _closing_paren(text: str, start: int) -> int:
+    """Position of the parenthesis closing the one opened right before start."""
+    depth = 1
+    quote = None
+    for position in range(start, len(text)):
+        char = text[position]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if not depth:
+                return position
+    return -1
+
+
+def _split_top_level(text: str) -> List[str]:
+    parts, depth, current = [], 0, ""
+    for char in text:
+        if char == "," and not depth:
+            parts.append(current.strip())
+            current = ""
+            continue
+        depth += char == "("
+        depth -= char == ")"
+        current += char
+    parts.append(current.strip())
+    return [part for part in parts if part]
+
+
+def parse_index_statements(ddl: str) -> List[Dict]:
+    """CREATE INDEX statements with the details the DDL parser drops or mangles:
+    index method (USING), partial predicate (WHERE), covering columns (INCLUDE),
+    per-column ordering, NULLS placement, operator classes and prefix lengths.
+
+    Expression indexes are skipped - they can not be described by column names.
+    """
+    result = []
+    for match in create_index_head.finditer(ddl):
+        end = _closing_paren(ddl, match.end())
+        if end == -1:
+            continue
+        detailed_columns = []
+        for item in _split_top_level(ddl[match.end():end]):
+            column = index_column.match(item)
+            if not column:
+                break
+            detailed_columns.append(
+                {
+                    "name": _strip_quotes(column.group("name")),
+                    "order": (column.group("order") or "ASC").upper(),
+                    "nulls": (column.group("nulls") or "").upper() or None,
+                    "length": int(column.group("length")) if column.group("length") else None,
+                    "opclass": column.group("opclass"),
+                }
+            )
+        else:
+            tail = ddl[end + 1:].split(";", 1)[0]
+            include = re.search(r"^\s*INCLUDE\s*\(([^)]*)\)", tail, re.IGNORECASE)
+            where = re.search(r"\bWHERE\s+(.+)$", tail, re.IGNORECASE | re.DOTALL)
+            table = [_strip_quotes(part) for part in match.group("table").split(".")]
+            result.append(
+                {
+                    "index_name": _strip_quotes(match.group("name").split(".")[-1]),
+                    "table_name": table[-1],
+                    "schema": table[0] if len(table) > 1 else None,
+                    "unique": bool(match.group("unique")),
+                    "columns": [column["name"] for column in detailed_columns],
+                    "detailed_columns": detailed_columns,
+                    "using": match.group("using").lower() if match.group("using") else None,
+                    "include": [
+                        _strip_quotes(name.strip()) for name in include.group(1).split(",")
+                    ]
+                    if include
+                    else [],
+                    "where": " ".join(where.group(1).split()) if where else None,
+                }
+            )
+    return result
+
+
+def add_index_details(tables: List[Dict], ddl: str) -> List[Dict]:
+    """Replace parsed indexes of tables with details from CREATE INDEX statements
+    (adds indexes the parser dropped, for example, with USING or INCLUDE)."""
+    # (schema, table) -> [(position in DDL, statement)], statements without
+    # schema are applied to tables with the name in any schema
+    statements = {}
+    for position, statement in enumerate(parse_index_statements(ddl)):
+        key = (statement["schema"], statement["table_name"])
+        statements.setdefault(key, []).append((position, statement))
+    for table in tables:
+        indexes = []
+        for index in table.get("index") or []:
+            # parser reports NULLS LAST for every column & puts opclasses there
+            for column in index.get("detailed_columns") or []:
+                column["nulls"] = None
+            indexes.append(index)
+        table_statements = statements.get((None, table["table_name"]), [])
+        if table.get("schema"):
+            table_statements = sorted(
+                table_statements + statements.get((table["schema"], table["table_name"]), []),
+                key=lambda item: item[0],
+            )
+        for _, statement in table_statements:
+            index = {
+                key: value
+                for key, value in statement.items()
+                if key not in ("table_name", "schema")
+            }
+            indexes = [
+                item for item in indexes if item["index_name"] != index["index_name"]
+            ] + [index]
+        if indexes:
+            table["index"] = indexes
+    return tables
+
+
+def index_column_modifiers(index: Dict) -> Dict[str, List[str]]:
+    """desc / nulls_first / nulls_last modifiers of index columns."""
+    result = {}
+    for column in index.get("detailed_columns") or []:
+        modifiers = []
+        if column.get("order") == "DESC":
+            modifiers.append("desc")
+        if column.get("nulls"):
+            modifiers.append(f"nulls_{column['nulls'].lower()}")
+        if modifiers:
+            result[column["name"]] = modifiers
+    return result
+
+
+def index_column_expressions(
+    index: Dict, column: str = "{name}", functions: Optional[str] = None
+) -> List[str]:
+    """Index columns with ordering, for example: created_at.desc().nulls_last()
+
+    functions - prefix of SQLAlchemy functions to use them instead of column
+    methods (for column names as strings): sa.nulls_last(sa.desc('created_at'))
+    """
+    modifiers = index_column_modifiers(index)
+    expressions = []
+    for name in index["columns"]:
+        expression = column.format(name=name)
+        for modifier in modifiers.get(name, []):
+            if functions is None:
+                expression += f".{modifier}()"
+            else:
+                expression = f"{functions}{modifier}({expression})"
+        expressions.append(expression)
+    return expressions
+
+
+def index_options(index: Dict, text: str = "sa.text") -> str:
+    """Dialect kwargs of Index(): postgresql_using, postgresql_where,
+    postgresql_include, postgresql_ops and mysql_length."""
+    detailed_columns = index.get("detailed_columns") or []
+    ops = {column["name"]: column["opclass"] for column in detailed_columns if column.get("opclass")}
+    lengths = {column["name"]: column["length"] for column in detailed_columns if column.get("length")}
+    options = []
+    if index.get("using") and index["using"] != "btree":
+        options.append(f"postgresql_using='{index['using']}'")
+    if index.get("include"):
+        options.append(f"postgresql_include={index['include']!r}")
+    if index.get("where"):
+        options.append(f"postgresql_where={text}({index['where']!r})")
+    if ops:
+        options.append(f"postgresql_ops={ops!r}")
+    if lengths:
+        options.append(f"mysql_length={lengths!r}")
+    return "".join(f", {option}" for option in options)
@@ -1,8 +1,24 @@
-from typing import Dict, List
+import keyword
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from table_meta.model import Column
+from table_meta.model import Column, TableMeta
 
 import omymodels.types as t
+from omymodels.indexes import (
+    index_column_expressions,
+    index_column_modifiers,
+    index_options,
+)
+from omymodels.partitions import partition_by, partition_statements
+from omymodels.sequences import sequence_arguments, sequence_var_name, table_sequence
+from omymodels.storage import storage_kwargs
+
+# column types that can hold big values
+large_types = {
+    _type.lower()
+    for _type in (*t.text_types, *t.binary_types, *t.json_types)
+} | {"bytea", "mediumtext", "longtext"}
 
 
 def generate_column(
@@ -35,20 +51,16 @@ def setup_column_attributes(
     obj,
 ) -> str:
     # foreign is a positional - so it should be before keyword args
-    if "columns" in table_data.alter:
-        for alter_column in table_data.alter["columns"]:
-            if (
-                alter_column["name"] == column_data.name
-                and not alter_column["constraint_name"]
-                and alter_column["references"]
-            ):
-                column = add_reference_to_the_column(
-                    alter_column["name"],
-                    column,
-                    alter_column["references"],
-                    schema_global,
-                    templates,
-                )
+    for reference in alter_references(table_data, column_data.name):
+        column = add_reference_to_the_column(
+            column_data.name, column, reference, schema_global, templates
+        )
+    # generators without Sequence() templates (sqlmodel) keep nextval() defaults as is
+    sequence = hasattr(templates, "column_sequence") and table_sequence(
+        table_data, column_data.name
+    )
+    if sequence:
+        column += templates.column_sequence.format(var_name=sequence_var_name(sequence))
     # keyword named args
     if column_data.type.lower() == "serial" or column_data.type.lower() == "bigserial":
         column += templates.autoincrement
@@ -58,7 +70,9 @@ def setup_column_attributes(
         )
     if not column_data.nullable and column_data.name not in table_pk:
         column += templates.required
-    if column_data.default is not None:
+    if sequence:
+        column += templates.sequence_default.format(var_name=sequence_var_name(sequence))
+    elif column_data.default is not None:
         column = obj.prepare_column_default(column_data, column)
     if column_data.name in table_pk:
         column += templates.pk_template
@@ -68,6 +82,18 @@ def setup_column_attributes(
     return column
 
 
+def alter_references(table_data: TableMeta, column_name: str) -> List[Dict]:
+    """References of the column from ALTER TABLE ... ADD FOREIGN KEY statements
+    (named constraints are skipped)"""
+    return [
+        alter_column["references"]
+        for alter_column in (table_data.alter or {}).get("columns", [])
+        if alter_column["name"] == column_name
+        and not alter_column["constraint_name"]
+        and alter_column["references"]
+    ]
+
+
 def add_reference_to_the_column(
     column_name: str,
     column: str,
@@ -93,29 +119,193 @@ def add_reference_to_the_column(
     return column
 
 
-def add_table_args(obj, model: str, table: Dict, schema_global: bool = True) -> str:
-    statements = []
+def sequence_definitions(obj, templates, table: TableMeta) -> str:
+    """Sequence() objects used by columns of the table, each one is defined once
+    per module - before the first model that uses it."""
+    definitions = ""
+    for sequence in (getattr(table, "sequences", None) or {}).values():
+        var_name = sequence_var_name(sequence)
+        if var_name in obj.sequences:
+            continue
+        obj.sequences.add(var_name)
+        definitions += templates.sequence_template.format(
+            var_name=var_name, arguments=sequence_arguments(sequence)
+        )
+    return definitions
+
+
+def table_kwargs(table: TableMeta) -> Dict[str, str]:
+    """Dialect specific Table() arguments, for example: postgresql_partition_by"""
+    kwargs = {}
+    clause = partition_by(table)
+    if clause:
+        kwargs["postgresql_partition_by"] = f"'{clause}'"
+    kwargs.update(storage_kwargs(table))
+    return kwargs
+
+
+def partition_listeners(obj, templates, table_ref: str, table: TableMeta) -> str:
+    """after_create DDL listeners that create partitions of the table
+    (SQLAlchemy has no PARTITION OF support)"""
+    listeners = ""
+    for statement in partition_statements(table):
+        obj.partition_import = True
+        listeners += templates.partition_ddl.format(
+            # DDL() formats statements with %, escape it
+            table=table_ref, statement=repr(statement.replace("%", "%%"))
+        )
+    return listeners
+
+
+def index_statement(
+    obj, index: Dict, quote_columns: bool = False, separator: str = ","
+) -> str:
+    """Index() or UniqueConstraint() element of __table_args__"""
     t = obj.templates
-    if table.indexes:
-        for index in table.indexes:
-            if not index["unique"]:
-                obj.im_index = True
-                statements.append(
-                    t.index_template.format(
-                        columns=",".join(index["columns"]),
-                        name=f"'{index['index_name']}'",
-                    )
-                )
-            else:
-                obj.constraint = True
-                statements.append(
-                    t.unique_index_template.format(
-                        columns=",".join(index["columns"]),
-                        name=f"'{index['index_name']}'",
-                    )
-                )
+    options = index_options(index, text=f"{obj.prefix}text")
+    modifiers = index_column_modifiers(index)
+    if index["unique"] and not options and not modifiers:
+        obj.constraint = True
+        return t.unique_index_template.format(
+            columns=separator.join(
+                f"'{column}'" if quote_columns else column
+                for column in index["columns"]
+            ),
+            name=f"'{index['index_name']}'",
+        )
+    obj.im_index = True
+    index_imports = getattr(obj, "index_imports", None)
+    if index_imports is not None:
+        # generators without module prefix import desc(), text() & etc. by name
+        index_imports.update(name for names in modifiers.values() for name in names)
+        if index.get("where"):
+            index_imports.add("text")
+    if index["unique"]:
+        options = ", unique=True" + options
+    return t.index_template.format(
+        columns=separator.join(
+            index_column_expressions(index, "'{name}'", obj.prefix)
+            if quote_columns
+            else index_column_expressions(index)
+        ),
+        name=f"'{index['index_name']}'",
+        options=options,
+    )
+
+
+def add_table_args(
+    obj,
+    model: str,
+    table: Dict,
+    schema_global: bool = True,
+    indexes: Optional[List[Dict]] = None,
+    quote_columns: bool = False,
+    separator: str = ",",
+) -> str:
+    """indexes - to replace table.indexes, for example with added FK indexes
+    quote_columns - refer to columns by names, not by class attributes
+    (for models that inherit columns from a base model)
+    separator - to join columns of indexes"""
+    if indexes is None:
+        indexes = table.indexes
+    statements = [
+        index_statement(obj, index, quote_columns, separator) for index in indexes or []
+    ]
+    kwargs = [f"{name}={value}" for name, value in table_kwargs(table).items()]
     if not schema_global and table.table_schema:
-        statements.append(t.schema.format(schema_name=table.table_schema))
+        kwargs.insert(0, f'schema="{table.table_schema}"')
+    if kwargs:
+        statements.append(obj.templates.table_kwargs.format(kwargs=", ".join(kwargs)))
+    elif len(statements) == 1:
+        # one element tuple needs a trailing comma (dict alone is valid as is)
+        statements[0] += ","
     if statements:
-        model += t.table_args.format(statements=",".join(statements))
+        model += obj.templates.table_args.format(statements=",".join(statements))
     return model
+
+
+def is_large_column(column: Column) -> bool:
+    """TEXT, BLOB/BYTEA, JSON/JSONB and VARCHAR without size columns."""
+    if "[" in column.type:
+        return False
+    _type = column.type.lower()
+    if _type in large_types:
+        return True
+    return _type in t.string_types and not column.size
+
+
+def deferred_columns(
+    table: TableMeta,
+    defer_large_columns: bool = False,
+    deferred_overrides: Optional[Dict[str, List[str]]] = None,
+) -> List[str]:
+    """Names of columns to load on access instead of with the row.
+
+    deferred_overrides sets columns per table and replaces detection of large
+    columns for it: {"events": ["payload"]}, {"users": []} - defer nothing.
+    Primary & foreign key columns are never deferred.
+    """
+    if deferred_overrides and table.name in deferred_overrides:
+        return list(deferred_overrides[table.name])
+    if not defer_large_columns:
+        return []
+    return [
+        column.name
+        for column in table.columns
+        if is_large_column(column)
+        and column.name not in table.primary_key
+        and not column.references
+    ]
+
+
+# names used inside generated lookup helpers, column parameters get "_" suffix
+lookup_reserved_names = {
+    "conn",
+    "session",
+    "values",
+    "chunk_size",
+    "chunk",
+    "rows",
+    "result",
+    "select",
+    "bindparam",
+    "lambda_stmt",
+    "tuple_",
+}
+
+
+def lookup_arg_name(name: str, reserved: Iterable[str] = ()) -> str:
+    """Python parameter name for the column: valid identifier, not a keyword and
+    not a name used by the helper (conn, values, the table variable, ...)."""
+    arg = re.sub(r"\W", "_", name)
+    if arg[:1].isdigit():
+        arg = f"_{arg}"
+    while keyword.iskeyword(arg) or arg in lookup_reserved_names or arg in reserved:
+        arg += "_"
+    return arg
+
+
+def lookup_column(model: str, name: str) -> str:
+    """Model attribute of the column: Users.email, but Users.__table__.c["class"]
+    for names that can not be attributes."""
+    if name.isidentifier() and not keyword.iskeyword(name):
+        return f"{model}.{name}"
+    return f'{model}.__table__.c["{name}"]'
+
+
+def lookup_key_arguments(
+    key: Tuple[str, ...], columns: List[str], condition_template: str, table_var: str
+) -> Dict[str, str]:
+    """Parts of <table>_get_by_<key>() & <table>_get_many_by_<key>() helpers
+    for the unique key, columns - column expressions of the key."""
+    args = [lookup_arg_name(name, (table_var,)) for name in key]
+    return {
+        "key_name": "_and_".join(re.sub(r"\W", "_", name) for name in key),
+        "args": ", ".join(args),
+        "conditions": "\n".join(
+            condition_template.format(column=column, name=name)
+            for column, name in zip(columns, key)
+        ),
+        "params": ", ".join(f'"{name}": {arg}' for name, arg in zip(key, args)),
+        "in_column": columns[0] if len(key) == 1 else f"tuple_({', '.join(columns)})",
+    }
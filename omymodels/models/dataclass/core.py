@@ -1,10 +1,15 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from table_meta import TableMeta
 from table_meta.model import Column
 
 import omymodels.types as t
-from omymodels.helpers import create_class_name, datetime_now_check
+from omymodels.helpers import (
+    create_class_name,
+    datetime_now_check,
+    python_version,
+    tuple_literal,
+)
 from omymodels.models.dataclass import templates as dt
 from omymodels.models.dataclass.types import types_mapping
 from omymodels.types import datetime_types
@@ -18,6 +23,7 @@ class ModelGenerator:
         self.custom_types = {}
         self.uuid_import = False
         self.additional_imports = set()
+        self.slots_helper = False
         self.prefix = ""
 
     def add_custom_type(self, _type: str) -> str:
@@ -69,6 +75,63 @@ class ModelGenerator:
         column_str += dt.dataclass_default_attr.format(default=column.default)
         return column_str
 
+    def dataclass_decorator_options(
+        self,
+        slots: bool = False,
+        frozen: bool = False,
+        kw_only: bool = False,
+        target_python: Optional[str] = None,
+    ) -> Tuple[str, str]:
+        """Build dataclass() arguments & extra decorators for the class.
+
+        slots=True on Python < 3.10 targets falls back to _add_slots helper,
+        that recreates the class with explicit __slots__.
+        """
+        version = python_version(target_python)
+        options = []
+        decorators = ""
+        if frozen:
+            options.append("frozen=True")
+        if kw_only:
+            if version < (3, 10):
+                raise ValueError("kw_only dataclasses require target_python 3.10 or newer")
+            options.append("kw_only=True")
+        if slots:
+            if version < (3, 10):
+                self.slots_helper = True
+                self.additional_imports.add("fields")
+                decorators = dt.add_slots_decorator
+            else:
+                options.append("slots=True")
+        if options:
+            return f"({', '.join(options)})", decorators
+        return "", decorators
+
+    def row_constructors(
+        self, class_name: str, columns: List[str], fields: List[str], kw_only: bool
+    ) -> str:
+        """from_row() / from_rows() / row_factory() for rows with values in columns order.
+
+        Fields with defaults go after fields without, so values are reordered
+        to fields order; kw_only dataclasses get keyword arguments.
+        """
+        self.typing_imports.update(("Callable", "Iterable", "List", "Sequence"))
+        if fields == columns and not kw_only:
+            args = "*row"
+        else:
+            args = "".join(
+                dt.row_arg.format(
+                    name=f"{name}=" if kw_only else "", index=columns.index(name)
+                )
+                for name in fields
+            )
+            args = f"\n{args}        "
+        return dt.row_constructors.format(
+            class_name=class_name,
+            columns=tuple_literal([f'"{name}"' for name in columns]),
+            args=args,
+        )
+
     def generate_model(
         self,
         table: TableMeta,
@@ -76,33 +139,59 @@ class ModelGenerator:
         exceptions: Optional[List] = None,
         defaults_off: Optional[bool] = False,
         *args,
+        slots: bool = False,
+        frozen: bool = False,
+        kw_only: bool = False,
+        target_python: Optional[str] = None,
+        row_constructors: bool = False,
         **kwargs,
     ) -> str:
+        """Generate dataclass for the table.
+
+        row_constructors=True adds from_row(), from_rows() classmethods, that
+        create instances from cursor rows (values in columns order), and
+        psycopg compatible row_factory().
+        """
         model = ""
 
         # mean one model one table
         model += "\n\n"
         # generate class name
-        model += (
-            dt.dataclass_class.format(
-                class_name=create_class_name(table.name, singular, exceptions),
+        class_name = create_class_name(table.name, singular, exceptions)
+        options, decorators = self.dataclass_decorator_options(
+            slots, frozen, kw_only, target_python
+        )
+        if options or decorators:
+            class_str = dt.dataclass_class_with_options.format(
+                class_name=class_name, options=options, decorators=decorators
+            )
+        else:
+            class_str = dt.dataclass_class.format(
+                class_name=class_name,
                 table_name=table.name,
             )
-        ) + "\n\n"
+        model += class_str + "\n\n"
         columns = {"default": [], "non_default": []}
+        names = {"default": [], "non_default": []}
 
         # generate columns / attrs
         for column in table.columns:
             column = t.prepare_column_data(column)
             column_str = self.generate_attr(column, defaults_off) + "\n"
-            if "=" in column_str:
-                columns["default"].append(column_str)
-            else:
-                columns["non_default"].append(column_str)
+            group = "default" if "=" in column_str else "non_default"
+            columns[group].append(column_str)
+            names[group].append(column.name)
         for column in columns["non_default"]:
             model += column
         for column in columns["default"]:
             model += column
+        if row_constructors:
+            model += self.row_constructors(
+                class_name,
+                [column.name for column in table.columns],
+                names["non_default"] + names["default"],
+                kw_only,
+            )
         return model
 
     def create_header(self, *args, **kwargs) -> str:
@@ -116,10 +205,12 @@ class ModelGenerator:
             _imports.sort()
             header += dt.typing_imports.format(typing_types=", ".join(_imports)) + "\n"
         if self.additional_imports:
-            self.additional_imports = f', {",".join(self.additional_imports)}'
+            self.additional_imports = f', {",".join(sorted(self.additional_imports))}'
         else:
             self.additional_imports = ""
         header += dt.dataclass_imports.format(
             additional_imports=self.additional_imports
         )
+        if self.slots_helper:
+            header += dt.add_slots_helper
         return header
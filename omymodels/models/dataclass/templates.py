@@ -8,6 +8,25 @@ dataclass_imports = """from dataclasses import dataclass{additional_imports}"""
 
 dataclass_class = """@dataclass
 class {class_name}:"""
+dataclass_class_with_options = """{decorators}@dataclass{options}
+class {class_name}:"""
+add_slots_decorator = "@_add_slots\n"
+# dataclass(slots=True) is available only since Python 3.10
+add_slots_helper = """
+
+
+def _add_slots(cls):
+    \"\"\"Recreate dataclass with __slots__ (dataclass(slots=True) for Python < 3.10).\"\"\"
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slots_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slots_cls.__qualname__ = cls.__qualname__
+    return slots_cls"""
 dataclass_attr = """    {arg_name}: {type}"""
 dataclass_default_attr = """ = {default}"""
 
@@ -17,3 +36,26 @@ enum_import = "from enum import {enums}"
 
 uuid_import = "from uuid import UUID"
 field_datetime_now = "field(default_factory=datetime.datetime.now)"
+
+# positional row constructors, row values are in columns order
+row_arg = "            {name}row[{index}],\n"
+row_constructors = '''
+    __columns__ = {columns}
+
+    @classmethod
+    def from_row(cls, row: Sequence) -> "{class_name}":
+        return cls({args})
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> List["{class_name}"]:
+        from_row = cls.from_row
+        return [from_row(row) for row in rows]
+
+    @classmethod
+    def row_factory(cls, cursor) -> Callable[[Sequence], "{class_name}"]:
+        """psycopg row factory: connection.cursor(row_factory={class_name}.row_factory)"""
+        names = tuple(column.name for column in cursor.description)
+        if names == cls.__columns__:
+            return cls.from_row
+        return lambda values: cls(**dict(zip(names, values)))
+'''
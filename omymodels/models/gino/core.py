@@ -3,6 +3,7 @@ from typing import Dict, List, Optional
 import omymodels.models.gino.templates as gt
 from omymodels import logic
 from omymodels.helpers import create_class_name, datetime_now_check
+from omymodels.indexes import table_indexes
 from omymodels.models.gino.types import types_mapping
 from omymodels.types import datetime_types
 
@@ -13,6 +14,7 @@ class ModelGenerator:
         self.postgresql_dialect_cols = set()
         self.constraint = False
         self.im_index = False
+        self.sequences = set()
         self.custom_types = {}
         self.types_mapping = types_mapping
         self.templates = gt
@@ -42,6 +44,7 @@ class ModelGenerator:
         exceptions: Optional[List] = None,
         schema_global: Optional[bool] = True,
         *args,
+        fk_indexes: bool = False,
         **kwargs,
     ) -> str:
         """method to prepare one Model defention - name & tablename  & columns"""
@@ -54,10 +57,16 @@ class ModelGenerator:
             model += logic.generate_column(
                 column, table.primary_key, table, schema_global, gt, self
             )
-        if table.indexes or table.alter or table.checks or not schema_global:
-            model = logic.add_table_args(self, model, table, schema_global)
-        # create sequence
-        return model
+        indexes = table_indexes(table, fk_indexes)
+        if (
+            indexes
+            or table.alter
+            or table.checks
+            or not schema_global
+            or logic.table_kwargs(table)
+        ):
+            model = logic.add_table_args(self, model, table, schema_global, indexes)
+        return logic.sequence_definitions(self, gt, table) + model
 
     def create_header(
         self, tables: List[Dict], schema: bool = False, *args, **kwargs
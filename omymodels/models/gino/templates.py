@@ -39,13 +39,18 @@ unique_index_template = """
     UniqueConstraint({columns}, name={name})"""
 
 index_template = """
-    Index({name}, {columns})"""
+    Index({name}, {columns}{options})"""
 
-schema = """
-    dict(schema="{schema_name}")"""
+table_kwargs = """
+    dict({kwargs})"""
 
 enum_class = """class {class_name}({type}):"""
 enum_value = """    {name} = {value}"""
 
 on_delete = ', ondelete="{mode}"'
 on_update = ', onupdate="{mode}"'
+
+# sequences
+sequence_template = """\n\n{var_name} = db.Sequence({arguments})\n"""
+column_sequence = ", {var_name}"
+sequence_default = ", server_default={var_name}.next_value()"
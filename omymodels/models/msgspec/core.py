@@ -0,0 +1,170 @@
+from typing import List, Optional
+
+from table_meta import TableMeta
+from table_meta.model import Column
+
+import omymodels.types as t
+from omymodels.helpers import create_class_name, datetime_now_check
+from omymodels.models.msgspec import templates as mt
+from omymodels.models.msgspec.types import types_mapping
+from omymodels.types import datetime_types, string_types
+
+
+class ModelGenerator:
+    """msgspec.Struct generator.
+
+    Structs are validated on decode only, so nullable columns are always
+    typed as Optional[X]. VARCHAR sizes become Meta(max_length=...).
+    """
+
+    def __init__(self):
+        self.imports = {"Struct"}
+        self.datetime_import = False
+        self.typing_imports = set()
+        self.custom_types = {}
+        self.uuid_import = False
+        self.msgspec_import = False
+        self.prefix = ""
+
+    def add_custom_type(self, _type: str) -> str:
+        column_type = self.custom_types.get(_type, _type)
+        if isinstance(column_type, tuple):
+            _type = column_type[1]
+        return _type
+
+    def get_type(self, column: Column) -> str:
+        if "." in column.type:
+            _type = column.type.split(".")[1]
+        else:
+            _type = column.type.lower().split("[")[0]
+        if self.custom_types:
+            _type = self.add_custom_type(_type)
+        _type = types_mapping.get(_type, _type)
+        if "datetime" in _type:
+            self.datetime_import = True
+        elif _type.startswith("Union"):
+            self.typing_imports.add("Union")
+        elif _type == "UUID":
+            self.uuid_import = True
+        if column.size and column.type.lower().split("[")[0] in string_types:
+            self.imports.add("Meta")
+            self.typing_imports.add("Annotated")
+            _type = mt.annotated_type.format(
+                type=_type, constraints=f"max_length={column.size}"
+            )
+        if "[" in column.type:
+            _type = f"list[{_type}]"
+        return _type
+
+    def get_default(self, column: Column) -> Optional[str]:
+        default = column.default
+        if default is None:
+            return None
+        default = str(default)
+        if default.upper() == "NULL":
+            return "None"
+        if column.type.upper() in datetime_types:
+            if datetime_now_check(default.lower()):
+                self.msgspec_import = True
+                return mt.field_datetime_now
+            if "'" not in default:
+                return f"'{default}'"
+        return default
+
+    def generate_attr(self, column: Column, defaults_off: bool) -> str:
+        _type = self.get_type(column)
+        if column.nullable:
+            self.typing_imports.add("Optional")
+            _type = mt.optional_type.format(type=_type)
+        column_str = mt.struct_attr.format(arg_name=column.name, type=_type)
+        if defaults_off:
+            return column_str
+        default = self.get_default(column)
+        if default is None and column.nullable:
+            default = "None"
+        if default is not None:
+            column_str += mt.struct_default_attr.format(default=default)
+        return column_str
+
+    @staticmethod
+    def struct_options(
+        array_like: bool = False,
+        frozen: bool = False,
+        gc: bool = True,
+        omit_defaults: bool = False,
+        kw_only: bool = False,
+    ) -> str:
+        options = []
+        if frozen:
+            options.append("frozen=True")
+        if array_like:
+            options.append("array_like=True")
+        if not gc:
+            options.append("gc=False")
+        if omit_defaults:
+            options.append("omit_defaults=True")
+        if kw_only:
+            options.append("kw_only=True")
+        return "".join(f", {option}" for option in options)
+
+    def generate_model(
+        self,
+        table: TableMeta,
+        singular: bool = True,
+        exceptions: Optional[List] = None,
+        defaults_off: Optional[bool] = False,
+        *args,
+        array_like: bool = False,
+        frozen: bool = False,
+        gc: bool = True,
+        omit_defaults: bool = False,
+        kw_only: bool = False,
+        **kwargs,
+    ) -> str:
+        """Generate msgspec.Struct for the table.
+
+        array_like=True encodes structs as arrays (field order) instead of objects,
+        gc=False excludes instances from garbage collector tracking - use it only
+        if structs never take part in reference cycles.
+        Fields with defaults go after required ones, kw_only=True keeps the
+        order of columns from DDL.
+        """
+        model = "\n\n"
+        model += (
+            mt.struct_class.format(
+                class_name=create_class_name(table.name, singular, exceptions),
+                options=self.struct_options(
+                    array_like, frozen, gc, omit_defaults, kw_only
+                ),
+            )
+            + "\n\n"
+        )
+        columns = {"default": [], "non_default": []}
+        for column in table.columns:
+            column = t.prepare_column_data(column)
+            column_str = self.generate_attr(column, defaults_off) + "\n"
+            if " = " in column_str and not kw_only:
+                columns["default"].append(column_str)
+            else:
+                columns["non_default"].append(column_str)
+        for column in columns["non_default"] + columns["default"]:
+            model += column
+        return model
+
+    def create_header(self, *args, **kwargs) -> str:
+        header = ""
+        if self.uuid_import:
+            header += mt.uuid_import + "\n"
+        if self.datetime_import:
+            header += mt.datetime_import + "\n"
+        if self.typing_imports:
+            header += (
+                mt.typing_imports.format(
+                    typing_types=", ".join(sorted(self.typing_imports))
+                )
+                + "\n"
+            )
+        if self.msgspec_import:
+            header += mt.msgspec_import + "\n"
+        header += mt.msgspec_imports.format(imports=", ".join(sorted(self.imports)))
+        return header
@@ -0,0 +1,15 @@
+datetime_import = """import datetime"""
+typing_imports = """from typing import {typing_types}"""
+uuid_import = """from uuid import UUID"""
+
+msgspec_import = """import msgspec"""
+msgspec_imports = """from msgspec import {imports}"""
+
+struct_class = """class {class_name}(Struct{options}):"""
+struct_attr = """    {arg_name}: {type}"""
+struct_default_attr = """ = {default}"""
+optional_type = """Optional[{type}]"""
+# msgspec checks constraints from Meta on decode
+annotated_type = """Annotated[{type}, Meta({constraints})]"""
+
+field_datetime_now = "msgspec.field(default_factory=datetime.datetime.now)"
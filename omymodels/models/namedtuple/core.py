@@ -0,0 +1,81 @@
+from typing import List, Optional
+
+from table_meta import TableMeta
+from table_meta.model import Column
+
+import omymodels.types as t
+from omymodels.generation import DataModelGenerator
+from omymodels.helpers import create_class_name, datetime_now_check
+from omymodels.models.dataclass.types import types_mapping
+from omymodels.models.namedtuple import templates as nt
+from omymodels.types import datetime_types
+
+
+class ModelGenerator(DataModelGenerator):
+    """typing.NamedTuple generator for read-only rows.
+
+    Fields keep the order of columns, so a model can be created directly
+    from a DB cursor row: `Users(*row)` or `Users._make(row)`.
+    Defaults are added only to trailing columns, that have a default
+    value (NULL for nullable columns), to not change the order.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.types_for_import = ["Union[dict, list]"]
+
+    def get_type(self, column: Column) -> str:
+        _type = self.get_python_type(column, types_mapping)
+        if column.nullable:
+            self.typing_imports.add("Optional")
+            _type = nt.optional_type.format(type=_type)
+        return _type
+
+    def get_default(self, column: Column) -> Optional[str]:
+        if column.default is None:
+            return "None" if column.nullable else None
+        if column.type.upper() in datetime_types and datetime_now_check(
+            str(column.default).lower()
+        ):
+            # NamedTuple has no default factories
+            return None
+        return self.format_default_value(column, "")
+
+    def generate_model(
+        self,
+        table: TableMeta,
+        singular: bool = True,
+        exceptions: Optional[List] = None,
+        defaults_off: Optional[bool] = False,
+        *args,
+        **kwargs,
+    ) -> str:
+        model = "\n\n"
+        model += (
+            nt.namedtuple_class.format(
+                class_name=create_class_name(table.name, singular, exceptions)
+            )
+            + "\n\n"
+        )
+        columns = [t.prepare_column_data(column) for column in table.columns]
+        defaults = [None] * len(columns)
+        if not defaults_off:
+            # only a tail of fields can have defaults
+            for num in range(len(columns) - 1, -1, -1):
+                defaults[num] = self.get_default(columns[num])
+                if defaults[num] is None:
+                    break
+        for column, default in zip(columns, defaults):
+            model += nt.namedtuple_attr.format(
+                arg_name=column.name, type=self.get_type(column)
+            )
+            if default is not None:
+                model += nt.namedtuple_default_attr.format(default=default)
+            model += "\n"
+        return model
+
+    def create_header(self, *args, **kwargs) -> str:
+        self.typing_imports.add("NamedTuple")
+        return self.build_header_imports(
+            nt.uuid_import, nt.datetime_import, nt.typing_imports
+        )
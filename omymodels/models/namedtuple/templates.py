@@ -0,0 +1,8 @@
+datetime_import = """import datetime"""
+typing_imports = """from typing import {typing_types}"""
+uuid_import = """from uuid import UUID"""
+
+namedtuple_class = """class {class_name}(NamedTuple):"""
+namedtuple_attr = """    {arg_name}: {type}"""
+namedtuple_default_attr = """ = {default}"""
+optional_type = """Optional[{type}]"""
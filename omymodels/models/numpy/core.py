@@ -0,0 +1,93 @@
+from typing import List, Optional, Set
+
+from table_meta.model import Column, TableMeta
+
+from omymodels.generation import ColumnarGenerator
+from omymodels.models.numpy import templates as npt
+from omymodels.models.numpy.types import (
+    char_types,
+    fixed_char_types,
+    null_mask_suffix,
+    types_mapping,
+)
+
+
+def enum_code_type(values_count: int) -> str:
+    for dtype, bits in (("i1", 8), ("<i2", 16)):
+        if values_count < 2 ** (bits - 1):
+            return dtype
+    return "<i4"
+
+
+class ModelGenerator(ColumnarGenerator):
+    """NumPy structured dtype for each table: <table>_dtype, with
+    load_<table>(path) & save_<table>(path, records) helpers on np.memmap.
+
+    Only fixed width columns are stored: TEXT, JSON, binary, arrays and
+    VARCHAR without size are skipped. Enums are integer codes - indexes of
+    values in the generated enum class, nullable columns get a bool
+    <column>_is_null mask field.
+    """
+
+    def get_dtype(self, column: Column, char_type: str) -> Optional[str]:
+        """dtype of the column or None for columns without fixed width."""
+        if self.is_array(column):
+            return None
+        kind = self.column_kind(column)
+        if kind == "enum":
+            return enum_code_type(len(self.column_enum_values(column)))
+        if kind == "string":
+            size = column.size
+            if not size and self.sql_type(column) in fixed_char_types:
+                size = 1
+            if not isinstance(size, int) or not size:
+                return None
+            return char_types[char_type].format(size=size)
+        return types_mapping.get(kind)
+
+    @staticmethod
+    def null_mask_name(column: Column, names: Set[str]) -> str:
+        name = column.name + null_mask_suffix
+        while name in names:
+            name += "_"
+        names.add(name)
+        return name
+
+    def generate_model(
+        self,
+        table: TableMeta,
+        singular: bool = True,
+        exceptions: Optional[List] = None,
+        *args,
+        char_type: str = "U",
+        **kwargs,
+    ) -> str:
+        """char_type - "U" (unicode, 4 bytes per char) or "S" (bytes)
+        for CHAR(n) & VARCHAR(n) columns."""
+        if char_type not in char_types:
+            raise ValueError(
+                f"Unsupported char_type {char_type!r}, use one of {list(char_types)}"
+            )
+        names = {column.name for column in table.columns}
+        fields = ""
+        for column in table.columns:
+            dtype = self.get_dtype(column, char_type)
+            if dtype is None:
+                fields += npt.skipped_template.format(name=column.name, type=column.type)
+                continue
+            enum = self.column_enum(column)
+            fields += npt.field_template.format(
+                name=column.name,
+                dtype=dtype,
+                comment=npt.enum_comment.format(enum=enum) if enum else "",
+            )
+            if column.nullable and column.name not in table.primary_key:
+                fields += npt.field_template.format(
+                    name=self.null_mask_name(column, names), dtype="?", comment=""
+                )
+        return npt.dtype_template.format(
+            table_var=self.table_var_name(table), fields=fields
+        )
+
+    def create_header(self, *args, **kwargs) -> str:
+        return "\n".join((npt.os_import, npt.numpy_import)) + npt.memmap_helpers
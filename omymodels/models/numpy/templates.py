@@ -0,0 +1,43 @@
+numpy_import = "import numpy as np"
+os_import = "import os"
+
+memmap_helpers = '''
+
+
+def _load_records(path: str, dtype: np.dtype, mode: str = "r") -> np.ndarray:
+    """Records of the file as a structured array backed by np.memmap:
+    no copy, pages are read on access. mode="r+" updates records in place."""
+    if not os.path.getsize(path):
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode)
+
+
+def _save_records(path: str, records, dtype: np.dtype) -> np.ndarray:
+    """Write records (structured array or sequence of tuples) to the file,
+    returns np.memmap of the written file."""
+    records = np.asarray(records, dtype=dtype)
+    if not records.size:
+        open(path, "wb").close()
+        return records
+    mapped = np.memmap(path, dtype=dtype, mode="w+", shape=records.shape)
+    mapped[:] = records
+    mapped.flush()
+    return mapped'''
+
+dtype_template = """\n
+{table_var}_dtype = np.dtype(
+    [
+{fields}    ]
+)
+
+
+def load_{table_var}(path: str, mode: str = "r") -> np.ndarray:
+    return _load_records(path, {table_var}_dtype, mode)
+
+
+def save_{table_var}(path: str, records) -> np.ndarray:
+    return _save_records(path, records, {table_var}_dtype)
+"""
+field_template = """        ("{name}", "{dtype}"),{comment}\n"""
+enum_comment = "  # index in list({enum})"
+skipped_template = """        # {name} ({type}) is skipped: not fixed width\n"""
@@ -0,0 +1,25 @@
+# NumPy dtypes by column kind (omymodels.generation.columnar_base),
+# explicit byte order so files are portable between machines
+types_mapping = {
+    "int8": "i1",
+    "int16": "<i2",
+    "int32": "<i4",
+    "int64": "<i8",
+    "float32": "<f4",
+    "float64": "<f8",
+    # NUMERIC has no fixed width type in NumPy
+    "decimal": "<f8",
+    "bool": "?",
+    "uuid": "V16",
+    "date": "<M8[D]",
+    "timestamp": "<M8[us]",
+    # stored in UTC
+    "timestamptz": "<M8[us]",
+    # time of day as offset from midnight
+    "time": "<m8[us]",
+    "interval": "<m8[us]",
+}
+# CHAR without size is CHAR(1)
+fixed_char_types = ("char", "character")
+char_types = {"U": "<U{size}", "S": "S{size}"}
+null_mask_suffix = "_is_null"
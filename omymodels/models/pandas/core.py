@@ -0,0 +1,75 @@
+from typing import List, Optional
+
+from table_meta.model import Column, TableMeta
+
+from omymodels.generation import ColumnarGenerator
+from omymodels.models.pandas import templates as pdt
+from omymodels.models.pandas.types import date_kinds, dtype_backends, types_mapping
+from omymodels.models.pyarrow import core as pyarrow_core
+
+
+class ModelGenerator(ColumnarGenerator):
+    """pandas dtype & parse_dates maps for each table, for read_sql & read_csv:
+
+        pd.read_sql(query, conn, dtype=users_dtypes, parse_dates=users_parse_dates)
+
+    NOT NULL integers are numpy dtypes, nullable ones - nullable extension
+    dtypes (Int32, boolean), strings are "string", enums are CategoricalDtype.
+    DATE & TIMESTAMP columns go to <table>_parse_dates.
+    """
+
+    enum_classes = False
+
+    def __init__(self):
+        super().__init__()
+        self.pyarrow_import = False
+
+    def get_dtype(self, column: Column, nullable: bool, dtype_backend: str) -> str:
+        kind = self.column_kind(column)
+        if kind == "enum" and not self.is_array(column):
+            return pdt.categorical_dtype.format(values=self.column_enum_values(column))
+        if dtype_backend == "pyarrow":
+            self.pyarrow_import = True
+            arrow = pyarrow_core.ModelGenerator()
+            arrow.custom_types, arrow.enum_values = self.custom_types, self.enum_values
+            return pdt.arrow_dtype.format(type=arrow.get_type(column))
+        if self.is_array(column):
+            return '"object"'
+        return '"{}"'.format(types_mapping[kind][nullable])
+
+    def generate_model(
+        self,
+        table: TableMeta,
+        singular: bool = True,
+        exceptions: Optional[List] = None,
+        *args,
+        dtype_backend: str = "numpy_nullable",
+        **kwargs,
+    ) -> str:
+        """dtype_backend="pyarrow" emits pd.ArrowDtype(...) dtypes, NUMERIC keeps
+        precision as decimal128 (needs pyarrow installed)."""
+        if dtype_backend not in dtype_backends:
+            raise ValueError(
+                f"Unsupported dtype_backend {dtype_backend!r}, use one of {list(dtype_backends)}"
+            )
+        dtypes = ""
+        parse_dates = []
+        for column in table.columns:
+            if self.column_kind(column) in date_kinds and not self.is_array(column):
+                parse_dates.append(column.name)
+                continue
+            nullable = column.nullable and column.name not in table.primary_key
+            dtypes += pdt.dtype_template.format(
+                name=column.name, dtype=self.get_dtype(column, nullable, dtype_backend)
+            )
+        return pdt.dtypes_template.format(
+            table_var=self.table_var_name(table),
+            dtypes=dtypes,
+            parse_dates=parse_dates,
+        )
+
+    def create_header(self, *args, **kwargs) -> str:
+        header = pdt.pandas_import
+        if self.pyarrow_import:
+            header += "\n" + pdt.pyarrow_import
+        return header
@@ -0,0 +1,12 @@
+pandas_import = "import pandas as pd"
+pyarrow_import = "import pyarrow as pa"
+
+dtypes_template = """\n
+{table_var}_dtypes = {{
+{dtypes}}}
+{table_var}_parse_dates = {parse_dates}
+"""
+dtype_template = """    "{name}": {dtype},\n"""
+
+categorical_dtype = "pd.CategoricalDtype({values})"
+arrow_dtype = "pd.ArrowDtype({type})"
@@ -0,0 +1,23 @@
+# pandas dtypes by column kind (omymodels.generation.columnar_base):
+# (NOT NULL column dtype, nullable column dtype)
+types_mapping = {
+    "int8": ("int8", "Int8"),
+    "int16": ("int16", "Int16"),
+    "int32": ("int32", "Int32"),
+    "int64": ("int64", "Int64"),
+    "float32": ("float32", "Float32"),
+    "float64": ("float64", "Float64"),
+    "bool": ("bool", "boolean"),
+    "string": ("string", "string"),
+    "text": ("string", "string"),
+    "uuid": ("string", "string"),
+    # Decimal objects from DB drivers keep precision
+    "decimal": ("object", "object"),
+    "json": ("object", "object"),
+    "binary": ("object", "object"),
+    "time": ("object", "object"),
+    "interval": ("object", "object"),
+}
+# kinds that are read with parse_dates, not dtype
+date_kinds = ("date", "timestamp", "timestamptz")
+dtype_backends = ("numpy_nullable", "pyarrow")
@@ -0,0 +1,57 @@
+from typing import List, Optional
+
+from table_meta.model import Column, TableMeta
+
+from omymodels.generation import ColumnarGenerator
+from omymodels.models.polars import templates as plt
+from omymodels.models.polars.types import decimal_max_precision, types_mapping
+
+
+class ModelGenerator(ColumnarGenerator):
+    """Polars schema for each table: <table>_schema = pl.Schema({...}).
+
+    Enums are pl.Enum with values of the enum type, NUMERIC keeps precision
+    and scale as pl.Decimal (pl.String for precision over 38), arrays are pl.List.
+    """
+
+    enum_classes = False
+
+    def get_type(self, column: Column) -> str:
+        kind = self.column_kind(column)
+        if kind == "enum":
+            _type = plt.enum_type.format(values=self.column_enum_values(column))
+        elif kind == "decimal":
+            precision, scale = self.decimal_size(column)
+            if precision <= decimal_max_precision:
+                _type = plt.decimal_type.format(precision=precision, scale=scale)
+            else:
+                _type = types_mapping["string"]
+        else:
+            _type = types_mapping[kind]
+        if self.is_array(column):
+            _type = plt.list_type.format(type=_type)
+        return _type
+
+    def generate_model(
+        self,
+        table: TableMeta,
+        singular: bool = True,
+        exceptions: Optional[List] = None,
+        *args,
+        as_dict: bool = False,
+        **kwargs,
+    ) -> str:
+        """as_dict=True emits a plain {column: dtype} dict instead of pl.Schema
+        (schema_overrides / dtypes arguments, Polars before 1.0)."""
+        indent = "    " if as_dict else "        "
+        fields = "".join(
+            plt.field_template.format(
+                indent=indent, name=column.name, type=self.get_type(column)
+            )
+            for column in table.columns
+        )
+        template = plt.dict_template if as_dict else plt.schema_template
+        return template.format(table_var=self.table_var_name(table), fields=fields)
+
+    def create_header(self, *args, **kwargs) -> str:
+        return plt.polars_import
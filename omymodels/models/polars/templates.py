@@ -0,0 +1,17 @@
+polars_import = "import polars as pl"
+
+schema_template = """\n
+{table_var}_schema = pl.Schema(
+    {{
+{fields}    }}
+)
+"""
+dict_template = """\n
+{table_var}_schema = {{
+{fields}}}
+"""
+field_template = """{indent}"{name}": {type},\n"""
+
+decimal_type = "pl.Decimal({precision}, {scale})"
+list_type = "pl.List({type})"
+enum_type = "pl.Enum({values})"
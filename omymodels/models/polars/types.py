@@ -0,0 +1,22 @@
+# Polars data types by column kind (omymodels.generation.columnar_base)
+types_mapping = {
+    "int8": "pl.Int8",
+    "int16": "pl.Int16",
+    "int32": "pl.Int32",
+    "int64": "pl.Int64",
+    "float32": "pl.Float32",
+    "float64": "pl.Float64",
+    "bool": "pl.Boolean",
+    "string": "pl.String",
+    "text": "pl.String",
+    "json": "pl.String",
+    "uuid": "pl.String",
+    "binary": "pl.Binary",
+    "date": "pl.Date",
+    "timestamp": 'pl.Datetime("us")',
+    "timestamptz": 'pl.Datetime("us", "UTC")',
+    "time": "pl.Time",
+    "interval": 'pl.Duration("us")',
+}
+# max precision of pl.Decimal (128 bit), bigger decimals are kept as strings
+decimal_max_precision = 38
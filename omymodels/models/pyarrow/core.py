@@ -0,0 +1,67 @@
+from typing import List, Optional
+
+from table_meta.model import Column, TableMeta
+
+from omymodels.generation import ColumnarGenerator
+from omymodels.models.pyarrow import templates as pt
+from omymodels.models.pyarrow.types import decimal128_max_precision, types_mapping
+
+
+def dictionary_index_type(values_count: int) -> str:
+    for bits in (8, 16, 32):
+        if values_count < 2 ** (bits - 1):
+            return f"pa.int{bits}()"
+    return "pa.int64()"
+
+
+class ModelGenerator(ColumnarGenerator):
+    """pyarrow.schema() for each table: <table>_schema.
+
+    VARCHAR is string, TEXT & JSON are large_string, NUMERIC keeps precision
+    and scale as decimal128 (decimal256 for precision over 38), enums are
+    dictionary types, NOT NULL columns are nullable=False fields.
+    """
+
+    enum_classes = False
+
+    def get_type(self, column: Column) -> str:
+        kind = self.column_kind(column)
+        if kind == "enum":
+            _type = pt.dictionary_type.format(
+                index_type=dictionary_index_type(len(self.column_enum_values(column)))
+            )
+        elif kind == "decimal":
+            precision, scale = self.decimal_size(column)
+            _type = pt.decimal_type.format(
+                decimal="decimal128" if precision <= decimal128_max_precision else "decimal256",
+                precision=precision,
+                scale=scale,
+            )
+        else:
+            _type = types_mapping[kind]
+        if self.is_array(column):
+            _type = pt.list_type.format(type=_type)
+        return _type
+
+    def generate_model(
+        self,
+        table: TableMeta,
+        singular: bool = True,
+        exceptions: Optional[List] = None,
+        *args,
+        **kwargs,
+    ) -> str:
+        fields = ""
+        for column in table.columns:
+            nullable = column.nullable and column.name not in table.primary_key
+            fields += pt.field_template.format(
+                name=column.name,
+                type=self.get_type(column),
+                options="" if nullable else pt.not_null,
+            )
+        return pt.schema_template.format(
+            table_var=self.table_var_name(table), fields=fields
+        )
+
+    def create_header(self, *args, **kwargs) -> str:
+        return pt.pyarrow_import
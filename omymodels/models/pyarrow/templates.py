@@ -0,0 +1,15 @@
+pyarrow_import = "import pyarrow as pa"
+
+schema_template = """\n
+{table_var}_schema = pa.schema(
+    [
+{fields}    ]
+)
+"""
+field_template = """        pa.field("{name}", {type}{options}),\n"""
+not_null = ", nullable=False"
+
+decimal_type = "pa.{decimal}({precision}, {scale})"
+list_type = "pa.list_({type})"
+# dictionary indices are the smallest integer type that fits all values
+dictionary_type = "pa.dictionary({index_type}, pa.string())"
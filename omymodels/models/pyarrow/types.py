@@ -0,0 +1,23 @@
+# pyarrow types by column kind (omymodels.generation.columnar_base)
+types_mapping = {
+    "int8": "pa.int8()",
+    "int16": "pa.int16()",
+    "int32": "pa.int32()",
+    "int64": "pa.int64()",
+    "float32": "pa.float32()",
+    "float64": "pa.float64()",
+    "bool": "pa.bool_()",
+    # VARCHAR(n) values are short - 32-bit offsets are enough
+    "string": "pa.string()",
+    "text": "pa.large_string()",
+    "json": "pa.large_string()",
+    "uuid": "pa.string()",
+    "binary": "pa.large_binary()",
+    "date": "pa.date32()",
+    "timestamp": 'pa.timestamp("us")',
+    "timestamptz": 'pa.timestamp("us", tz="UTC")',
+    "time": 'pa.time64("us")',
+    "interval": "pa.month_day_nano_interval()",
+}
+# max precision of decimal128, bigger decimals are decimal256
+decimal128_max_precision = 38
@@ -5,7 +5,7 @@ from typing import List, Optional
 from table_meta.model import Column, TableMeta
 
 import omymodels.types as t
-from omymodels.helpers import create_class_name, datetime_now_check
+from omymodels.helpers import create_class_name, datetime_now_check, tuple_literal
 from omymodels.models.pydantic import templates as pt
 from omymodels.models.pydantic.types import types_mapping
 from omymodels.types import big_integer_types, integer_types, string_types, text_types
@@ -253,6 +253,39 @@ class ModelGenerator:
         except ValueError:
             return time_str
 
+    def row_constructors(
+        self, class_name: str, columns: List[str], trusted_rows: bool
+    ) -> str:
+        """from_row() / from_rows() / row_factory() for rows with values in columns order."""
+        self.typing_imports.update(("Callable", "Iterable", "List", "Sequence"))
+        if trusted_rows:
+            # construct() accepts field names, columns can be aliased
+            method, by_names = "construct", "**dict(zip(names, values))"
+            values = "".join(
+                pt.row_field.format(
+                    name=name
+                    if self._is_valid_identifier(name)
+                    else self._generate_valid_identifier(name),
+                    index=index,
+                )
+                for index, name in enumerate(columns)
+            )
+            values = f"\n{values}        "
+        else:
+            method, by_names = "parse_obj", "dict(zip(names, values))"
+            values = "".join(
+                pt.row_key.format(name=name, index=index)
+                for index, name in enumerate(columns)
+            )
+            values = f"\n            {{\n{values}            }}\n        "
+        return pt.row_constructors.format(
+            class_name=class_name,
+            columns=tuple_literal([f'"{name}"' for name in columns]),
+            method=method,
+            values=values,
+            by_names=by_names,
+        )
+
     def generate_model(
         self,
         table: TableMeta,
@@ -260,8 +293,17 @@ class ModelGenerator:
         exceptions: Optional[List] = None,
         defaults_off: Optional[bool] = False,
         *args,
+        row_constructors: bool = False,
+        trusted_rows: bool = False,
         **kwargs,
     ) -> str:
+        """Generate Pydantic model for the table.
+
+        row_constructors=True adds from_row(), from_rows() classmethods, that
+        create models from cursor rows (values in columns order), and psycopg
+        compatible row_factory(). They validate rows with parse_obj(),
+        trusted_rows=True uses construct() - without validation.
+        """
         model = ""
         model += "\n\n"
 
@@ -284,6 +326,10 @@ class ModelGenerator:
             column = t.prepare_column_data(column)
             model += self.generate_attr(column, defaults_off) + "\n"
 
+        if row_constructors:
+            model += self.row_constructors(
+                class_name, [column.name for column in table.columns], trusted_rows
+            )
         return model
 
     def create_header(self, *args, **kwargs) -> str:
@@ -18,3 +18,28 @@ enum_value = """    {name} = {value}"""
 enum_import = "from enum import {enums}"
 
 uuid_import = "from uuid import UUID"
+
+# positional row constructors, row values are in columns order:
+# parse_obj - checked path, construct - trusted rows, no validation
+row_field = "            {name}=row[{index}],\n"
+row_key = '                "{name}": row[{index}],\n'
+row_constructors = '''
+    __columns__ = {columns}
+
+    @classmethod
+    def from_row(cls, row: Sequence) -> "{class_name}":
+        return cls.{method}({values})
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> List["{class_name}"]:
+        from_row = cls.from_row
+        return [from_row(row) for row in rows]
+
+    @classmethod
+    def row_factory(cls, cursor) -> Callable[[Sequence], "{class_name}"]:
+        """psycopg row factory: connection.cursor(row_factory={class_name}.row_factory)"""
+        names = tuple(column.name for column in cursor.description)
+        if names == cls.__columns__:
+            return cls.from_row
+        return lambda values: cls.{method}({by_names})
+'''
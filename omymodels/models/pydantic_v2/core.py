@@ -1,9 +1,9 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 from table_meta.model import Column, TableMeta
 
 import omymodels.types as t
-from omymodels.helpers import create_class_name, datetime_now_check
+from omymodels.helpers import create_class_name, datetime_now_check, tuple_literal
 from omymodels.models.pydantic_v2 import templates as pt
 from omymodels.models.pydantic_v2.types import types_mapping
 from omymodels.types import datetime_types, string_types
@@ -11,6 +11,16 @@ from omymodels.types import datetime_types, string_types
 # Types that support max_length constraint
 MAX_LENGTH_TYPES = string_types
 
+# ConfigDict options that can be set with generator options
+config_options = (
+    "defer_build",
+    "frozen",
+    "strict",
+    "revalidate_instances",
+    "cache_strings",
+    "from_attributes",
+)
+
 
 class ModelGenerator:
     """Pydantic v2 model generator.
@@ -27,6 +37,7 @@ class ModelGenerator:
         self.typing_imports = set()
         self.custom_types = {}
         self.uuid_import = False
+        self.bulk_helpers = False
         self.prefix = ""
 
     def add_custom_type(self, target_type: str) -> Optional[str]:
@@ -133,6 +144,55 @@ class ModelGenerator:
         column_str += pt.pydantic_default_attr.format(default=column.default)
         return column_str
 
+    def model_config(
+        self, table_name: str, config: Dict, config_overrides: Optional[Dict]
+    ) -> str:
+        """model_config line for the table, empty if there are no options."""
+        options = dict(config)
+        options.update((config_overrides or {}).get(table_name, {}))
+        options = {name: value for name, value in options.items() if value is not None}
+        unknown = sorted(set(options) - set(config_options))
+        if unknown:
+            raise ValueError(
+                f"Unsupported model_config options {unknown} for table {table_name!r}. "
+                f"Supported: {list(config_options)}"
+            )
+        if not options:
+            return ""
+        self.imports.add("ConfigDict")
+        return pt.model_config.format(
+            options=", ".join(
+                f"{name}={options[name]!r}" for name in config_options if name in options
+            )
+        )
+
+    def row_constructors(
+        self, class_name: str, columns: List[str], trusted_rows: bool
+    ) -> str:
+        """from_row() / from_rows() / row_factory() for rows with values in columns order."""
+        self.typing_imports.update(("Callable", "Iterable", "Sequence"))
+        if trusted_rows:
+            method, by_names = "model_construct", "**dict(zip(names, values))"
+            values = "".join(
+                pt.row_field.format(name=name, index=index)
+                for index, name in enumerate(columns)
+            )
+            values = f"\n{values}        "
+        else:
+            method, by_names = "model_validate", "dict(zip(names, values))"
+            values = "".join(
+                pt.row_key.format(name=name, index=index)
+                for index, name in enumerate(columns)
+            )
+            values = f"\n            {{\n{values}            }}\n        "
+        return pt.row_constructors.format(
+            class_name=class_name,
+            columns=tuple_literal([f'"{name}"' for name in columns]),
+            method=method,
+            values=values,
+            by_names=by_names,
+        )
+
     def generate_model(
         self,
         table: TableMeta,
@@ -140,22 +200,70 @@ class ModelGenerator:
         exceptions: Optional[List] = None,
         defaults_off: Optional[bool] = False,
         *args,
+        defer_build: Optional[bool] = None,
+        frozen: Optional[bool] = None,
+        strict: Optional[bool] = None,
+        revalidate_instances: Optional[str] = None,
+        cache_strings: Optional[Union[bool, str]] = None,
+        from_attributes: Optional[bool] = None,
+        config_overrides: Optional[Dict[str, Dict]] = None,
+        bulk_helpers: bool = False,
+        row_constructors: bool = False,
+        trusted_rows: bool = False,
         **kwargs,
     ) -> str:
+        """Generate Pydantic v2 model for the table.
+
+        defer_build, frozen, strict, revalidate_instances, cache_strings and
+        from_attributes are added to model_config = ConfigDict(...) for all
+        models, config_overrides changes them per table:
+        {"users": {"frozen": True}}. Options left as None are not emitted.
+        bulk_helpers=True adds validate_many(), validate_many_json() and
+        dump_many() classmethods, that use one TypeAdapter(list[Model]) per
+        model, created on first call and cached on module level.
+        row_constructors=True adds from_row(), from_rows() classmethods, that
+        create models from cursor rows (values in columns order), and psycopg
+        compatible row_factory(). They validate rows with model_validate(),
+        trusted_rows=True uses model_construct() - without validation.
+        """
         model = ""
+        class_name = create_class_name(table.name, singular, exceptions)
         # mean one model one table
         model += "\n\n"
         model += (
             pt.pydantic_class.format(
-                class_name=create_class_name(table.name, singular, exceptions),
+                class_name=class_name,
                 table_name=table.name,
             )
         ) + "\n\n"
+        config = self.model_config(
+            table.name,
+            {
+                "defer_build": defer_build,
+                "frozen": frozen,
+                "strict": strict,
+                "revalidate_instances": revalidate_instances,
+                "cache_strings": cache_strings,
+                "from_attributes": from_attributes,
+            },
+            config_overrides,
+        )
+        if config:
+            model += config + "\n\n"
 
         for column in table.columns:
             column = t.prepare_column_data(column)
             model += self.generate_attr(column, defaults_off) + "\n"
 
+        if bulk_helpers:
+            self.bulk_helpers = True
+            self.imports.add("TypeAdapter")
+            self.typing_imports.update(("Any", "Iterable"))
+            model += pt.bulk_methods.format(class_name=class_name)
+        if row_constructors:
+            model += self.row_constructors(
+                class_name, [column.name for column in table.columns], trusted_rows
+            )
         return model
 
     def create_header(self, *args, **kwargs) -> str:
@@ -173,4 +281,6 @@ class ModelGenerator:
         self.imports = list(self.imports)
         self.imports.sort()
         header += pt.pydantic_imports.format(imports=", ".join(self.imports))
+        if self.bulk_helpers:
+            header += pt.list_adapter_helper
         return header
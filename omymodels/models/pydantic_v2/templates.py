@@ -10,6 +10,33 @@ base_model = "BaseModel"
 pydantic_imports = """from pydantic import {imports}"""
 
 pydantic_class = """class {class_name}(BaseModel):"""
+model_config = """    model_config = ConfigDict({options})"""
+
+# bulk helpers: one TypeAdapter(list[Model]) per model, built on first use
+list_adapter_helper = """
+
+
+_list_adapters: dict = {}
+
+
+def _list_adapter(model: type) -> TypeAdapter:
+    adapter = _list_adapters.get(model)
+    if adapter is None:
+        adapter = _list_adapters[model] = TypeAdapter(list[model])
+    return adapter"""
+bulk_methods = """
+    @classmethod
+    def validate_many(cls, rows: Iterable[Any]) -> list[{class_name}]:
+        return _list_adapter(cls).validate_python(rows)
+
+    @classmethod
+    def validate_many_json(cls, data: str | bytes) -> list[{class_name}]:
+        return _list_adapter(cls).validate_json(data)
+
+    @classmethod
+    def dump_many(cls, objs: list[{class_name}], **kwargs: Any) -> list[dict]:
+        return _list_adapter(cls).dump_python(objs, **kwargs)
+"""
 # Pydantic v2 style: use X | None instead of Optional[X]
 pydantic_attr = """    {arg_name}: {type}"""
 pydantic_nullable_attr = """    {arg_name}: {type} | None"""
@@ -20,3 +47,28 @@ enum_value = """    {name} = {value}"""
 enum_import = "from enum import {enums}"
 
 uuid_import = "from uuid import UUID"
+
+# positional row constructors, row values are in columns order:
+# model_validate - checked path, model_construct - trusted rows, no validation
+row_field = "            {name}=row[{index}],\n"
+row_key = '                "{name}": row[{index}],\n'
+row_constructors = '''
+    __columns__ = {columns}
+
+    @classmethod
+    def from_row(cls, row: Sequence) -> {class_name}:
+        return cls.{method}({values})
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> list[{class_name}]:
+        from_row = cls.from_row
+        return [from_row(row) for row in rows]
+
+    @classmethod
+    def row_factory(cls, cursor) -> Callable[[Sequence], {class_name}]:
+        """psycopg row factory: connection.cursor(row_factory={class_name}.row_factory)"""
+        names = tuple(column.name for column in cursor.description)
+        if names == cls.__columns__:
+            return cls.from_row
+        return lambda values: cls.{method}({by_names})
+'''
@@ -3,6 +3,7 @@ from typing import Dict, List, Optional
 import omymodels.models.sqlalchemy.templates as st
 from omymodels import logic
 from omymodels.helpers import create_class_name, datetime_now_check
+from omymodels.indexes import table_indexes
 from omymodels.models.sqlalchemy.types import types_mapping
 from omymodels.types import datetime_types
 
@@ -19,6 +20,9 @@ class ModelGenerator(GeneratorBase):
         self.constraint = False
         self.im_index = False
         self.relationship_import = False
+        self.deferred_import = False
+        self.partition_import = False
+        self.sequences = set()
         self.types_mapping = types_mapping
         self.templates = st
         self.prefix = "sa."
@@ -49,29 +53,101 @@ class ModelGenerator(GeneratorBase):
         schema_global: Optional[bool] = True,
         relationships: Optional[List] = None,
         *args,
+        fk_indexes: bool = False,
+        defer_large_columns: bool = False,
+        deferred_group: Optional[str] = None,
+        deferred_overrides: Optional[Dict[str, List[str]]] = None,
+        create_partitions: bool = False,
+        shape_base: Optional[str] = None,
         **kwargs,
     ) -> str:
-        """method to prepare one Model defention - name & tablename  & columns"""
+        """method to prepare one Model defention - name & tablename  & columns
+
+        fk_indexes=True adds Index() to __table_args__ for foreign key
+        columns that are not covered by any index.
+        defer_large_columns=True wraps TEXT, BLOB, JSON & VARCHAR without size
+        columns in deferred(), deferred_group puts them in one load group,
+        deferred_overrides sets deferred columns per table.
+        Partitioned tables get postgresql_partition_by, their partitions are not
+        separate models - create_partitions=True adds after_create listeners
+        that run CREATE TABLE ... PARTITION OF ... for each of them.
+        shape_base - name of the abstract base model with columns of the table
+        (see generate_shape_base), the model only sets __tablename__ & table args.
+        """
         model = ""
         model_name = create_class_name(table.name, singular, exceptions)
 
-        model = st.model_template.format(
-            model_name=model_name,
-            table_name=table.name,
-        )
-        for column in table.columns:
-            model += logic.generate_column(
-                column, table.primary_key, table, schema_global, st, self
+        if shape_base:
+            model = st.shape_model_template.format(
+                model_name=model_name, base_name=shape_base, table_name=table.name
+            )
+        else:
+            model = st.model_template.format(
+                model_name=model_name,
+                table_name=table.name,
+            )
+            model += self._generate_columns(
+                table, schema_global, defer_large_columns, deferred_group, deferred_overrides
+            )
+        indexes = table_indexes(table, fk_indexes)
+        if (
+            indexes
+            or table.alter
+            or table.checks
+            or not schema_global
+            or logic.table_kwargs(table)
+        ):
+            model = logic.add_table_args(
+                self, model, table, schema_global, indexes, quote_columns=bool(shape_base)
             )
-        if table.indexes or table.alter or table.checks or not schema_global:
-            model = logic.add_table_args(self, model, table, schema_global)
 
         # Generate relationships if enabled
         if relationships:
             model += self._generate_relationships(
                 relationships, singular, exceptions
             )
-        return model
+        if create_partitions:
+            model += logic.partition_listeners(self, st, f"{model_name}.__table__", table)
+        return logic.sequence_definitions(self, st, table) + model
+
+    def generate_shape_base(
+        self,
+        table: Dict,
+        base_name: str,
+        schema_global: Optional[bool] = True,
+        *args,
+        defer_large_columns: bool = False,
+        deferred_group: Optional[str] = None,
+        deferred_overrides: Optional[Dict[str, List[str]]] = None,
+        **kwargs,
+    ) -> str:
+        """abstract base model with columns shared by tables of the same shape"""
+        model = st.abstract_model_template.format(model_name=base_name)
+        model += self._generate_columns(
+            table, schema_global, defer_large_columns, deferred_group, deferred_overrides
+        )
+        return logic.sequence_definitions(self, st, table) + model
+
+    def _generate_columns(
+        self,
+        table: Dict,
+        schema_global: bool,
+        defer_large_columns: bool = False,
+        deferred_group: Optional[str] = None,
+        deferred_overrides: Optional[Dict[str, List[str]]] = None,
+    ) -> str:
+        columns = ""
+        deferred = logic.deferred_columns(
+            table, defer_large_columns, deferred_overrides
+        )
+        for column in table.columns:
+            column_str = logic.generate_column(
+                column, table.primary_key, table, schema_global, st, self
+            )
+            if column.name in deferred:
+                column_str = self.defer_column(column_str, deferred_group)
+            columns += column_str
+        return columns
 
     def _generate_relationships(
         self,
@@ -120,6 +196,16 @@ class ModelGenerator(GeneratorBase):
                 )
         return result
 
+    def defer_column(self, column_str: str, group: Optional[str] = None) -> str:
+        """Wrap column into deferred() - it is loaded on first access."""
+        self.deferred_import = True
+        column_name, definition = column_str.strip().split(" = ", 1)
+        return st.deferred_column.format(
+            column_name=column_name,
+            definition=definition,
+            group=st.deferred_group.format(group=group) if group else "",
+        )
+
     def create_header(
         self, tables: List[Dict], schema: bool = False, *args, **kwargs
     ) -> str:
@@ -140,4 +226,8 @@ class ModelGenerator(GeneratorBase):
             header += st.index_import + "\n"
         if self.relationship_import:
             header += st.relationship_import + "\n"
+        if self.deferred_import:
+            header += st.deferred_import + "\n"
+        if self.partition_import:
+            header += st.partition_import + "\n"
         return header
@@ -15,6 +15,14 @@ model_template = """\n
 class {model_name}(Base):\n
     __tablename__ = \'{table_name}\'\n
 """
+abstract_model_template = """\n
+class {model_name}(Base):\n
+    __abstract__ = True\n
+"""
+shape_model_template = """\n
+class {model_name}({base_name}):\n
+    __tablename__ = \'{table_name}\'\n
+"""
 
 # columns defenition
 column_template = """    {column_name} = sa.Column({column_type}"""
@@ -44,15 +52,33 @@ unique_index_template = """
     UniqueConstraint({columns}, name={name})"""
 
 index_template = """
-    Index({name}, {columns})"""
+    Index({name}, {columns}{options})"""
 
-schema = """
-    dict(schema="{schema_name}")"""
+table_kwargs = """
+    dict({kwargs})"""
 
 on_delete = ', ondelete="{mode}"'
 on_update = ', onupdate="{mode}"'
 
 # relationship templates
 relationship_import = "from sqlalchemy.orm import relationship"
+deferred_import = "from sqlalchemy.orm import deferred"
+deferred_column = """    {column_name} = deferred({definition}{group})\n"""
+deferred_group = ", group='{group}'"
 relationship_template = '    {attr_name} = relationship("{related_class}"{back_populates})\n'
 back_populates_template = ', back_populates="{attr_name}"'
+
+# partitions
+partition_import = "from sqlalchemy import DDL, event"
+partition_ddl = """
+event.listen(
+    {table},
+    "after_create",
+    DDL({statement}).execute_if(dialect="postgresql"),
+)
+"""
+
+# sequences
+sequence_template = """\n\n{var_name} = sa.Sequence({arguments})\n"""
+column_sequence = ", {var_name}"
+sequence_default = ", server_default={var_name}.next_value()"
@@ -1,12 +1,22 @@
-from typing import Dict, List
+import textwrap
+from typing import Dict, List, Optional
 
 from table_meta.model import Column
 
 import omymodels.models.sqlalchemy_core.templates as st
 import omymodels.types as t
-from omymodels.helpers import datetime_now_check
+from omymodels import logic
+from omymodels.dependencies import ForeignKeyGraph
+from omymodels.helpers import datetime_now_check, tuple_literal
+from omymodels.indexes import (
+    index_column_expressions,
+    index_column_modifiers,
+    index_options,
+    table_indexes,
+    unique_keys,
+)
 from omymodels.models.sqlalchemy.types import postgresql_dialect, types_mapping
-from omymodels.types import datetime_types
+from omymodels.types import datetime_types, json_types
 
 
 class ModelGenerator:
@@ -15,8 +25,14 @@ class ModelGenerator:
         self.postgresql_dialect_cols = set()
         self.constraint = False
         self.im_index = False
+        self.partition_import = False
         self.custom_types = {}
         self.prefix = "sa."
+        self.bulk_helpers = False
+        self.upsert_helpers = False
+        self.lookup_imports = set()
+        self.typing_imports = set()
+        self.lazy_tables = False
 
     def add_custom_type(self, column_data_type: str, column_type: str) -> str:
         column_type = self.custom_types.get(column_data_type, column_type)
@@ -176,23 +192,32 @@ class ModelGenerator:
         return column + ",\n"
 
     def get_indexes_and_unique(
-        self, model: str, table: Dict, table_var_name: str
+        self,
+        model: str,
+        table: Dict,
+        table_var_name: str,
+        table_indexes: Optional[List[Dict]] = None,
     ) -> str:
         indexes = []
         unique_constr = []
-        if table.indexes:
-            for index in table.indexes:
-                if not index["unique"]:
+        if table_indexes is None:
+            table_indexes = table.indexes
+        if table_indexes:
+            for index in table_indexes:
+                options = index_options(index)
+                if not index["unique"] or options or index_column_modifiers(index):
                     self.im_index = True
+                    if index["unique"]:
+                        options = ", unique=True" + options
                     indexes.append(
                         st.index_template.format(
                             columns=",".join(
-                                [
-                                    f"{table_var_name}.c.{name}"
-                                    for name in index["columns"]
-                                ]
+                                index_column_expressions(
+                                    index, f"{table_var_name}.c.{{name}}"
+                                )
                             ),
                             name=f"'{index['index_name']}'",
+                            options=options,
                         )
                     )
                 else:
@@ -207,8 +232,103 @@ class ModelGenerator:
                     )
         return indexes, unique_constr
 
-    def generate_model(self, data: Dict, *args, **kwargs) -> str:
-        """method to prepare one Model defention - name & tablename  & columns"""
+    @staticmethod
+    def copy_kind(column: Column) -> str:
+        """how COPY encoder formats values of the column: array, json or as is"""
+        if "[" in column.type:
+            return "array"
+        if column.type.lower() in json_types:
+            return "json"
+        return ""
+
+    def generate_bulk_helpers(self, table: Dict, table_var_name: str) -> str:
+        self.typing_imports.update(("Iterable", "Mapping", "Sequence"))
+        names = [column.name for column in table.columns]
+        return st.table_bulk_helpers.format(
+            table_var=table_var_name,
+            columns=tuple_literal([f'"{name}"' for name in names]),
+            kinds=tuple_literal(
+                [f'"{self.copy_kind(column)}"' for column in table.columns]
+            ),
+            values="".join(f'        record.get("{name}"),\n' for name in names)[:-1],
+        )
+
+    def generate_upsert_helpers(
+        self, table: Dict, table_var_name: str, table_ref: Optional[str] = None
+    ) -> str:
+        keys = [
+            tuple_literal([f'"{name}"' for name in key])
+            for key in unique_keys(table)
+        ]
+        if not keys:
+            # no conflict target
+            return ""
+        self.upsert_helpers = True
+        return st.table_upsert.format(
+            table_var=table_var_name,
+            table=table_ref or table_var_name,
+            unique_keys=tuple_literal(keys),
+            default_key=keys[0],
+        )
+
+    def generate_lookup_helpers(self, table: Dict, table_var_name: str) -> str:
+        """<table>_get_by_<key>() & <table>_get_many_by_<key>() for each unique key."""
+        helpers = ""
+        for key in unique_keys(table):
+            # item access: names like "values" or "keys" are ColumnCollection methods
+            columns = [f'{table_var_name}.c["{name}"]' for name in key]
+            if len(key) == 1:
+                values_doc = f"Rows with {key[0]} in values"
+            else:
+                self.lookup_imports.add("tuple_")
+                values_doc = f"Rows with ({', '.join(key)}) tuples in values"
+            helpers += st.lookup_by_key.format(
+                table_var=table_var_name,
+                values_doc=values_doc,
+                **logic.lookup_key_arguments(
+                    key, columns, st.lookup_condition, table_var_name
+                ),
+            )
+        if helpers:
+            self.lookup_imports.update(("bindparam", "lambda_stmt", "select"))
+            self.typing_imports.update(("Iterable", "Iterator"))
+        return helpers
+
+    def generate_model(
+        self,
+        data: Dict,
+        *args,
+        fk_indexes: bool = False,
+        bulk_helpers: bool = False,
+        upsert_helpers: bool = False,
+        lookup_helpers: bool = False,
+        create_partitions: bool = False,
+        lazy_tables: bool = False,
+        **kwargs,
+    ) -> str:
+        """method to prepare one Model defention - name & tablename  & columns
+
+        fk_indexes=True adds Index() for foreign key columns without index.
+        bulk_helpers=True adds <table>_columns tuple, <table>_to_row() &
+        <table>_rows_from_dicts() to get rows in columns order (missing keys
+        become None) and <table>_copy_data() that encodes rows for
+        PostgreSQL COPY ... FROM STDIN in text or CSV format.
+        upsert_helpers=True adds <table>_unique_keys (primary key, unique
+        columns & indexes) and <table>_upsert(on=...) that builds
+        INSERT ... ON CONFLICT DO UPDATE / ON DUPLICATE KEY UPDATE statement.
+        lookup_helpers=True adds <table>_get_by_<key>(conn, ...) and
+        <table>_get_many_by_<key>(conn, values, chunk_size=1000) for each
+        unique key - cached lambda_stmt() statements with bound parameters,
+        _many variant sends values in chunks as expanding IN parameter.
+        Partitioned tables get postgresql_partition_by, their partitions are not
+        separate tables - create_partitions=True adds after_create listeners
+        that run CREATE TABLE ... PARTITION OF ... for each of them.
+        lazy_tables=True emits a factory function per table instead of Table()
+        at import time: tables are built on first get_table(name) or module
+        attribute access, with the tables they reference by foreign keys.
+        """
+        if lazy_tables and lookup_helpers:
+            raise ValueError("lookup_helpers can not be used with lazy_tables")
         model = ""
         # mean this is a table
         table = data
@@ -225,40 +345,97 @@ class ModelGenerator:
         indexes = []
         constraints = None
 
-        if table.indexes or table.alter or table.checks:
+        all_indexes = table_indexes(table, fk_indexes, upsert_helpers)
+        if all_indexes or table.alter or table.checks:
             indexes, constraints = self.get_indexes_and_unique(
-                model, table, table_var_name
+                model, table, table_var_name, all_indexes
             )
 
-        model = st.table_template.format(
+        table_args = dict(
             table_var=table_var_name,
             table_name=table.name,
             columns=columns,
             schema=""
             if not table.table_schema
             else st.schema.format(schema_name=table.table_schema),
-            constraints=", ".join(constraints) if constraints else "",
+            constraints=(", ".join(constraints) if constraints else "")
+            + "".join(
+                st.table_kwarg.format(name=name, value=value)
+                for name, value in logic.table_kwargs(table).items()
+            ),
         )
-        for index in indexes:
-            model += index
+        table_body = "".join(indexes)
+        if create_partitions:
+            table_body += logic.partition_listeners(self, st, table_var_name, table)
+        if lazy_tables:
+            self.lazy_tables = True
+            model = self.generate_lazy_table(table, table_body, **table_args)
+        else:
+            model = st.table_template.format(**table_args) + table_body
+        if bulk_helpers:
+            self.bulk_helpers = True
+            model += self.generate_bulk_helpers(table, table_var_name)
+        if upsert_helpers:
+            model += self.generate_upsert_helpers(
+                table,
+                table_var_name,
+                f'get_table("{table_var_name}")' if lazy_tables else None,
+            )
+        if lookup_helpers:
+            model += self.generate_lookup_helpers(table, table_var_name)
         return model
 
+    @staticmethod
+    def generate_lazy_table(table: Dict, table_body: str, **table_args) -> str:
+        """Factory function of the table, registered by variable name,
+        table name & schema.table name with tables it references."""
+        names = [table_args["table_var"], table.name]
+        if table.table_schema:
+            names.append(f"{table.table_schema}.{table.name}")
+        dependencies = sorted(
+            ForeignKeyGraph([table]).dependencies[table.name] - {table.name}
+        )
+        return st.lazy_table_template.format(
+            names=", ".join(f'"{name}"' for name in dict.fromkeys(names)),
+            dependencies=st.lazy_dependencies.format(
+                dependencies=tuple_literal([f'"{name}"' for name in dependencies])
+            )
+            if dependencies
+            else "",
+            body=textwrap.indent(table_body.lstrip("\n") + "\n", "    ")
+            if table_body
+            else "",
+            **table_args,
+        )
+
     def create_header(
         self, tables: List[Dict], schema: bool = False, *args, **kwargs
     ) -> str:
-        """header of the file - imports & sqlalchemy init"""
-        header = ""
-        if "func" in self.state:
-            header += st.sql_alchemy_func_import + "\n"
-        if self.postgresql_dialect_cols:
-            header += (
+        """header of the file - imports & sqlalchemy init, then helper functions"""
+        parts = (
+            ("func" in self.state, st.sql_alchemy_func_import),
+            (
+                self.postgresql_dialect_cols,
                 st.postgresql_dialect_import.format(
                     types=",".join(self.postgresql_dialect_cols)
-                )
-                + "\n"
-            )
-        if self.constraint:
-            header += st.unique_cons_import + "\n"
-        if self.im_index:
-            header += st.index_import + "\n"
-        return header
+                ),
+            ),
+            (self.constraint, st.unique_cons_import),
+            (self.im_index, st.index_import),
+            (self.partition_import, st.partition_import),
+            (
+                self.lookup_imports,
+                st.lookup_import.format(names=", ".join(sorted(self.lookup_imports))),
+            ),
+            (self.upsert_helpers, st.upsert_import),
+            (self.bulk_helpers, st.json_import),
+            (
+                self.typing_imports,
+                st.typing_import.format(types=", ".join(sorted(self.typing_imports))),
+            ),
+            (self.bulk_helpers, st.copy_helpers),
+            (self.upsert_helpers, st.upsert_helper),
+            (self.lookup_imports, st.chunks_helper),
+            (self.lazy_tables, st.lazy_tables_helpers),
+        )
+        return "".join(f"{text}\n" for enabled, text in parts if enabled)
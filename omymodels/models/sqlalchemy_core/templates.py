@@ -29,9 +29,249 @@ fk_constraint_template = """
 fk_in_column = ", sa.ForeignKey('{ref_table}.{ref_column}')"
 unique_index_template = """        UniqueConstraint({columns}, name={name}),\n"""
 
-index_template = """\nIndex({name}, {columns})"""
+index_template = """\nIndex({name}, {columns}{options})"""
 
 schema = '        schema="{schema_name}"'
+table_kwarg = "        {name}={value},\n"
 
 on_delete = ', ondelete="{mode}"'
 on_update = ', onupdate="{mode}"'
+
+# bulk load helpers
+json_import = "import json"
+typing_import = "from typing import {types}"
+
+# PostgreSQL COPY data encoding, shared by all tables
+copy_helpers = r'''
+
+_copy_text_escapes = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+def _copy_array_item(value) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, (list, tuple)):
+        return _copy_array(value)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{value}"'
+
+
+def _copy_array(value) -> str:
+    return "{" + ",".join(_copy_array_item(item) for item in value) + "}"
+
+
+def _copy_value(value, kind: str) -> str:
+    if kind == "json":
+        return json.dumps(value, default=str)
+    if kind == "array":
+        return _copy_array(value)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    return str(value)
+
+
+def _copy_csv_field(value: str) -> str:
+    if value == "" or any(char in value for char in ',"\n\r'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _copy_data(rows: Iterable[Sequence], kinds: tuple, csv: bool = False) -> str:
+    """COPY ... FROM STDIN data: text format (NULL is \\N) or CSV (NULL is empty)"""
+    lines = []
+    for row in rows:
+        if csv:
+            line = ",".join(
+                "" if value is None else _copy_csv_field(_copy_value(value, kind))
+                for value, kind in zip(row, kinds)
+            )
+        else:
+            line = "\t".join(
+                "\\N"
+                if value is None
+                else _copy_value(value, kind).translate(_copy_text_escapes)
+                for value, kind in zip(row, kinds)
+            )
+        lines.append(line + "\n")
+    return "".join(lines)'''
+
+table_bulk_helpers = '''
+
+{table_var}_columns = {columns}
+{table_var}_copy_kinds = {kinds}
+
+
+def {table_var}_to_row(record: Mapping) -> tuple:
+    return (
+{values}
+    )
+
+
+def {table_var}_rows_from_dicts(records: Iterable[Mapping]) -> list:
+    return [{table_var}_to_row(record) for record in records]
+
+
+def {table_var}_copy_data(rows: Iterable[Sequence], csv: bool = False) -> str:
+    return _copy_data(rows, {table_var}_copy_kinds, csv)
+'''
+
+# upsert helpers
+upsert_import = "from sqlalchemy.dialects import mysql, postgresql, sqlite"
+
+upsert_helper = '''
+
+def _upsert(
+    table, on: tuple, unique_keys: tuple, update=None, dialect: str = "postgresql"
+):
+    """INSERT ... ON CONFLICT (on) DO UPDATE (postgresql, sqlite) or
+    INSERT ... ON DUPLICATE KEY UPDATE (mysql) without values - execute it
+    with a list of dicts to insert rows in batches"""
+    on = tuple(on)
+    if on not in unique_keys:
+        raise ValueError(
+            f"{table.name}: {on} is not a unique key, use one of {unique_keys}"
+        )
+    if update is None:
+        keys = set(on) | {column.name for column in table.primary_key}
+        update = [column.name for column in table.columns if column.name not in keys]
+    if dialect == "mysql":
+        stmt = mysql.insert(table)
+        # nothing to update - no-op assignment keeps existing row
+        return stmt.on_duplicate_key_update(
+            {name: stmt.inserted[name] for name in update or on[:1]}
+        )
+    if dialect not in ("postgresql", "sqlite"):
+        raise ValueError(f"upsert is not supported for dialect {dialect}")
+    stmt = (postgresql if dialect == "postgresql" else sqlite).insert(table)
+    if not update:
+        return stmt.on_conflict_do_nothing(index_elements=list(on))
+    return stmt.on_conflict_do_update(
+        index_elements=list(on), set_={name: stmt.excluded[name] for name in update}
+    )'''
+
+table_upsert = '''
+
+{table_var}_unique_keys = {unique_keys}
+
+
+def {table_var}_upsert(on: tuple = {default_key}, update=None, dialect: str = "postgresql"):
+    return _upsert({table}, on, {table_var}_unique_keys, update, dialect)
+'''
+
+# lookup helpers: lambda_stmt() caches the statement by lambda code,
+# hot lookups skip statement construction & compilation
+lookup_import = "from sqlalchemy import {names}"
+
+chunks_helper = """
+
+def _chunks(values: Iterable, size: int) -> Iterator[list]:
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]"""
+
+lookup_condition = """                {column} == bindparam("{name}"),"""
+lookup_by_key = """
+
+def {table_var}_get_by_{key_name}(conn, {args}):
+    return conn.execute(
+        lambda_stmt(
+            lambda: select({table_var}).where(
+{conditions}
+            )
+        ),
+        {{{params}}},
+    ).first()
+
+
+def {table_var}_get_many_by_{key_name}(
+    conn, values: Iterable, chunk_size: int = 1000
+) -> list:
+    \"\"\"{values_doc}, sent in chunks of chunk_size.\"\"\"
+    rows = []
+    for chunk in _chunks(values, chunk_size):
+        rows.extend(
+            conn.execute(
+                lambda_stmt(
+                    lambda: select({table_var}).where(
+                        {in_column}.in_(bindparam("values", expanding=True))
+                    )
+                ),
+                {{"values": chunk}},
+            )
+        )
+    return rows
+"""
+
+# partitions
+partition_import = "from sqlalchemy import DDL, event"
+partition_ddl = """
+event.listen(
+    {table},
+    "after_create",
+    DDL({statement}).execute_if(dialect="postgresql"),
+)
+"""
+
+# lazy tables: factories registered by names, tables are built on first access
+lazy_table_template = """\n
+@_lazy_table({names}{dependencies})
+def _{table_var}_table() -> Table:
+    {table_var} = Table("{table_name}", metadata,
+{columns}{constraints}{schema})
+{body}    return {table_var}
+"""
+lazy_dependencies = ", dependencies={dependencies}"
+
+lazy_tables_helpers = '''
+
+_table_factories = {}
+_table_dependencies = {}
+_tables = {}
+
+
+def _lazy_table(var_name: str, *names: str, dependencies: tuple = ()):
+    """Register the decorated function as factory of the table, the table
+    is available by variable name, table name & schema.table name"""
+
+    def register(factory):
+        for name in (var_name, *names):
+            _table_factories[name] = (var_name, factory)
+            _table_dependencies[name] = dependencies
+        return factory
+
+    return register
+
+
+def get_table(name: str) -> Table:
+    """Table by name - built on first access together with the tables
+    it references by foreign keys."""
+    if name not in _table_factories:
+        raise KeyError(f"Unknown table {name!r}")
+    var_name, factory = _table_factories[name]
+    table = _tables.get(var_name)
+    if table is None:
+        # registered before dependencies, so foreign key cycles end here
+        table = _tables[var_name] = globals()[var_name] = factory()
+        for dependency in _table_dependencies[name]:
+            if dependency in _table_factories:
+                get_table(dependency)
+    return table
+
+
+def __getattr__(name: str):
+    if name in _table_factories:
+        return get_table(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def load_all() -> MetaData:
+    """Build all tables, for example, before metadata.create_all()"""
+    for name in list(_table_factories):
+        get_table(name)
+    return metadata'''
@@ -1,11 +1,32 @@
 from typing import Dict, List, Optional
 
 import omymodels.models.sqlalchemy_v2.templates as st
-from omymodels.helpers import create_class_name, datetime_now_check
+from omymodels import logic
+from omymodels.helpers import create_class_name, datetime_now_check, tuple_literal
+from omymodels.indexes import table_indexes, unique_keys
 from omymodels.models.sqlalchemy_v2.types import types_mapping, python_to_sa_type
+from omymodels.sequences import sequence_var_name, table_sequence
 from omymodels.types import datetime_types, json_types, postgresql_dialect
 import omymodels.types as t
 
+# values supported by relationship(lazy=...)
+loading_strategies = (
+    "select",
+    "selectin",
+    "joined",
+    "subquery",
+    "immediate",
+    "raise",
+    "raise_on_sql",
+    "noload",
+    "write_only",
+    "dynamic",
+)
+# strategies that load on attribute access - implicit IO fails under asyncio
+implicit_io_strategies = ("select", "dynamic")
+# async_mode defaults: collections must be loaded explicitly, references with the row
+async_loading = {"one_to_many": "raise", "many_to_one": "selectin"}
+
 
 class GeneratorBase:
     def __init__(self):
@@ -19,12 +40,18 @@ class ModelGenerator(GeneratorBase):
         self.typing_imports = set()
         self.constraint = False
         self.im_index = False
+        self.index_imports = set()
         self.datetime_import = False
         self.date_import = False
         self.time_import = False
         self.uuid_import = False
         self.fk_import = False
         self.relationship_import = False
+        self.upsert_helpers = False
+        self.lookup_imports = set()
+        self.partition_import = False
+        self.sequences = set()
+        self.async_attrs = False
         self.types_mapping = types_mapping
         self.templates = st
         self.prefix = ""
@@ -117,6 +144,8 @@ class ModelGenerator(GeneratorBase):
         table_pk: List[str],
         table_data: Dict,
         schema_global: bool,
+        deferred: bool = False,
+        deferred_group: Optional[str] = None,
     ) -> str:
         """Generate a column definition in SQLAlchemy 2.0 style."""
         column_data = t.prepare_column_data(column_data)
@@ -150,6 +179,11 @@ class ModelGenerator(GeneratorBase):
             column, column_data, table_pk, table_data, schema_global
         )
 
+        if deferred:
+            column += st.deferred
+            if deferred_group:
+                column += st.deferred_group.format(group=deferred_group)
+
         column += ")\n"
         return column
 
@@ -163,16 +197,12 @@ class ModelGenerator(GeneratorBase):
     ) -> str:
         """Add attributes to column definition."""
         # Handle foreign keys from ALTER statements
-        if "columns" in table_data.alter:
-            for alter_column in table_data.alter["columns"]:
-                if (
-                    alter_column["name"] == column_data.name
-                    and not alter_column["constraint_name"]
-                    and alter_column["references"]
-                ):
-                    column = self._add_foreign_key(
-                        column, alter_column["references"], schema_global
-                    )
+        for reference in logic.alter_references(table_data, column_data.name):
+            column = self._add_foreign_key(column, reference, schema_global)
+
+        sequence = table_sequence(table_data, column_data.name)
+        if sequence:
+            column += st.column_sequence.format(var_name=sequence_var_name(sequence))
 
         # Handle autoincrement
         if column_data.type.lower() in ("serial", "bigserial"):
@@ -185,7 +215,9 @@ class ModelGenerator(GeneratorBase):
             )
 
         # Handle default values
-        if column_data.default is not None:
+        if sequence:
+            column += st.sequence_default.format(var_name=sequence_var_name(sequence))
+        elif column_data.default is not None:
             column = self.prepare_column_default(column_data, column)
 
         # Handle primary key
@@ -204,21 +236,25 @@ class ModelGenerator(GeneratorBase):
         """Add foreign key to column definition."""
         self.fk_import = True
         if reference["schema"] and not schema_global:
-            column += st.fk_in_column.format(
+            fk = st.fk_in_column.format(
                 ref_schema=reference["schema"],
                 ref_table=reference["table"],
                 ref_column=reference["column"] or column,
             )
         else:
-            column += st.fk_in_column_without_schema.format(
+            fk = st.fk_in_column_without_schema.format(
                 ref_table=reference["table"],
                 ref_column=reference["column"] or column,
             )
+        fk_options = ""
         if reference["on_delete"]:
-            column += st.on_delete.format(mode=reference["on_delete"].upper())
+            fk_options += st.on_delete.format(mode=reference["on_delete"].upper())
         if reference["on_update"]:
-            column += st.on_update.format(mode=reference["on_update"].upper())
-        return column
+            fk_options += st.on_update.format(mode=reference["on_update"].upper())
+        if fk_options:
+            # ondelete/onupdate are ForeignKey() arguments, not mapped_column() ones
+            fk = fk[:-1] + fk_options + ")"
+        return column + fk
 
     def generate_model(
         self,
@@ -228,35 +264,235 @@ class ModelGenerator(GeneratorBase):
         schema_global: Optional[bool] = True,
         relationships: Optional[List] = None,
         *args,
+        lazy_one_to_many: Optional[str] = None,
+        lazy_many_to_one: Optional[str] = None,
+        lazy_overrides: Optional[Dict[str, Dict[str, str]]] = None,
+        passive_deletes: bool = True,
+        fk_indexes: bool = False,
+        defer_large_columns: bool = False,
+        deferred_group: Optional[str] = None,
+        deferred_overrides: Optional[Dict[str, List[str]]] = None,
+        upsert_helpers: bool = False,
+        lookup_helpers: bool = False,
+        create_partitions: bool = False,
+        shape_base: Optional[str] = None,
+        async_mode: bool = False,
         **kwargs,
     ) -> str:
-        """Generate a model definition in SQLAlchemy 2.0 style."""
-        model = st.model_template.format(
-            model_name=create_class_name(table.name, singular, exceptions),
-            table_name=table.name,
-        )
+        """Generate a model definition in SQLAlchemy 2.0 style.
+
+        lazy_one_to_many / lazy_many_to_one set loading strategy for
+        relationship() collections & references, lazy_overrides changes
+        them per table: {"users": {"one_to_many": "raise"}}.
+        Collections with ON DELETE CASCADE get cascade="all, delete"
+        & passive_deletes=True (disable with passive_deletes=False).
+        fk_indexes=True adds Index() for foreign key columns without index.
+        defer_large_columns=True adds deferred=True to TEXT, BLOB, JSON &
+        VARCHAR without size columns, deferred_group puts them in one load
+        group, deferred_overrides sets deferred columns per table.
+        upsert_helpers=True adds __unique_keys__ (primary key, unique columns
+        & indexes) and upsert(on=...) classmethod that builds
+        INSERT ... ON CONFLICT DO UPDATE / ON DUPLICATE KEY UPDATE statement.
+        lookup_helpers=True adds module level <table>_get_by_<key>(session, ...)
+        and <table>_get_many_by_<key>(session, values, chunk_size=1000) for
+        each unique key - cached lambda_stmt() statements with bound
+        parameters, _many variant sends values in chunks as expanding IN.
+        Partitioned tables get postgresql_partition_by, their partitions are
+        not separate models - create_partitions=True adds after_create
+        listeners that run CREATE TABLE ... PARTITION OF ... for each of them.
+        shape_base - name of the abstract base model with columns of the table
+        (see generate_shape_base), the model only sets __tablename__ & table args.
+        async_mode=True is for AsyncSession: Base gets AsyncAttrs, relationships
+        get lazy="raise" (collections) & lazy="selectin" (references) unless
+        set by lazy_* options, tables with server side defaults get
+        __mapper_args__ = {"eager_defaults": True}.
+        """
+        model_name = create_class_name(table.name, singular, exceptions)
+        if shape_base:
+            model = st.shape_model_template.format(
+                model_name=model_name, base_name=shape_base, table_name=table.name
+            )
+        else:
+            model = st.model_template.format(
+                model_name=model_name,
+                table_name=table.name,
+            )
+            model += self._generate_columns(
+                table, schema_global, defer_large_columns, deferred_group, deferred_overrides
+            )
 
-        for column in table.columns:
-            model += self.generate_column(
-                column, table.primary_key, table, schema_global
+        indexes = table_indexes(table, fk_indexes, upsert_helpers)
+        if (
+            indexes
+            or table.alter
+            or table.checks
+            or not schema_global
+            or logic.table_kwargs(table)
+        ):
+            model = logic.add_table_args(
+                self,
+                model,
+                table,
+                schema_global,
+                indexes,
+                quote_columns=True,
+                separator=", ",
             )
 
-        if table.indexes or table.alter or table.checks or not schema_global:
-            model = self._add_table_args(model, table, schema_global)
+        if async_mode:
+            self.async_attrs = True
+            if self._has_server_defaults(table):
+                model += st.mapper_args.format(args=st.eager_defaults)
 
         # Generate relationships if enabled
         if relationships:
+            loading = {"one_to_many": lazy_one_to_many, "many_to_one": lazy_many_to_one}
+            loading.update((lazy_overrides or {}).get(table.name, {}))
+            if async_mode:
+                loading = self._async_loading(loading, table.name)
             model += self._generate_relationships(
-                relationships, singular, exceptions
+                relationships, singular, exceptions, loading, passive_deletes
             )
 
-        return model
+        if upsert_helpers:
+            model = model.rstrip("\n") + "\n" + self._generate_upsert_methods(table)
+
+        if lookup_helpers:
+            model += self._generate_lookup_helpers(table, model_name)
+
+        if create_partitions:
+            model += logic.partition_listeners(self, st, f"{model_name}.__table__", table)
+
+        return logic.sequence_definitions(self, st, table) + model
+
+    def generate_shape_base(
+        self,
+        table: Dict,
+        base_name: str,
+        schema_global: Optional[bool] = True,
+        *args,
+        defer_large_columns: bool = False,
+        deferred_group: Optional[str] = None,
+        deferred_overrides: Optional[Dict[str, List[str]]] = None,
+        **kwargs,
+    ) -> str:
+        """Abstract base model with columns shared by tables of the same shape."""
+        model = st.abstract_model_template.format(model_name=base_name)
+        model += self._generate_columns(
+            table, schema_global, defer_large_columns, deferred_group, deferred_overrides
+        )
+        return logic.sequence_definitions(self, st, table) + model
+
+    @staticmethod
+    def _has_server_defaults(table: Dict) -> bool:
+        """Table has columns with values generated by the database:
+        server_default (func.now(), literals, sequences) or serial."""
+        return any(
+            column.default is not None
+            or column.type.lower() in ("serial", "bigserial")
+            or table_sequence(table, column.name)
+            for column in table.columns
+        )
+
+    @staticmethod
+    def _async_loading(
+        loading: Dict[str, Optional[str]], table_name: str
+    ) -> Dict[str, Optional[str]]:
+        """Loading strategies for async_mode, implicit loads are not allowed."""
+        result = {}
+        for rel_type, strategy in loading.items():
+            if strategy in implicit_io_strategies:
+                raise ValueError(
+                    f"{table_name}: lazy={strategy!r} loads on attribute access "
+                    f"and can not be used with async_mode"
+                )
+            result[rel_type] = strategy or async_loading.get(rel_type)
+        return result
+
+    def _generate_columns(
+        self,
+        table: Dict,
+        schema_global: bool,
+        defer_large_columns: bool = False,
+        deferred_group: Optional[str] = None,
+        deferred_overrides: Optional[Dict[str, List[str]]] = None,
+    ) -> str:
+        """Mapped columns of the table."""
+        columns = ""
+        deferred = logic.deferred_columns(
+            table, defer_large_columns, deferred_overrides
+        )
+        for column in table.columns:
+            columns += self.generate_column(
+                column,
+                table.primary_key,
+                table,
+                schema_global,
+                deferred=column.name in deferred,
+                deferred_group=deferred_group,
+            )
+        return columns
+
+    def _generate_lookup_helpers(self, table: Dict, model_name: str) -> str:
+        """<table>_get_by_<key>() & <table>_get_many_by_<key>() for each unique key."""
+        helpers = ""
+        for key in unique_keys(table):
+            columns = [logic.lookup_column(model_name, name) for name in key]
+            if len(key) == 1:
+                values_doc = f"Models with {key[0]} in values"
+            else:
+                self.lookup_imports.add("tuple_")
+                values_doc = f"Models with ({', '.join(key)}) tuples in values"
+            helpers += st.lookup_by_key.format(
+                func_prefix=table.name.replace("-", "_"),
+                model_name=model_name,
+                values_doc=values_doc,
+                **logic.lookup_key_arguments(key, columns, st.lookup_condition, model_name),
+            )
+        if helpers:
+            self.lookup_imports.update(("bindparam", "lambda_stmt", "select"))
+            self.typing_imports.update(("Iterable", "Iterator", "List"))
+        return helpers
+
+    def _generate_upsert_methods(self, table: Dict) -> str:
+        """__unique_keys__ & upsert() classmethod, tables without unique keys are skipped."""
+        keys = [tuple_literal([f'"{name}"' for name in key]) for key in unique_keys(table)]
+        if not keys:
+            return ""
+        self.upsert_helpers = True
+        return st.upsert_methods.format(
+            unique_keys=tuple_literal(keys), default_key=keys[0]
+        )
+
+    @staticmethod
+    def _relationship_options(
+        rel: Dict, loading: Dict[str, Optional[str]], passive_deletes: bool
+    ) -> str:
+        """Loading strategy & passive_deletes arguments for relationship()."""
+        options = ""
+        strategy = loading.get(rel["type"])
+        if strategy:
+            if strategy not in loading_strategies:
+                raise ValueError(
+                    f"Unsupported relationship loading strategy {strategy!r}. "
+                    f"Supported: {list(loading_strategies)}"
+                )
+            options += st.lazy_template.format(strategy=strategy)
+        if (
+            passive_deletes
+            and rel["type"] == "one_to_many"
+            and (rel.get("on_delete") or "").lower() == "cascade"
+        ):
+            options += st.passive_deletes
+        return options
 
     def _generate_relationships(
         self,
         relationships: List[Dict],
         singular: bool,
         exceptions: Optional[List] = None,
+        loading: Optional[Dict[str, Optional[str]]] = None,
+        passive_deletes: bool = True,
     ) -> str:
         """Generate relationship() lines for the model."""
         result = "\n"
@@ -276,6 +512,9 @@ class ModelGenerator(GeneratorBase):
                 # back_populates points to the collection on the parent (uses child table name)
                 back_pop_name = child_table_name.lower().replace("-", "_")
                 back_populates = st.back_populates_template.format(attr_name=back_pop_name)
+                back_populates += self._relationship_options(
+                    rel, loading or {}, passive_deletes
+                )
                 # Type hint for many-to-one is the related class (quoted for forward ref)
                 type_hint = f'"{related_class}"'
                 result += st.relationship_template.format(
@@ -296,6 +535,9 @@ class ModelGenerator(GeneratorBase):
                 # Derived from FK column (author_id -> author)
                 back_pop_name = fk_column.replace("_id", "") if fk_column.endswith("_id") else child_table.lower()
                 back_populates = st.back_populates_template.format(attr_name=back_pop_name)
+                back_populates += self._relationship_options(
+                    rel, loading or {}, passive_deletes
+                )
                 # Type hint for one-to-many is List of related class (quoted for forward ref)
                 type_hint = f'List["{related_class}"]'
                 result += st.relationship_template.format(
@@ -306,39 +548,6 @@ class ModelGenerator(GeneratorBase):
                 )
         return result
 
-    def _add_table_args(
-        self, model: str, table: Dict, schema_global: bool = True
-    ) -> str:
-        """Add __table_args__ to model."""
-        statements = []
-
-        if table.indexes:
-            for index in table.indexes:
-                if not index["unique"]:
-                    self.im_index = True
-                    statements.append(
-                        st.index_template.format(
-                            columns=", ".join(f"'{c}'" for c in index["columns"]),
-                            name=f"'{index['index_name']}'",
-                        )
-                    )
-                else:
-                    self.constraint = True
-                    statements.append(
-                        st.unique_index_template.format(
-                            columns=", ".join(f"'{c}'" for c in index["columns"]),
-                            name=f"'{index['index_name']}'",
-                        )
-                    )
-
-        if not schema_global and table.table_schema:
-            statements.append(st.schema.format(schema_name=table.table_schema))
-
-        if statements:
-            model += st.table_args.format(statements=",".join(statements))
-
-        return model
-
     def _build_datetime_import(self) -> str:
         """Build datetime import statement."""
         if not (self.datetime_import or self.date_import or self.time_import):
@@ -355,34 +564,37 @@ class ModelGenerator(GeneratorBase):
     def create_header(
         self, tables: List[Dict], schema: bool = False, *args, **kwargs
     ) -> str:
-        """Generate file header with imports."""
-        parts = []
-
-        parts.append(self._build_datetime_import())
-
-        if self.uuid_import:
-            parts.append("from uuid import UUID\n")
-
-        if self.typing_imports:
-            parts.append(st.typing_import.format(types=", ".join(sorted(self.typing_imports))) + "\n")
-
-        if "func" in self.state:
-            parts.append(st.sql_alchemy_func_import + "\n")
-
-        if self.postgresql_dialect_cols:
-            parts.append(st.postgresql_dialect_import.format(
-                types=", ".join(sorted(self.postgresql_dialect_cols))) + "\n")
-
-        if self.fk_import:
-            parts.append("from sqlalchemy import ForeignKey\n")
-
-        if self.constraint:
-            parts.append(st.unique_cons_import + "\n")
-
-        if self.im_index:
-            parts.append(st.index_import + "\n")
-
-        if self.relationship_import:
-            parts.append(st.relationship_import + "\n")
-
-        return "".join(parts)
+        """Generate file header with imports, then helper functions."""
+        parts = (
+            (True, self._build_datetime_import().rstrip("\n")),
+            (self.uuid_import, "from uuid import UUID"),
+            (
+                self.typing_imports,
+                st.typing_import.format(types=", ".join(sorted(self.typing_imports))),
+            ),
+            ("func" in self.state, st.sql_alchemy_func_import),
+            (
+                self.postgresql_dialect_cols,
+                st.postgresql_dialect_import.format(
+                    types=", ".join(sorted(self.postgresql_dialect_cols))
+                ),
+            ),
+            (self.fk_import, "from sqlalchemy import ForeignKey"),
+            (self.constraint, st.unique_cons_import),
+            (self.sequences, st.sequence_import),
+            (
+                self.im_index,
+                st.index_import
+                + "".join(f", {name}" for name in sorted(self.index_imports)),
+            ),
+            (self.relationship_import, st.relationship_import),
+            (self.partition_import, st.partition_import),
+            (
+                self.lookup_imports,
+                st.lookup_import.format(names=", ".join(sorted(self.lookup_imports))),
+            ),
+            (self.upsert_helpers, st.upsert_import),
+            (self.upsert_helpers, st.upsert_helper),
+            (self.lookup_imports, st.chunks_helper),
+        )
+        return "".join(f"{text}\n" for enabled, text in parts if enabled and text)
@@ -1,7 +1,16 @@
+from omymodels.models.sqlalchemy_core.templates import (  # noqa: F401
+    chunks_helper,
+    lookup_condition,
+    lookup_import,
+    upsert_helper,
+    upsert_import,
+)
+
 # imports
 postgresql_dialect_import = "from sqlalchemy.dialects.postgresql import {types}"
 sql_alchemy_func_import = "from sqlalchemy.sql import func"
 index_import = "from sqlalchemy import Index"
+sequence_import = "from sqlalchemy import Sequence"
 typing_import = "from typing import {types}"
 
 sqlalchemy_import = """from sqlalchemy import (
@@ -22,6 +31,14 @@ model_template = """\n
 class {model_name}(Base):
     __tablename__ = '{table_name}'
 """
+abstract_model_template = """\n
+class {model_name}(Base):
+    __abstract__ = True
+"""
+shape_model_template = """\n
+class {model_name}({base_name}):
+    __tablename__ = '{table_name}'
+"""
 
 # columns definition - SQLAlchemy 2.0 style with Mapped and mapped_column
 column_template = """    {column_name}: Mapped[{python_type}] = mapped_column({column_type}"""
@@ -34,6 +51,8 @@ unique = ", unique=True"
 autoincrement = ", autoincrement=True"
 index = ", index=True"
 nullable = ""  # Handled by Optional in type hint
+deferred = ", deferred=True"
+deferred_group = ", deferred_group='{group}'"
 
 # tables properties
 table_args = """
@@ -53,10 +72,10 @@ unique_index_template = """
     UniqueConstraint({columns}, name={name})"""
 
 index_template = """
-    Index({name}, {columns})"""
+    Index({name}, {columns}{options})"""
 
-schema = """
-    dict(schema="{schema_name}")"""
+table_kwargs = """
+    dict({kwargs})"""
 
 on_delete = ', ondelete="{mode}"'
 on_update = ', onupdate="{mode}"'
@@ -65,3 +84,70 @@ on_update = ', onupdate="{mode}"'
 relationship_import = "from sqlalchemy.orm import relationship"
 relationship_template = '    {attr_name}: Mapped[{type_hint}] = relationship("{related_class}"{back_populates})\n'
 back_populates_template = ', back_populates="{attr_name}"'
+lazy_template = ', lazy="{strategy}"'
+# passive_deletes alone does not stop the ORM from nulling out loaded children,
+# the delete cascade lets the database ON DELETE CASCADE remove them
+passive_deletes = ', cascade="all, delete", passive_deletes=True'
+
+# async mode: fetch server generated values in the INSERT / UPDATE statement
+mapper_args = """
+    __mapper_args__ = {{{args}}}
+"""
+eager_defaults = '"eager_defaults": True'
+
+# upsert helpers: upsert_import & _upsert are shared with sqlalchemy_core
+upsert_methods = """
+    __unique_keys__ = {unique_keys}
+
+    @classmethod
+    def upsert(cls, on: tuple = {default_key}, update=None, dialect: str = "postgresql"):
+        return _upsert(cls.__table__, on, cls.__unique_keys__, update, dialect)
+"""
+
+# lookup helpers: lookup_import, _chunks & conditions are shared with sqlalchemy_core
+lookup_by_key = """
+
+def {func_prefix}_get_by_{key_name}(session, {args}) -> {model_name} | None:
+    return session.execute(
+        lambda_stmt(
+            lambda: select({model_name}).where(
+{conditions}
+            )
+        ),
+        {{{params}}},
+    ).scalar_one_or_none()
+
+
+def {func_prefix}_get_many_by_{key_name}(
+    session, values: Iterable, chunk_size: int = 1000
+) -> List[{model_name}]:
+    \"\"\"{values_doc}, sent in chunks of chunk_size.\"\"\"
+    result = []
+    for chunk in _chunks(values, chunk_size):
+        result.extend(
+            session.scalars(
+                lambda_stmt(
+                    lambda: select({model_name}).where(
+                        {in_column}.in_(bindparam("values", expanding=True))
+                    )
+                ),
+                {{"values": chunk}},
+            )
+        )
+    return result
+"""
+
+# partitions
+partition_import = "from sqlalchemy import DDL, event"
+partition_ddl = """
+event.listen(
+    {table},
+    "after_create",
+    DDL({statement}).execute_if(dialect="postgresql"),
+)
+"""
+
+# sequences
+sequence_template = """\n\n{var_name} = Sequence({arguments})\n"""
+column_sequence = ", {var_name}"
+sequence_default = ", server_default={var_name}.next_value()"
@@ -21,6 +21,7 @@ class ModelGenerator(GeneratorBase):
         self.typing_imports = set()
         self.constraint = False
         self.im_index = False
+        self.deferred_import = False
         self.types_mapping = types_mapping
         self.templates = st
         self.prefix = "sa."
@@ -123,9 +124,17 @@ class ModelGenerator(GeneratorBase):
         exceptions: Optional[List] = None,
         schema_global: Optional[bool] = True,
         *args,
+        defer_large_columns: bool = False,
+        deferred_group: Optional[str] = None,
+        deferred_overrides: Optional[Dict[str, List[str]]] = None,
         **kwargs,
     ) -> str:
-        """method to prepare one Model defention - name & tablename  & columns"""
+        """method to prepare one Model defention - name & tablename  & columns
+
+        defer_large_columns=True maps TEXT, BLOB, JSON & VARCHAR without size
+        columns with deferred() in __mapper_args__, deferred_group puts them
+        in one load group, deferred_overrides sets deferred columns per table.
+        """
 
         model = st.model_template.format(
             model_name=create_class_name(table.name, singular, exceptions),
@@ -150,6 +159,17 @@ class ModelGenerator(GeneratorBase):
                 col_str += st.field_template.format(attr_data=attrs_col_str)
             col_str += "\n"
             model += col_str
+        deferred = logic.deferred_columns(
+            table, defer_large_columns, deferred_overrides
+        )
+        if deferred:
+            self.deferred_import = True
+            model += st.deferred_mapper_args.format(
+                names=repr(tuple(deferred)),
+                group=st.deferred_group.format(group=deferred_group)
+                if deferred_group
+                else "",
+            )
         if table.indexes or table.alter or table.checks or not schema_global:
             model = self.add_table_args(model, table, schema_global)
         return model
@@ -180,4 +200,6 @@ class ModelGenerator(GeneratorBase):
             header += st.unique_cons_import + "\n"
         if self.im_index:
             header += st.index_import + "\n"
+        if self.deferred_import:
+            header += st.deferred_import + "\n"
         return header
@@ -9,6 +9,7 @@ sqlalchemy_import = """import sqlalchemy as sa
 """
 
 unique_cons_import = "from sqlalchemy.schema import UniqueConstraint"
+deferred_import = "from sqlalchemy.orm import declared_attr, deferred"
 enum_import = "from enum import {enums}"
 
 # model defenition
@@ -28,6 +29,19 @@ autoincrement = ""
 index = ", index=True"
 sa_type = ", sa_type={satype}"
 
+# SQLModel Field() can not be deferred, so columns are re-mapped with deferred()
+deferred_mapper_args = """
+    @declared_attr
+    def __mapper_args__(cls):
+        return {{
+            "properties": {{
+                name: deferred(cls.__table__.c[name]{group})
+                for name in {names}
+            }}
+        }}
+"""
+deferred_group = ", group='{group}'"
+
 # tables properties
 
 table_args = """
@@ -0,0 +1,350 @@
+from typing import Dict, List, Optional
+
+from table_meta import TableMeta
+from table_meta.model import Column
+
+import omymodels.models.tortoise.templates as tt
+import omymodels.types as t
+from omymodels.dependencies import get_alter_columns
+from omymodels.helpers import create_class_name, datetime_now_check, tuple_literal
+from omymodels.models.tortoise.types import (
+    array_element_types,
+    index_classes,
+    integer_fields,
+    types_mapping,
+)
+from omymodels.sequences import nextval, table_sequence
+
+# NUMERIC without precision - DecimalField requires both arguments
+default_decimal_size = (38, 10)
+on_delete_modes = {
+    "cascade": "CASCADE",
+    "restrict": "RESTRICT",
+    "set null": "SET_NULL",
+    "set default": "SET_DEFAULT",
+    "no action": "NO_ACTION",
+}
+
+
+class ModelGenerator:
+    """Tortoise ORM models generator.
+
+    Foreign key columns become ForeignKeyField (column group_id - field group),
+    reverse relations are named after the table with the foreign key.
+    Tortoise models have exactly one primary key field, tables with composite
+    primary keys or without primary key are skipped with a comment.
+    """
+
+    def __init__(self):
+        self.custom_types = {}
+        self.prefix = ""
+        self.im_index = False
+        self.postgres_index_classes = set()
+        self.array_import = False
+        self.datetime_import = False
+        self.uuid_import = False
+
+    def add_custom_type(self, _type: str) -> Optional[str]:
+        """Enum class name of the custom type"""
+        column_type = self.custom_types.get(_type)
+        if isinstance(column_type, tuple):
+            return column_type[1]
+        return None
+
+    @staticmethod
+    def is_generated(column: Column, table: TableMeta) -> bool:
+        """Values of the column are generated by the database."""
+        return bool(
+            column.type.lower() in ("serial", "bigserial", "smallserial")
+            or (column.generated_as or "").upper() == "IDENTITY"
+            or (column.properties or {}).get("autoincrement")
+            or table_sequence(table, column.name)
+            or nextval.search(str(column.default or ""))
+        )
+
+    @staticmethod
+    def field_arguments(column: Column, field_type: str) -> List[str]:
+        """Size arguments of the field type."""
+        size = column.size
+        if field_type == "CharField":
+            return [f"max_length={size}"]
+        if field_type == "DecimalField":
+            if isinstance(size, tuple):
+                max_digits, decimal_places = size[0], size[1]
+            elif isinstance(size, int):
+                max_digits, decimal_places = size, 0
+            else:
+                max_digits, decimal_places = default_decimal_size
+            return [f"max_digits={max_digits}", f"decimal_places={decimal_places}"]
+        return []
+
+    def get_field_type(self, column: Column) -> str:
+        _type = column.type.lower().split("[")[0]
+        field_type = types_mapping.get(_type, "TextField")
+        if field_type == "CharField" and not isinstance(column.size, int):
+            # CharField requires max_length
+            field_type = "TextField"
+        return field_type
+
+    def column_default(
+        self, column: Column, field_type: str, enum_name: Optional[str] = None
+    ) -> Optional[str]:
+        """default argument of the field, defaults evaluated by the database
+        (sequences & functions) are skipped."""
+        default = column.default
+        if default is None or str(default).upper() == "NULL":
+            return None
+        default = str(default)
+        if field_type in ("DatetimeField", "DateField", "TimeField"):
+            return self.datetime_default(default, field_type)
+        if field_type == "UUIDField":
+            return self.uuid_default(default)
+        if "(" in default:
+            return None
+        return self.literal_default(
+            default.strip("'").replace("''", "'"), field_type, enum_name
+        )
+
+    def datetime_default(self, default: str, field_type: str) -> Optional[str]:
+        """now() & CURRENT_* defaults, other ones are skipped"""
+        if not datetime_now_check(default.lower()):
+            return None
+        if field_type == "DatetimeField":
+            return "auto_now_add=True"
+        if field_type == "DateField":
+            self.datetime_import = True
+            return f"default={tt.date_today}"
+        return None
+
+    def uuid_default(self, default: str) -> Optional[str]:
+        """generated UUIDs (gen_random_uuid(), uuid_generate_v4() & etc.)"""
+        if "(" not in default:
+            return None
+        self.uuid_import = True
+        return f"default={tt.uuid_default}"
+
+    @staticmethod
+    def literal_default(
+        value: str, field_type: str, enum_name: Optional[str] = None
+    ) -> Optional[str]:
+        if enum_name:
+            return f"default={enum_name}({value!r})"
+        if field_type == "BooleanField":
+            return f"default={value.lower() in ('true', 't', '1', 'yes', 'on')}"
+        if field_type in integer_fields + ("FloatField", "DecimalField"):
+            try:
+                float(value)
+            except ValueError:
+                return None
+            return f"default={value}"
+        return f"default={value!r}"
+
+    def generate_field(self, column: Column, table: TableMeta, pk: Optional[str]) -> str:
+        column = t.prepare_column_data(column)
+        enum_name = self.add_custom_type(column.type.split("[")[0]) if self.custom_types else None
+        if enum_name:
+            field_type = "CharEnumField"
+            arguments = [enum_name]
+        else:
+            field_type = self.get_field_type(column)
+            arguments = self.field_arguments(column, field_type)
+        options = []
+        if column.name == pk:
+            options.append("primary_key=True")
+            if field_type in integer_fields and not self.is_generated(column, table):
+                options.append("generated=False")
+        else:
+            if column.nullable:
+                options.append("null=True")
+            if column.unique:
+                options.append("unique=True")
+        if "[" in column.type:
+            self.array_import = True
+            element_type = array_element_types.get(field_type, "text")
+            if field_type == "CharField":
+                element_type = f"varchar({column.size})"
+            arguments = [f"element_type={element_type!r}"]
+            template = tt.array_field_template
+        else:
+            template = tt.field_template
+            default = self.column_default(column, field_type, enum_name)
+            if default and not (column.name == pk and self.is_generated(column, table)):
+                options.append(default)
+        options.extend(self.description(column))
+        return template.format(
+            field_name=column.name,
+            field_type=field_type,
+            arguments=", ".join(arguments + options),
+        )
+
+    @staticmethod
+    def description(column: Column) -> List[str]:
+        if not column.comment:
+            return []
+        comment = column.comment.strip("'")
+        return [f"description={comment!r}"]
+
+    @staticmethod
+    def table_references(table: TableMeta) -> Dict[str, Dict]:
+        """Foreign keys of the table by column: inline & ALTER TABLE references"""
+        references = {
+            column.name: column.references
+            for column in table.columns
+            if column.references and column.references.get("table")
+        }
+        for alter_column in get_alter_columns(table):
+            reference = alter_column.get("references")
+            if reference and reference.get("table"):
+                references.setdefault(alter_column["name"], reference)
+        return references
+
+    @staticmethod
+    def fk_field_name(column_name: str, column_names: List[str]) -> str:
+        """Field name of the foreign key: group_id -> group"""
+        name = column_name[:-3] if column_name.endswith("_id") else column_name
+        if not name or name in column_names and name != column_name:
+            return column_name
+        return name
+
+    def generate_fk(
+        self,
+        column: Column,
+        reference: Dict,
+        table: TableMeta,
+        field_name: str,
+        related_name: str,
+        singular: bool,
+        exceptions: Optional[List],
+        app: str,
+    ) -> str:
+        arguments = [
+            tt.related_model.format(
+                app=app,
+                model_name=create_class_name(reference["table"], singular, exceptions),
+            ),
+            f'related_name="{related_name}"',
+        ]
+        if field_name != column.name[:-3] or not column.name.endswith("_id"):
+            arguments.append(f'source_field="{column.name}"')
+        ref_column = reference.get("column")
+        if ref_column and ref_column != "id":
+            arguments.append(f'to_field="{ref_column}"')
+        # tortoise cascades by default, SQL default is NO ACTION
+        on_delete = on_delete_modes.get((reference.get("on_delete") or "no action").lower())
+        if on_delete:
+            arguments.append(f"on_delete=fields.{on_delete}")
+        if column.nullable and column.name not in table.primary_key:
+            arguments.append("null=True")
+        if column.unique:
+            arguments.append("unique=True")
+        arguments.extend(self.description(column))
+        return tt.fk_template.format(field_name=field_name, arguments=", ".join(arguments))
+
+    def generate_meta(self, table: TableMeta, field_keys: Dict[str, str]) -> str:
+        options = {"table": f'"{table.name}"'}
+        if table.table_schema:
+            options["schema"] = f'"{table.table_schema}"'
+        unique_together = []
+        indexes = []
+        for index in table.indexes or []:
+            fields = tuple_literal([f'"{field_keys.get(name, name)}"' for name in index["columns"]])
+            if index["unique"]:
+                unique_together.append(index["columns"])
+                continue
+            index_class = index_classes.get(index.get("using") or "", "Index")
+            if index_class == "Index":
+                self.im_index = True
+            else:
+                self.postgres_index_classes.add(index_class)
+            indexes.append(
+                tt.index_template.format(
+                    index_class=index_class, fields=fields, name=f'"{index["index_name"]}"'
+                )
+            )
+        if unique_together:
+            options["unique_together"] = tuple_literal(
+                [
+                    tuple_literal([f'"{field_keys.get(name, name)}"' for name in columns])
+                    for columns in dict.fromkeys(map(tuple, unique_together))
+                ]
+            )
+        if indexes:
+            options["indexes"] = tuple_literal(indexes)
+        return tt.meta_template.format(
+            options="".join(
+                tt.meta_option.format(name=name, value=value) for name, value in options.items()
+            )
+        )
+
+    @staticmethod
+    def skip_reason(table: TableMeta) -> Optional[str]:
+        """Why the table can not be a Tortoise model, None if it can."""
+        if not table.primary_key:
+            return "no primary key (Tortoise ORM adds an implicit 'id' field)"
+        if len(table.primary_key) > 1:
+            return "composite primary key (not supported by Tortoise ORM)"
+        return None
+
+    def generate_model(
+        self,
+        table: TableMeta,
+        singular: bool = True,
+        exceptions: Optional[List] = None,
+        *args,
+        app: str = "models",
+        **kwargs,
+    ) -> str:
+        """Generate Tortoise ORM model for the table.
+
+        app - app label of related models in ForeignKeyField("app.Model").
+        Defaults are Python side: tortoise does not create DEFAULT in
+        the database, now() becomes auto_now_add=True.
+        """
+        reason = self.skip_reason(table)
+        if reason:
+            return tt.skipped_model_template.format(table_name=table.name, reason=reason)
+        model = tt.model_template.format(
+            model_name=create_class_name(table.name, singular, exceptions)
+        )
+        pk = table.primary_key[0]
+        references = self.table_references(table)
+        column_names = [column.name for column in table.columns]
+        targets = [reference["table"] for reference in references.values()]
+        # index & unique_together fields of foreign keys are <field>_id keys
+        field_keys = {}
+        for column in table.columns:
+            reference = references.get(column.name)
+            if not reference or column.name == pk:
+                model += self.generate_field(column, table, pk)
+                continue
+            field_name = self.fk_field_name(column.name, column_names)
+            field_keys[column.name] = f"{field_name}_id"
+            related_name = table.name
+            if targets.count(reference["table"]) > 1:
+                related_name = f"{field_name}_{table.name}"
+            model += self.generate_fk(
+                column, reference, table, field_name, related_name, singular, exceptions, app
+            )
+        model += self.generate_meta(table, field_keys)
+        return model
+
+    def create_header(self, *args, **kwargs) -> str:
+        header = ""
+        if self.datetime_import:
+            header += tt.datetime_import + "\n"
+        if self.uuid_import:
+            header += tt.uuid_import + "\n"
+        header += tt.fields_import + "\n"
+        header += tt.model_import + "\n"
+        if self.im_index:
+            header += tt.index_import + "\n"
+        if self.postgres_index_classes:
+            header += (
+                tt.postgres_index_import.format(
+                    classes=", ".join(sorted(self.postgres_index_classes))
+                )
+                + "\n"
+            )
+        if self.array_import:
+            header += tt.array_import + "\n"
+        return header.rstrip("\n")
@@ -0,0 +1,31 @@
+# imports
+fields_import = "from tortoise import fields"
+model_import = "from tortoise.models import Model"
+index_import = "from tortoise.indexes import Index"
+postgres_index_import = "from tortoise.contrib.postgres.indexes import {classes}"
+array_import = "from tortoise.contrib.postgres.fields import ArrayField"
+datetime_import = "import datetime"
+uuid_import = "from uuid import uuid4"
+
+# model definition
+model_template = """\n
+class {model_name}(Model):
+"""
+field_template = """    {field_name} = fields.{field_type}({arguments})\n"""
+array_field_template = """    {field_name} = ArrayField({arguments})\n"""
+fk_template = """    {field_name} = fields.ForeignKeyField({arguments})\n"""
+related_model = '"{app}.{model_name}"'
+skipped_model_template = """\n
+# {table_name} is skipped: {reason}
+"""
+
+# Meta
+meta_template = """
+    class Meta:
+{options}"""
+meta_option = """        {name} = {value}\n"""
+index_template = """{index_class}(fields={fields}, name={name})"""
+
+# defaults
+date_today = "datetime.date.today"
+uuid_default = "uuid4"
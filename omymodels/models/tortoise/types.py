@@ -0,0 +1,63 @@
+from omymodels.types import (
+    big_integer_types,
+    binary_types,
+    boolean_types,
+    float_types,
+    integer_types,
+    json_types,
+    numeric_types,
+    populate_types_mapping,
+    string_types,
+    text_types,
+)
+
+mapper = {
+    string_types: "CharField",
+    integer_types: "IntField",
+    big_integer_types: "BigIntField",
+    float_types: "FloatField",
+    numeric_types: "DecimalField",
+    boolean_types: "BooleanField",
+    json_types: "JSONField",
+    text_types: "TextField",
+    binary_types: "BinaryField",
+}
+
+types_mapping = populate_types_mapping(mapper)
+
+direct_types = {
+    "date": "DateField",
+    "timestamp": "DatetimeField",
+    "timestamptz": "DatetimeField",
+    "datetime": "DatetimeField",
+    "time": "TimeField",
+    "interval": "TimeDeltaField",
+    "smallint": "SmallIntField",
+    "double": "FloatField",
+    "double precision": "FloatField",
+    "bytea": "BinaryField",
+    "uuid": "UUIDField",
+}
+
+types_mapping.update(direct_types)
+
+# integer fields, primary keys of these types are generated by default
+integer_fields = ("IntField", "BigIntField", "SmallIntField")
+# SQL types of ArrayField elements
+array_element_types = {
+    "IntField": "int",
+    "BigIntField": "bigint",
+    "SmallIntField": "smallint",
+    "FloatField": "double precision",
+    "BooleanField": "boolean",
+    "UUIDField": "uuid",
+}
+# PostgreSQL index classes of tortoise.contrib.postgres.indexes by USING method
+index_classes = {
+    "gin": "GinIndex",
+    "gist": "GistIndex",
+    "brin": "BrinIndex",
+    "hash": "HashIndex",
+    "spgist": "SpGistIndex",
+    "bloom": "BloomIndex",
+}
@@ -0,0 +1,57 @@
+from typing import List, Optional
+
+from table_meta import TableMeta
+from table_meta.model import Column
+
+import omymodels.types as t
+from omymodels.generation import DataModelGenerator
+from omymodels.helpers import create_class_name
+from omymodels.models.dataclass.types import types_mapping
+from omymodels.models.typeddict import templates as tt
+
+
+class ModelGenerator(DataModelGenerator):
+    """typing.TypedDict generator for dict-shaped rows (no runtime overhead)."""
+
+    def __init__(self):
+        super().__init__()
+        self.types_for_import = ["Union[dict, list]"]
+
+    def get_type(self, column: Column) -> str:
+        _type = self.get_python_type(column, types_mapping)
+        if column.nullable:
+            self.typing_imports.add("Optional")
+            _type = tt.optional_type.format(type=_type)
+        return _type
+
+    def generate_model(
+        self,
+        table: TableMeta,
+        singular: bool = True,
+        exceptions: Optional[List] = None,
+        *args,
+        total: bool = True,
+        **kwargs,
+    ) -> str:
+        """total=False makes all keys optional (rows with part of columns)."""
+        model = "\n\n"
+        model += (
+            tt.typeddict_class.format(
+                class_name=create_class_name(table.name, singular, exceptions),
+                options="" if total else ", total=False",
+            )
+            + "\n\n"
+        )
+        for column in table.columns:
+            column = t.prepare_column_data(column)
+            model += (
+                tt.typeddict_attr.format(arg_name=column.name, type=self.get_type(column))
+                + "\n"
+            )
+        return model
+
+    def create_header(self, *args, **kwargs) -> str:
+        self.typing_imports.add("TypedDict")
+        return self.build_header_imports(
+            tt.uuid_import, tt.datetime_import, tt.typing_imports
+        )
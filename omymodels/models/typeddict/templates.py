@@ -0,0 +1,7 @@
+datetime_import = """import datetime"""
+typing_imports = """from typing import {typing_types}"""
+uuid_import = """from uuid import UUID"""
+
+typeddict_class = """class {class_name}(TypedDict{options}):"""
+typeddict_attr = """    {arg_name}: {type}"""
+optional_type = """Optional[{type}]"""
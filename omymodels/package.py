@@ -0,0 +1,194 @@
+"""Helpers for package output mode: one module per table or per schema.
+
+Generated package has an `__init__.py` that imports models lazily with
+module level `__getattr__` (PEP 562), so importing one model does not
+import all others.
+"""
+
+import keyword
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+from jinja2 import Template
+
+from omymodels.helpers import create_class_name
+
+# generators that can be split into package modules
+package_models = (
+    "sqlalchemy",
+    "sqlalchemy_v2",
+    "pydantic",
+    "pydantic_v2",
+    "dataclass",
+    "msgspec",
+    "namedtuple",
+    "typeddict",
+    "tortoise",
+)
+# generators that need one shared declarative Base
+orm_package_models = ("sqlalchemy", "sqlalchemy_v2")
+
+base_module = "base"
+enums_module = "enums"
+default_schema_module = "models"
+reserved_modules = (base_module, enums_module, "__init__")
+
+future_annotations = "from __future__ import annotations"
+base_import = "from .base import Base"
+relative_import = "from .{module} import {names}"
+type_checking_block = """
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+{imports}
+"""
+type_checking_import = "    from .{module} import {names}"
+# relationship("Model") strings are resolved by class name when mappers are
+# configured, so base.py imports all modules right before that (not on import)
+models_loader_imports = """from importlib import import_module
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+"""
+models_loader = """
+
+@event.listens_for(Mapper, "before_configured")
+def _load_models() -> None:
+    \"\"\"Import all models of the package, so related models in other modules
+    are registered before relationships are resolved.\"\"\"
+    import_module(__package__).load_all()
+"""
+
+init_template = Template('''"""Generated models. Each model is imported on first access."""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_models = {
+{%- for name, module in models %}
+    "{{ name }}": ".{{ module }}",
+{%- endfor %}
+}
+
+__all__ = [
+{%- for name, _ in models %}
+    "{{ name }}",
+{%- endfor %}
+]
+
+if TYPE_CHECKING:
+{%- for name, module in models %}
+    from .{{ module }} import {{ name }}
+{%- endfor %}
+
+
+def __getattr__(name: str):
+    module = _models.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def load_all() -> None:
+    """Import all modules, for example before metadata.create_all()."""
+    for module in sorted(set(_models.values())):
+        import_module(module, __name__)
+''')
+
+
+def check_package_options(models_type: str, package_mode: str) -> None:
+    if models_type not in package_models:
+        raise ValueError(
+            f"Package output is not supported for {models_type!r}. "
+            f"Supported model types: {list(package_models)}"
+        )
+    if package_mode not in ("table", "schema"):
+        raise ValueError(
+            f"Unsupported package_mode {package_mode!r}, use 'table' or 'schema'"
+        )
+
+
+def related_models(
+    relationships: List[Dict],
+    module: str,
+    table_modules: Dict[str, str],
+    singular: bool = False,
+    exceptions: Optional[List] = None,
+) -> Dict[str, Set[str]]:
+    """Class names of related models from other modules: {module: names}."""
+    related = {}
+    for rel in relationships:
+        target = rel.get("ref_table") or rel["child_table"]
+        target_module = table_modules.get(target)
+        if target_module and target_module != module:
+            related.setdefault(target_module, set()).add(
+                create_class_name(target, singular, exceptions)
+            )
+    return related
+
+
+def module_header(
+    header: str, models: str, enum_names: List[str], related: Dict[str, Set[str]]
+) -> str:
+    """Generator header with imports of enums & TYPE_CHECKING imports of related models."""
+    if header and not header.endswith("\n"):
+        header += "\n"
+    used_enums = names_used_in(models, enum_names)
+    if used_enums:
+        header += relative_import.format(module=enums_module, names=", ".join(used_enums)) + "\n"
+    if related:
+        header += type_checking_block.format(
+            imports=group_imports(related, type_checking_import)
+        )
+    return header
+
+
+def add_models_loader(base_code: str) -> str:
+    """Base module that imports all models before mappers are configured."""
+    return models_loader_imports + base_code.rstrip("\n") + "\n" + models_loader
+
+
+def module_name(name: str) -> str:
+    """Convert table or schema name to a valid module name."""
+    name = re.sub(r"\W", "_", name).lower() or default_schema_module
+    if name[0].isdigit() or keyword.iskeyword(name) or name in reserved_modules:
+        name = f"{name}_models"
+    return name
+
+
+def add_future_annotations(code: str) -> str:
+    """Put `from __future__ import annotations` on the top of the module."""
+    code = code.replace(future_annotations + "\n", "")
+    return f"{future_annotations}\n\n{code.lstrip()}"
+
+
+def names_used_in(code: str, names: Iterable[str]) -> List[str]:
+    return sorted(name for name in names if re.search(rf"\b{name}\b", code))
+
+
+def group_imports(names_by_module: Dict[str, Iterable[str]], template: str) -> str:
+    return "\n".join(
+        template.format(module=module, names=", ".join(sorted(names)))
+        for module, names in sorted(names_by_module.items())
+    )
+
+
+def create_init(models: Dict[str, str]) -> str:
+    """`__init__.py` with lazy access to models: {model_name: module_name}."""
+    return init_template.render(models=sorted(models.items()))
+
+
+def save_models_package(modules: Dict[str, str], dump_path: str) -> None:
+    """Save package modules to folder named as dump_path without extension."""
+    folder = os.path.splitext(dump_path)[0]
+    os.makedirs(folder, exist_ok=True)
+    for name, code in modules.items():
+        with open(os.path.join(folder, f"{name}.py"), "w+") as f:
+            f.write(code)
@@ -0,0 +1,76 @@
+"""Table partitioning: PARTITION BY of parent tables & PARTITION OF children."""
+
+import re
+from typing import Dict, List, Optional
+
+create_partition = re.compile(
+    r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?P<name>[\w\"`.]+)\s+"
+    r"PARTITION\s+OF\s+(?P<parent>[\w\"`.]+)\s*(?P<bound>[^;]*);",
+    re.IGNORECASE,
+)
+
+
+def _split_name(name: str) -> List[str]:
+    return [part.strip('"`') for part in name.split(".")]
+
+
+def parse_partition_statements(ddl: str) -> List[Dict]:
+    """CREATE TABLE ... PARTITION OF ... statements (the DDL parser skips them).
+
+    bound - partition bound as in DDL: FOR VALUES ... or DEFAULT,
+    with PARTITION BY of the child if it is partitioned itself.
+    """
+    result = []
+    for match in create_partition.finditer(ddl):
+        name, parent = _split_name(match.group("name")), _split_name(match.group("parent"))
+        result.append(
+            {
+                "table_name": name[-1],
+                "schema": name[0] if len(name) > 1 else None,
+                "parent": parent[-1],
+                "parent_schema": parent[0] if len(parent) > 1 else None,
+                "bound": " ".join(match.group("bound").split()),
+            }
+        )
+    return result
+
+
+def add_partitions(tables: List[Dict], ddl: str) -> List[Dict]:
+    """Collapse child partitions into the partitioned (root) table.
+
+    Children are removed from tables and listed in the root table "partitions"
+    in DDL order, sub-partitions go to the same root table.
+    """
+    statements = parse_partition_statements(ddl)
+    if not statements:
+        return tables
+    parents = {statement["table_name"]: statement["parent"] for statement in statements}
+    by_name = {table["table_name"]: table for table in tables}
+    for statement in statements:
+        root = statement["parent"]
+        while root in parents:
+            root = parents[root]
+        if root in by_name:
+            by_name[root].setdefault("partitions", []).append(statement)
+    return [table for table in tables if table["table_name"] not in parents]
+
+
+def partition_by(table) -> Optional[str]:
+    """PARTITION BY clause of the table, for example: RANGE (created_at)"""
+    partition = getattr(table, "partition_by", None)
+    if not partition:
+        return None
+    return f"{partition['type'].upper()} ({', '.join(partition['columns'])})"
+
+
+def partition_statements(table) -> List[str]:
+    """CREATE TABLE ... PARTITION OF ... statements for partitions of the table."""
+    statements = []
+    for partition in getattr(table, "partitions", None) or []:
+        name, parent = partition["table_name"], partition["parent"]
+        if partition["schema"]:
+            name = f"{partition['schema']}.{name}"
+        if partition["parent_schema"]:
+            parent = f"{partition['parent_schema']}.{parent}"
+        statements.append(f"CREATE TABLE {name} PARTITION OF {parent} {partition['bound']}")
+    return statements
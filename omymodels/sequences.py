@@ -0,0 +1,72 @@
+"""Sequences from CREATE SEQUENCE and columns with nextval('...') defaults."""
+
+import re
+from typing import Dict, List, Optional
+
+nextval = re.compile(r"nextval\(\s*'(?P<name>[^']+)'", re.IGNORECASE)
+
+# Sequence() argument: keys of the parser output
+sequence_options = {
+    "start": ("start_with", "start"),
+    "increment": ("increment_by", "increment"),
+    "minvalue": ("minvalue",),
+    "maxvalue": ("maxvalue",),
+    "cache": ("cache",),
+}
+
+
+def normalize_sequence(sequence: Dict) -> Dict:
+    """Sequence name, schema & numeric options (parser reports NO MAXVALUE as False
+    and puts keywords after CACHE n as its value - such options are skipped)."""
+    result = {"name": sequence["sequence_name"], "schema": sequence.get("schema")}
+    for option, keys in sequence_options.items():
+        for key in keys:
+            value = sequence.get(key)
+            if isinstance(value, int) and not isinstance(value, bool):
+                result[option] = value
+                break
+    return result
+
+
+def column_sequences(table: Dict, sequences: List[Dict]) -> Dict[str, Dict]:
+    """Sequences used by columns of the table in nextval('...') defaults,
+    sequences without CREATE SEQUENCE in DDL get only name & schema."""
+    by_name = {}
+    for sequence in sequences:
+        by_name[(sequence["schema"], sequence["name"])] = sequence
+        by_name.setdefault((None, sequence["name"]), sequence)
+    result = {}
+    for column in table["columns"]:
+        match = nextval.search(str(column.get("default") or ""))
+        if not match:
+            continue
+        *schema, name = match.group("name").replace('"', "").split(".")
+        schema = schema[0] if schema else None
+        result[column["name"]] = by_name.get(
+            (schema, name), {"name": name, "schema": schema}
+        )
+    return result
+
+
+def sequence_var_name(sequence: Dict) -> str:
+    """Module variable of the Sequence(), schema is a part of it - sequences with
+    the same name in different schemas are different objects: a.seq -> a_seq"""
+    name = ".".join(filter(None, (sequence.get("schema"), sequence["name"])))
+    return re.sub(r"\W", "_", name)
+
+
+def sequence_arguments(sequence: Dict) -> str:
+    """Sequence() arguments, for example: 'orders_id_seq', start=1000, cache=50"""
+    arguments = [repr(sequence["name"])]
+    arguments.extend(
+        f"{option}={sequence[option]}"
+        for option in sequence_options
+        if sequence.get(option) is not None
+    )
+    if sequence.get("schema"):
+        arguments.append(f"schema={sequence['schema']!r}")
+    return ", ".join(arguments)
+
+
+def table_sequence(table, column_name: str) -> Optional[Dict]:
+    return (getattr(table, "sequences", None) or {}).get(column_name)
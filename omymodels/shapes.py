@@ -0,0 +1,92 @@
+"""Structural deduplication: tables with identical columns (sharded, monthly or
+per-tenant copies) share one abstract base model with the columns."""
+
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from table_meta.model import TableMeta
+
+from omymodels.dependencies import get_alter_columns
+from omymodels.helpers import create_class_name
+from omymodels.logic import deferred_columns
+
+
+def shape_references(
+    table: TableMeta, structure: Dict, schema_global: bool = True
+) -> Dict:
+    """References to the own schema of the table are kept without schema
+    (per-tenant copies refer each to its own schema). With schema_global=False
+    references are generated with the schema, so they stay a part of the shape."""
+    references = structure.get("references")
+    if schema_global and references and references.get("schema") == table.table_schema:
+        structure = {**structure, "references": {**references, "schema": None}}
+    return structure
+
+
+def table_shape(
+    table: TableMeta, schema_global: bool = True, deferred: Optional[List[str]] = None
+) -> str:
+    """Hash of the normalized table structure: columns, ALTER TABLE foreign keys,
+    primary key, sequences & deferred columns - everything the base model has.
+
+    Table name, schema, indexes and table options are not a part of the shape,
+    they stay in the models of each table.
+    """
+    structure = {
+        "columns": [
+            shape_references(table, column.dict(), schema_global) for column in table.columns
+        ],
+        "alter": [
+            shape_references(table, alter_column, schema_global)
+            for alter_column in get_alter_columns(table)
+        ],
+        "primary_key": table.primary_key,
+        "sequences": getattr(table, "sequences", None) or {},
+        "deferred": sorted(deferred or []),
+    }
+    return hashlib.sha1(
+        json.dumps(structure, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def shape_base_name(
+    tables: List[TableMeta], singular: bool = False, exceptions: Optional[List] = None
+) -> str:
+    """Class name of the shared base: common prefix of table names, for example,
+    events_2024_01 & events_2024_02 -> EventsBase"""
+    prefix = os.path.commonprefix([table.name for table in tables])
+    prefix = re.sub(r"[\W\d_]+$", "", prefix) or tables[0].name
+    return create_class_name(prefix, singular, exceptions) + "Base"
+
+
+def group_tables_by_shape(
+    tables: List[TableMeta],
+    singular: bool = False,
+    exceptions: Optional[List] = None,
+    schema_global: bool = True,
+    defer_large_columns: bool = False,
+    deferred_overrides: Optional[Dict[str, List[str]]] = None,
+) -> Dict[Tuple[Optional[str], str], str]:
+    """Base class name by (schema, table name) for each table that has
+    the same shape as at least one other table."""
+    shapes = {}
+    for table in tables:
+        deferred = deferred_columns(table, defer_large_columns, deferred_overrides)
+        shapes.setdefault(table_shape(table, schema_global, deferred), []).append(table)
+    taken = {create_class_name(table.name, singular, exceptions) for table in tables}
+    result = {}
+    for shape_tables in shapes.values():
+        if len(shape_tables) < 2:
+            continue
+        name = base_name = shape_base_name(shape_tables, singular, exceptions)
+        number = 1
+        while name in taken:
+            number += 1
+            name = f"{base_name}{number}"
+        taken.add(name)
+        for table in shape_tables:
+            result[(table.table_schema, table.name)] = name
+    return result
@@ -0,0 +1,93 @@
+"""Physical storage options of tables: PostgreSQL WITH (...), UNLOGGED & TABLESPACE,
+MySQL ENGINE, ROW_FORMAT & KEY_BLOCK_SIZE, SQLite WITHOUT ROWID & STRICT."""
+
+import re
+from typing import Dict, List, Set
+
+create_unlogged_table = re.compile(
+    r"CREATE\s+UNLOGGED\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?P<name>[\w\"`.]+)",
+    re.IGNORECASE,
+)
+mysql_options = ("engine", "row_format", "key_block_size")
+
+
+def _value(value: str):
+    return int(value) if str(value).isdigit() else value
+
+
+def _postgresql_storage(table: Dict, unlogged: Set[str]) -> Dict:
+    """WITH (...), UNLOGGED & TABLESPACE"""
+    storage = {}
+    properties = table.get("table_properties") or {}
+    with_options = (properties.get("with") or {}).get("properties") or []
+    # MS SQL WITH (...) of PRIMARY KEY CLUSTERED is an index option
+    if with_options and "clustered_primary_key" not in properties:
+        storage["with"] = {option["name"]: _value(option["value"]) for option in with_options}
+    if table["table_name"] in unlogged:
+        storage["unlogged"] = True
+    if isinstance(table.get("tablespace"), dict):
+        table["tablespace"] = table["tablespace"].get("tablespace_name")
+    if table.get("tablespace"):
+        storage["tablespace"] = table["tablespace"]
+    return storage
+
+
+def _mysql_storage(table: Dict) -> Dict:
+    """ENGINE, ROW_FORMAT & KEY_BLOCK_SIZE"""
+    properties = table.get("table_properties") or {}
+    return {option: str(properties[option]) for option in mysql_options if properties.get(option)}
+
+
+def _sqlite_storage(table: Dict) -> Dict:
+    """WITHOUT ROWID & STRICT"""
+    storage = {}
+    properties = table.get("table_properties") or {}
+    if str(properties.get("without", "")).upper() == "ROWID":
+        storage["without_rowid"] = True
+    if table.get("checks") == "STRICT":
+        table["checks"] = []
+        storage["strict"] = True
+    elif "strict" in properties:
+        storage["strict"] = True
+    return storage
+
+
+def add_storage_options(tables: List[Dict], ddl: str) -> List[Dict]:
+    """Collect storage options of tables from DDL parser output to table "storage".
+
+    Also normalizes parser output that TableMeta can not validate:
+    TABLESPACE (dict with tablespace_name) and STRICT (reported as checks).
+    """
+    unlogged = {
+        match.group("name").split(".")[-1].strip('"`')
+        for match in create_unlogged_table.finditer(ddl)
+    }
+    for table in tables:
+        storage = {
+            **_postgresql_storage(table, unlogged),
+            **_mysql_storage(table),
+            **_sqlite_storage(table),
+        }
+        if storage:
+            table["storage"] = storage
+    return tables
+
+
+def storage_kwargs(table) -> Dict[str, str]:
+    """Table() arguments for storage options of the table (values as code)."""
+    storage = getattr(table, "storage", None) or {}
+    kwargs = {}
+    if storage.get("unlogged"):
+        kwargs["prefixes"] = "['UNLOGGED']"
+    if storage.get("with"):
+        kwargs["postgresql_with"] = repr(storage["with"])
+    if storage.get("tablespace"):
+        kwargs["postgresql_tablespace"] = repr(storage["tablespace"])
+    for option in mysql_options:
+        if storage.get(option):
+            kwargs[f"mysql_{option}"] = repr(storage[option])
+    if storage.get("without_rowid"):
+        kwargs["sqlite_with_rowid"] = "False"
+    if storage.get("strict"):
+        kwargs["sqlite_strict"] = "True"
+    return kwargs
@@ -0,0 +1,72 @@
+"""Tests for async_mode option of sqlalchemy_v2 generator."""
+
+import pytest
+
+from omymodels import create_models
+
+ddl = """
+CREATE TABLE authors (id SERIAL PRIMARY KEY, name TEXT NOT NULL);
+CREATE TABLE books (
+    id INT PRIMARY KEY,
+    author_id INT REFERENCES authors (id),
+    created_at TIMESTAMP DEFAULT now()
+);
+CREATE TABLE tags (id INT PRIMARY KEY, label TEXT);
+"""
+
+
+def generate(**options):
+    return create_models(
+        ddl,
+        models_type="sqlalchemy_v2",
+        dump=False,
+        relationships=True,
+        generator_options={"async_mode": True, **options},
+    )["code"]
+
+
+def test_async_base():
+    code = generate()
+    assert "from sqlalchemy.ext.asyncio import AsyncAttrs\n" in code
+    assert "class Base(AsyncAttrs, DeclarativeBase):" in code
+
+
+def test_async_relationships_do_not_load_implicitly():
+    code = generate()
+    assert 'relationship("Books", back_populates="author", lazy="raise")' in code
+    assert 'relationship("Authors", back_populates="books", lazy="selectin")' in code
+
+
+def test_async_loading_options():
+    code = generate(lazy_one_to_many="selectin", lazy_overrides={"books": {"many_to_one": "joined"}})
+    assert 'relationship("Books", back_populates="author", lazy="selectin")' in code
+    assert 'relationship("Authors", back_populates="books", lazy="joined")' in code
+    with pytest.raises(ValueError):
+        generate(lazy_many_to_one="select")
+
+
+def test_eager_defaults_for_server_defaults():
+    code = generate()
+    eager_defaults = '    __mapper_args__ = {"eager_defaults": True}\n'
+    authors, books, tags = code.split("\nclass ")[2:]
+    assert eager_defaults in authors
+    assert eager_defaults in books
+    assert "__mapper_args__" not in tags
+
+
+def test_no_async_by_default():
+    code = create_models(ddl, models_type="sqlalchemy_v2", dump=False)["code"]
+    assert "AsyncAttrs" not in code
+    assert "__mapper_args__" not in code
+
+
+def test_async_base_in_package_mode():
+    modules = create_models(
+        ddl,
+        models_type="sqlalchemy_v2",
+        dump=False,
+        package_mode="table",
+        generator_options={"async_mode": True},
+    )["code"]
+    assert "class Base(AsyncAttrs, DeclarativeBase):" in modules["base"]
+    assert "AsyncAttrs" not in modules["books"]
@@ -0,0 +1,129 @@
+import pytest
+
+from omymodels import create_models
+
+ddl = """
+CREATE TYPE "status" AS ENUM ('blocked', 'active');
+
+CREATE TABLE events (
+    id BIGINT PRIMARY KEY,
+    kind VARCHAR(32) NOT NULL,
+    status status,
+    amount NUMERIC(12, 2) NOT NULL,
+    total NUMERIC(50, 4),
+    ratio REAL,
+    flag BOOLEAN NOT NULL,
+    tags VARCHAR(16)[],
+    payload JSONB,
+    day DATE,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMPTZ
+);
+"""
+
+def test_pyarrow_schema():
+    result = create_models(ddl, models_type="pyarrow", dump=False)["code"]
+    expected = """import pyarrow as pa
+
+
+events_schema = pa.schema(
+    [
+        pa.field("id", pa.int64(), nullable=False),
+        pa.field("kind", pa.string(), nullable=False),
+        pa.field("status", pa.dictionary(pa.int8(), pa.string())),
+        pa.field("amount", pa.decimal128(12, 2), nullable=False),
+        pa.field("total", pa.decimal256(50, 4)),
+        pa.field("ratio", pa.float32()),
+        pa.field("flag", pa.bool_(), nullable=False),
+        pa.field("tags", pa.list_(pa.string())),
+        pa.field("payload", pa.large_string()),
+        pa.field("day", pa.date32()),
+        pa.field("created_at", pa.timestamp("us"), nullable=False),
+        pa.field("updated_at", pa.timestamp("us", tz="UTC")),
+    ]
+)
+"""
+    assert result == expected
+
+
+def test_polars_schema():
+    result = create_models(ddl, models_type="polars", dump=False)["code"]
+    expected = """import polars as pl
+
+
+events_schema = pl.Schema(
+    {
+        "id": pl.Int64,
+        "kind": pl.String,
+        "status": pl.Enum(['active', 'blocked']),
+        "amount": pl.Decimal(12, 2),
+        "total": pl.String,
+        "ratio": pl.Float32,
+        "flag": pl.Boolean,
+        "tags": pl.List(pl.String),
+        "payload": pl.String,
+        "day": pl.Date,
+        "created_at": pl.Datetime("us"),
+        "updated_at": pl.Datetime("us", "UTC"),
+    }
+)
+"""
+    assert result == expected
+
+
+def test_polars_as_dict():
+    result = create_models(
+        ddl, models_type="polars", dump=False, generator_options={"as_dict": True}
+    )["code"]
+    assert 'events_schema = {\n    "id": pl.Int64,\n' in result
+    assert "pl.Schema" not in result
+
+
+def test_pandas_dtypes():
+    result = create_models(ddl, models_type="pandas", dump=False)["code"]
+    expected = """import pandas as pd
+
+
+events_dtypes = {
+    "id": "int64",
+    "kind": "string",
+    "status": pd.CategoricalDtype(['active', 'blocked']),
+    "amount": "object",
+    "total": "object",
+    "ratio": "Float32",
+    "flag": "bool",
+    "tags": "object",
+    "payload": "object",
+}
+events_parse_dates = ['day', 'created_at', 'updated_at']
+"""
+    assert result == expected
+
+
+def test_pandas_pyarrow_backend():
+    result = create_models(
+        ddl,
+        models_type="pandas",
+        dump=False,
+        generator_options={"dtype_backend": "pyarrow"},
+    )["code"]
+    assert "import pandas as pd\nimport pyarrow as pa\n" in result
+    assert '"amount": pd.ArrowDtype(pa.decimal128(12, 2)),' in result
+    assert '"status": pd.CategoricalDtype([\'active\', \'blocked\']),' in result
+
+
+def test_pandas_unknown_dtype_backend():
+    with pytest.raises(ValueError, match="dtype_backend"):
+        create_models(
+            ddl,
+            models_type="pandas",
+            dump=False,
+            generator_options={"dtype_backend": "numpy"},
+        )
+
+
+def test_enum_values_by_schema():
+    result = create_models(
+        ddl, models_type="polars", dump=False, split_by_schema=True
+    )["code"][""]
+    assert "\"status\": pl.Enum(['active', 'blocked'])," in result
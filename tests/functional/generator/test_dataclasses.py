@@ -1,3 +1,5 @@
+import pytest
+
 from omymodels import create_models
 
 
@@ -236,3 +238,122 @@ class Material:
     """
     result = create_models(ddl, models_type="dataclass")["code"]
     assert expected == result
+
+
+def test_dataclass_slots_frozen_kw_only():
+    expected = """import datetime
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Events:
+
+    id: int
+    name: str = None
+    created_at: datetime.datetime = field(default_factory=datetime.datetime.now)
+"""
+
+    ddl = """
+    CREATE TABLE events (
+        id integer NOT NULL,
+        name varchar(100),
+        created_at timestamp DEFAULT now()
+    );
+    """
+    result = create_models(
+        ddl,
+        models_type="dataclass",
+        generator_options={
+            "slots": True,
+            "frozen": True,
+            "kw_only": True,
+            "target_python": "3.10",
+        },
+    )["code"]
+    assert expected == result
+
+
+def test_dataclass_slots_fallback_for_old_python():
+    ddl = """
+    CREATE TABLE events (
+        id integer NOT NULL,
+        name varchar(100)
+    );
+    """
+    result = create_models(
+        ddl,
+        models_type="dataclass",
+        generator_options={"slots": True, "target_python": "3.9"},
+    )["code"]
+    assert "from dataclasses import dataclass, fields\n\n\ndef _add_slots(cls):" in result
+    assert "def _add_slots(cls):" in result
+    assert '    cls_dict["__slots__"] = field_names\n' in result
+    assert "@_add_slots\n@dataclass\nclass Events:" in result
+
+
+def test_dataclass_kw_only_requires_python_310():
+    ddl = "CREATE TABLE events (id integer NOT NULL);"
+    with pytest.raises(ValueError, match="kw_only"):
+        create_models(
+            ddl,
+            models_type="dataclass",
+            generator_options={"kw_only": True, "target_python": "3.9"},
+        )
+
+
+def test_dataclass_row_constructors():
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER NOT NULL,
+        email VARCHAR(255),
+        name VARCHAR(50) NOT NULL
+    );
+    """
+    result = create_models(
+        ddl, models_type="dataclass", generator_options={"row_constructors": True}
+    )["code"]
+    assert "from typing import Callable, Iterable, List, Sequence\n" in result
+    # fields with defaults go last - values are reordered from columns order
+    expected = '''
+    __columns__ = ("id", "email", "name")
+
+    @classmethod
+    def from_row(cls, row: Sequence) -> "Users":
+        return cls(
+            row[0],
+            row[2],
+            row[1],
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> List["Users"]:
+        from_row = cls.from_row
+        return [from_row(row) for row in rows]
+
+    @classmethod
+    def row_factory(cls, cursor) -> Callable[[Sequence], "Users"]:
+        """psycopg row factory: connection.cursor(row_factory=Users.row_factory)"""
+        names = tuple(column.name for column in cursor.description)
+        if names == cls.__columns__:
+            return cls.from_row
+        return lambda values: cls(**dict(zip(names, values)))
+'''
+    assert result.endswith(expected)
+
+
+def test_dataclass_row_constructors_columns_order():
+    ddl = "CREATE TABLE users (id INTEGER NOT NULL, name VARCHAR(50));"
+    result = create_models(
+        ddl, models_type="dataclass", generator_options={"row_constructors": True}
+    )["code"]
+    assert "        return cls(*row)\n" in result
+    result = create_models(
+        ddl,
+        models_type="dataclass",
+        generator_options={
+            "row_constructors": True,
+            "kw_only": True,
+            "target_python": "3.10",
+        },
+    )["code"]
+    assert "        return cls(\n            id=row[0],\n            name=row[1],\n        )\n" in result
@@ -0,0 +1,101 @@
+"""Tests for dedup_tables mode: shared abstract base models for identical tables."""
+
+import pytest
+
+from omymodels import create_models
+
+ddl = """
+CREATE TABLE events_2024_01 (
+    id BIGINT PRIMARY KEY,
+    created_at TIMESTAMP NOT NULL
+);
+CREATE TABLE events_2024_02 (
+    id BIGINT PRIMARY KEY,
+    created_at TIMESTAMP NOT NULL
+);
+CREATE TABLE users (id INT PRIMARY KEY);
+CREATE INDEX ix_events_2024_01_created_at ON events_2024_01 (created_at DESC);
+"""
+
+
+def generate(models_type, **kwargs):
+    return create_models(ddl, models_type=models_type, dump=False, dedup_tables=True, **kwargs)[
+        "code"
+    ]
+
+
+def test_sqlalchemy_dedup_tables():
+    code = generate("sqlalchemy")
+    assert code.count("created_at = sa.Column(") == 1
+    assert (
+        "class EventsBase(Base):\n\n    __abstract__ = True\n\n"
+        "    id = sa.Column(sa.BigInteger(), primary_key=True)\n"
+    ) in code
+    assert "class Events202402(EventsBase):\n\n    __tablename__ = 'events_2024_02'\n" in code
+    assert "Index('ix_events_2024_01_created_at', sa.desc('created_at'))" in code
+    assert "class Users(Base):" in code
+    namespace = {}
+    exec(code, namespace)
+    tables = namespace["Base"].metadata.tables
+    assert set(tables) == {"events_2024_01", "events_2024_02", "users"}
+    assert list(tables["events_2024_02"].columns.keys()) == ["id", "created_at"]
+
+
+def test_sqlalchemy_v2_dedup_tables():
+    code = generate("sqlalchemy_v2")
+    assert "class EventsBase(Base):\n    __abstract__ = True\n    id: Mapped[int]" in code
+    assert "class Events202401(EventsBase):\n    __tablename__ = 'events_2024_01'\n" in code
+    assert "Index('ix_events_2024_01_created_at', desc('created_at'))" in code
+    namespace = {}
+    exec(code, namespace)
+    assert len(namespace["Base"].metadata.tables) == 3
+
+
+def test_dedup_tables_off_by_default():
+    code = create_models(ddl, models_type="sqlalchemy", dump=False)["code"]
+    assert "__abstract__" not in code
+    assert code.count("created_at = sa.Column(") == 2
+
+
+def test_dedup_tables_not_supported():
+    with pytest.raises(ValueError):
+        generate("pydantic")
+
+
+def test_dedup_tables_per_tenant_schemas():
+    tenants_ddl = "\n".join(
+        f"CREATE TABLE {schema}.users (id INT PRIMARY KEY);\n"
+        f"CREATE TABLE {schema}.orders (id INT PRIMARY KEY, "
+        f"user_id INT REFERENCES {schema}.users (id));"
+        for schema in ("a", "b")
+    )
+    code = create_models(
+        tenants_ddl, models_type="sqlalchemy", dump=False, dedup_tables=True
+    )["code"]
+    assert "class OrdersBase(Base):" in code
+    assert code.count("user_id = sa.Column(") == 1
+
+
+def test_dedup_tables_with_different_alter_foreign_keys():
+    alter_ddl = """
+    CREATE TABLE a (id INT PRIMARY KEY);
+    CREATE TABLE b (id INT PRIMARY KEY);
+    CREATE TABLE ev_1 (id INT PRIMARY KEY, ref_id INT);
+    CREATE TABLE ev_2 (id INT PRIMARY KEY, ref_id INT);
+    ALTER TABLE ev_1 ADD FOREIGN KEY (ref_id) REFERENCES a (id);
+    ALTER TABLE ev_2 ADD FOREIGN KEY (ref_id) REFERENCES b (id);
+    """
+    code = create_models(
+        alter_ddl, models_type="sqlalchemy", dump=False, dedup_tables=True
+    )["code"]
+    assert "EvBase" not in code
+    assert "sa.ForeignKey('a.id')" in code
+    assert "sa.ForeignKey('b.id')" in code
+
+
+def test_dedup_tables_with_deferred_overrides():
+    code = generate(
+        "sqlalchemy",
+        generator_options={"deferred_overrides": {"events_2024_02": ["created_at"]}},
+    )
+    assert "EventsBase" not in code
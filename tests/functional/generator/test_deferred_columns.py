@@ -0,0 +1,96 @@
+"""Tests for deferred loading of large columns in ORM models."""
+
+import pytest
+from table_meta.model import Column
+
+from omymodels import create_models
+from omymodels.logic import is_large_column
+
+ddl = """
+CREATE TABLE events (
+    id INT PRIMARY KEY,
+    kind VARCHAR(10),
+    payload JSON,
+    body TEXT,
+    tags TEXT[]
+);
+
+CREATE TABLE logs (
+    id INT PRIMARY KEY,
+    message TEXT,
+    raw VARCHAR
+);
+"""
+
+options = {
+    "defer_large_columns": True,
+    "deferred_group": "large",
+    "deferred_overrides": {"logs": ["raw"]},
+}
+
+
+@pytest.mark.parametrize(
+    "column, expected",
+    [
+        ({"name": "a", "type": "text"}, True),
+        ({"name": "a", "type": "jsonb"}, True),
+        ({"name": "a", "type": "bytea"}, True),
+        ({"name": "a", "type": "varchar"}, True),
+        ({"name": "a", "type": "varchar", "size": 10}, False),
+        ({"name": "a", "type": "text[]"}, False),
+        ({"name": "a", "type": "int"}, False),
+    ],
+)
+def test_is_large_column(column, expected):
+    assert is_large_column(Column(**column)) is expected
+
+
+def test_deferred_off_by_default():
+    code = create_models(ddl, models_type="sqlalchemy", dump=False)["code"]
+    assert "deferred" not in code
+
+
+def test_deferred_sqlalchemy():
+    code = create_models(
+        ddl, models_type="sqlalchemy", generator_options=options, dump=False
+    )["code"]
+    assert "from sqlalchemy.orm import deferred\n" in code
+    assert "    payload = deferred(sa.Column(JSON()), group='large')\n" in code
+    assert "    body = deferred(sa.Column(sa.Text()), group='large')\n" in code
+    assert "    tags = sa.Column(ARRAY(sa.Text()))\n" in code
+    # per table override
+    assert "    message = sa.Column(sa.Text())\n" in code
+    assert "    raw = deferred(sa.Column(sa.String()), group='large')\n" in code
+
+
+def test_deferred_sqlalchemy_v2():
+    code = create_models(
+        ddl,
+        models_type="sqlalchemy_v2",
+        generator_options={"defer_large_columns": True},
+        dump=False,
+    )["code"]
+    assert (
+        "    payload: Mapped[dict | None] = mapped_column(JSON, deferred=True)\n" in code
+    )
+    assert "    body: Mapped[str | None] = mapped_column(Text, deferred=True)\n" in code
+    assert "    kind: Mapped[str | None] = mapped_column(String(10))\n" in code
+    assert "    id: Mapped[int] = mapped_column(Integer, primary_key=True)\n" in code
+
+
+def test_deferred_sqlmodel():
+    code = create_models(
+        ddl, models_type="sqlmodel", generator_options=options, dump=False
+    )["code"]
+    assert "from sqlalchemy.orm import declared_attr, deferred\n" in code
+    assert """
+    @declared_attr
+    def __mapper_args__(cls):
+        return {
+            "properties": {
+                name: deferred(cls.__table__.c[name], group='large')
+                for name in ('payload', 'body')
+            }
+        }
+""" in code
+    assert "for name in ('raw',)" in code
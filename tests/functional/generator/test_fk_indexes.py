@@ -0,0 +1,78 @@
+"""Tests for fk_indexes generator option."""
+
+import pytest
+
+from omymodels import create_models
+
+ddl = """
+CREATE TABLE users (
+    id SERIAL PRIMARY KEY
+);
+
+CREATE TABLE shops (
+    id SERIAL PRIMARY KEY
+);
+
+CREATE TABLE orders (
+    id SERIAL PRIMARY KEY,
+    user_id INT REFERENCES users(id),
+    shop_id INT
+);
+
+ALTER TABLE orders ADD FOREIGN KEY (shop_id) REFERENCES shops(id);
+
+CREATE TABLE items (
+    id SERIAL PRIMARY KEY,
+    order_id INT REFERENCES orders(id)
+);
+
+CREATE INDEX ix_items_order ON items (order_id, id);
+"""
+
+
+def generate(models_type, **options):
+    return create_models(
+        ddl, models_type=models_type, generator_options=options, dump=False
+    )["code"]
+
+
+def test_fk_indexes_off_by_default():
+    assert "ix_orders_user_id" not in generate("sqlalchemy")
+
+
+def test_fk_indexes_sqlalchemy():
+    code = generate("sqlalchemy", fk_indexes=True)
+    assert "from sqlalchemy import Index" in code
+    assert "Index('ix_orders_user_id', user_id)" in code
+    assert "Index('ix_orders_shop_id', shop_id)" in code
+    # covered by existing index
+    assert "ix_items_order_id" not in code
+    assert "Index('ix_items_order', order_id,id),\n" in code
+
+
+def test_fk_indexes_sqlalchemy_v2():
+    code = generate("sqlalchemy_v2", fk_indexes=True)
+    assert "Index('ix_orders_user_id', 'user_id')" in code
+    assert "Index('ix_orders_shop_id', 'shop_id')" in code
+    assert "ix_items_order_id" not in code
+
+
+def test_fk_indexes_sqlalchemy_core():
+    code = generate("sqlalchemy_core", fk_indexes=True)
+    assert "Index('ix_orders_user_id', orders.c.user_id)" in code
+    assert "Index('ix_orders_shop_id', orders.c.shop_id)" in code
+    assert "ix_items_order_id" not in code
+
+
+@pytest.mark.parametrize("models_type", ["sqlalchemy", "sqlalchemy_v2", "gino"])
+def test_one_index_with_schema_table_args(models_type):
+    ddl = """
+    CREATE TABLE "s"."items" (id INT PRIMARY KEY, a INT);
+    CREATE INDEX ix_items_a ON "s"."items" (a);
+    """
+    code = create_models(
+        ddl, models_type=models_type, schema_global=False, dump=False
+    )["code"]
+    assert ",," not in code
+    assert 'dict(schema="s")' in code
+    compile(code, "models.py", "exec")
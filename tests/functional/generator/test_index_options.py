@@ -0,0 +1,74 @@
+"""Tests for index methods, partial predicates, INCLUDE columns & ordering in Index()."""
+
+from omymodels import create_models
+
+ddl = """
+CREATE TABLE docs (
+    id SERIAL PRIMARY KEY,
+    body JSONB,
+    created_at TIMESTAMP,
+    status VARCHAR(10),
+    title VARCHAR(200)
+);
+
+CREATE INDEX ix_docs_body ON docs USING gin (body);
+CREATE INDEX ix_docs_active ON docs (created_at DESC NULLS LAST) WHERE status = 'active';
+CREATE UNIQUE INDEX ix_docs_id ON docs (id) INCLUDE (title, status);
+CREATE INDEX ix_docs_title ON docs (title varchar_pattern_ops);
+CREATE INDEX ix_docs_status ON docs (status);
+"""
+
+
+def generate(models_type):
+    return create_models(ddl, models_type=models_type, dump=False)["code"]
+
+
+def test_sqlalchemy_index_options():
+    code = generate("sqlalchemy")
+    assert "Index('ix_docs_body', body, postgresql_using='gin')" in code
+    assert (
+        "Index('ix_docs_active', created_at.desc().nulls_last(), "
+        "postgresql_where=sa.text(\"status = 'active'\"))"
+    ) in code
+    assert (
+        "Index('ix_docs_id', id, unique=True, postgresql_include=['title', 'status'])"
+        in code
+    )
+    assert (
+        "Index('ix_docs_title', title, postgresql_ops={'title': 'varchar_pattern_ops'})"
+        in code
+    )
+    assert "Index('ix_docs_status', status)" in code
+
+
+def test_gino_index_where_uses_db_text():
+    code = generate("gino")
+    assert "postgresql_where=db.text(\"status = 'active'\")" in code
+
+
+def test_sqlalchemy_v2_index_options():
+    code = generate("sqlalchemy_v2")
+    assert "from sqlalchemy import Index, desc, nulls_last, text\n" in code
+    assert (
+        "Index('ix_docs_active', nulls_last(desc('created_at')), "
+        "postgresql_where=text(\"status = 'active'\"))"
+    ) in code
+    assert "Index('ix_docs_body', 'body', postgresql_using='gin')" in code
+
+
+def test_sqlalchemy_core_index_options():
+    code = generate("sqlalchemy_core")
+    assert "Index('ix_docs_body', docs.c.body, postgresql_using='gin')" in code
+    assert (
+        "Index('ix_docs_id', docs.c.id, unique=True, "
+        "postgresql_include=['title', 'status'])"
+    ) in code
+
+
+def test_mysql_prefix_length():
+    code = create_models(
+        "CREATE TABLE docs (id INT, title VARCHAR(200), KEY ix_title (title(10)));",
+        models_type="sqlalchemy_core",
+        dump=False,
+    )["code"]
+    assert "Index('ix_title', docs.c.title, mysql_length={'title': 10})" in code
@@ -0,0 +1,74 @@
+"""Tests for lazy_tables option of sqlalchemy_core: tables built on first access."""
+
+import types
+
+import pytest
+
+from omymodels import create_models
+
+ddl = """
+CREATE TABLE groups (id INT PRIMARY KEY, owner_id INT);
+CREATE TABLE users (
+    id INT PRIMARY KEY,
+    group_id INT REFERENCES groups (id),
+    name TEXT
+);
+CREATE TABLE tags (id INT PRIMARY KEY);
+CREATE INDEX ix_users_name ON users (name);
+ALTER TABLE groups ADD FOREIGN KEY (owner_id) REFERENCES users (id);
+"""
+
+
+def generate(**options):
+    return create_models(
+        ddl,
+        models_type="sqlalchemy_core",
+        dump=False,
+        generator_options={"lazy_tables": True, **options},
+    )["code"]
+
+
+def load(code):
+    module = types.ModuleType("lazy_models")
+    exec(code, module.__dict__)
+    return module
+
+
+def test_lazy_table_factories():
+    code = generate()
+    assert (
+        '@_lazy_table("users", dependencies=("groups",))\n'
+        "def _users_table() -> Table:\n"
+        '    users = Table("users", metadata,\n'
+    ) in code
+    assert "    Index('ix_users_name', users.c.name)\n    return users\n" in code
+    assert "def get_table(name: str) -> Table:" in code
+    assert "\nusers = Table(" not in code
+
+
+def test_tables_built_on_first_access():
+    module = load(generate())
+    assert not module.metadata.tables
+    users = module.users
+    # referenced tables are built with the table, foreign key cycle included
+    assert set(module.metadata.tables) == {"users", "groups"}
+    assert module.get_table("users") is users
+    assert [fk.column.table.name for fk in users.foreign_keys] == ["groups"]
+    assert [index.name for index in users.indexes] == ["ix_users_name"]
+    assert set(module.load_all().tables) == {"users", "groups", "tags"}
+    with pytest.raises(AttributeError):
+        module.missing
+    with pytest.raises(KeyError):
+        module.get_table("missing")
+
+
+def test_lazy_tables_with_upsert_helpers():
+    code = generate(upsert_helpers=True)
+    assert 'return _upsert(get_table("tags"), on, tags_unique_keys' in code
+    module = load(code)
+    assert "ON CONFLICT (id)" in str(module.tags_upsert())
+
+
+def test_lazy_tables_with_lookup_helpers():
+    with pytest.raises(ValueError):
+        generate(lookup_helpers=True)
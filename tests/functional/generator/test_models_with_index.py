@@ -42,6 +42,6 @@ class TaskRequests(db.Model):
     status_update_time = db.Column(db.TIMESTAMP(), server_default=func.now())
 
     __table_args__ = (
-    UniqueConstraint(runid, name='task_requests_pk'))
+    UniqueConstraint(runid, name='task_requests_pk'),)
 """  # noqa: W293
     assert expected == result
@@ -0,0 +1,85 @@
+from omymodels import create_models
+
+ddl = """
+CREATE TYPE "status" AS ENUM ('active', 'blocked');
+
+CREATE TABLE events (
+    id BIGINT NOT NULL,
+    kind VARCHAR(32) NOT NULL,
+    status status,
+    amount DECIMAL(10, 2) DEFAULT 0,
+    tags VARCHAR(16)[],
+    payload JSONB,
+    created_at TIMESTAMP NOT NULL DEFAULT now()
+);
+"""
+
+
+def test_msgspec_struct():
+    result = create_models(ddl, models_type="msgspec", dump=False)
+    expected = """from enum import Enum
+import datetime
+from typing import Annotated, Optional, Union
+import msgspec
+from msgspec import Meta, Struct
+
+Status = Enum(
+    value='Status',
+    names=[
+        ('active', 'active'),
+        ('blocked', 'blocked')
+    ]
+)
+
+
+class Events(Struct):
+
+    id: int
+    kind: Annotated[str, Meta(max_length=32)]
+    status: Optional[Status] = None
+    amount: Optional[float] = 0
+    tags: Optional[list[Annotated[str, Meta(max_length=16)]]] = None
+    payload: Optional[Union[dict, list]] = None
+    created_at: datetime.datetime = msgspec.field(default_factory=datetime.datetime.now)
+"""
+    assert expected == result["code"]
+
+
+def test_msgspec_struct_options():
+    result = create_models(
+        ddl,
+        models_type="msgspec",
+        generator_options={
+            "array_like": True,
+            "frozen": True,
+            "gc": False,
+            "omit_defaults": True,
+        },
+        dump=False,
+    )
+    assert (
+        "class Events(Struct, frozen=True, array_like=True, gc=False, omit_defaults=True):"
+        in result["code"]
+    )
+
+
+def test_msgspec_defaults_go_last_unless_kw_only():
+    ddl = """
+    CREATE TABLE users (
+        nickname VARCHAR(10),
+        id INT NOT NULL
+    );
+    """
+    result = create_models(ddl, models_type="msgspec", dump=False)
+    assert "    id: int\n    nickname: Optional[" in result["code"]
+    result = create_models(
+        ddl, models_type="msgspec", generator_options={"kw_only": True}, dump=False
+    )
+    assert "class Users(Struct, kw_only=True):" in result["code"]
+    assert "None\n    id: int\n" in result["code"]
+
+
+def test_msgspec_defaults_off():
+    result = create_models(ddl, models_type="msgspec", defaults_off=True, dump=False)
+    assert "    status: Optional[Status]\n" in result["code"]
+    assert "msgspec.field" not in result["code"]
@@ -0,0 +1,78 @@
+import pytest
+
+from omymodels import create_models
+
+ddl = """
+CREATE TYPE "status" AS ENUM ('blocked', 'active');
+
+CREATE TABLE events (
+    id BIGINT PRIMARY KEY,
+    code CHAR(3) NOT NULL,
+    kind VARCHAR(32),
+    status status NOT NULL,
+    ratio REAL,
+    small SMALLINT NOT NULL,
+    payload JSONB,
+    tags INT[],
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMPTZ
+);
+"""
+
+
+def test_numpy_dtypes():
+    result = create_models(ddl, models_type="numpy", dump=False)["code"]
+    expected = '''
+
+events_dtype = np.dtype(
+    [
+        ("id", "<i8"),
+        ("code", "<U3"),
+        ("kind", "<U32"),
+        ("kind_is_null", "?"),
+        ("status", "i1"),  # index in list(Status)
+        ("ratio", "<f4"),
+        ("ratio_is_null", "?"),
+        ("small", "<i2"),
+        # payload (JSONB) is skipped: not fixed width
+        # tags (INT[]) is skipped: not fixed width
+        ("created_at", "<M8[us]"),
+        ("updated_at", "<M8[us]"),
+        ("updated_at_is_null", "?"),
+    ]
+)
+
+
+def load_events(path: str, mode: str = "r") -> np.ndarray:
+    return _load_records(path, events_dtype, mode)
+
+
+def save_events(path: str, records) -> np.ndarray:
+    return _save_records(path, records, events_dtype)
+'''
+    assert result.endswith(expected)
+    assert result.startswith("from enum import Enum\nimport os\nimport numpy as np\n\n\n")
+    assert "def _load_records(" in result
+    assert "np.memmap(path, dtype=dtype, mode=mode)" in result
+    compile(result, "models.py", "exec")
+
+
+def test_numpy_bytes_chars():
+    result = create_models(
+        ddl, models_type="numpy", dump=False, generator_options={"char_type": "S"}
+    )["code"]
+    assert '("code", "S3"),' in result
+    assert '("kind", "S32"),' in result
+
+
+def test_numpy_unknown_char_type():
+    with pytest.raises(ValueError, match="char_type"):
+        create_models(
+            ddl, models_type="numpy", dump=False, generator_options={"char_type": "B"}
+        )
+
+
+def test_numpy_null_mask_name_conflict():
+    ddl = "CREATE TABLE t (id INT PRIMARY KEY, x INT, x_is_null BOOLEAN NOT NULL);"
+    result = create_models(ddl, models_type="numpy", dump=False)["code"]
+    assert '("x", "<i4"),\n        ("x_is_null_", "?"),\n        ("x_is_null", "?"),' in result
@@ -0,0 +1,85 @@
+"""Tests for package output mode (one module per table / schema)."""
+
+import pytest
+
+from omymodels import create_models
+
+ddl = """
+CREATE TYPE status AS ENUM ('active', 'blocked');
+
+CREATE TABLE users (
+    id SERIAL PRIMARY KEY,
+    status status
+);
+
+CREATE TABLE posts (
+    id SERIAL PRIMARY KEY,
+    user_id INT REFERENCES users (id)
+);
+"""
+
+
+def test_package_module_per_table():
+    result = create_models(
+        ddl, models_type="sqlalchemy_v2", package_mode="table", dump=False
+    )
+    modules = result["code"]
+    assert sorted(modules) == ["__init__", "base", "enums", "posts", "users"]
+    assert "class Base(DeclarativeBase):" in modules["base"]
+    users = modules["users"]
+    assert users.startswith("from __future__ import annotations\n")
+    assert "from .enums import Status" in users
+    assert "from .base import Base" in users
+    assert "class Base(DeclarativeBase)" not in users
+    assert "class Users(Base):" in users
+
+
+def test_package_relationships_use_type_checking_imports():
+    result = create_models(
+        ddl,
+        models_type="sqlalchemy",
+        package_mode="table",
+        relationships=True,
+        dump=False,
+    )
+    posts = result["code"]["posts"]
+    assert "if TYPE_CHECKING:\n    from .users import Users\n" in posts
+    assert posts.count("from .users import Users") == 1
+    assert 'relationship("Users", back_populates="posts")' in posts
+    assert "Base = declarative_base()" not in posts
+    base = result["code"]["base"]
+    assert '@event.listens_for(Mapper, "before_configured")' in base
+    assert "import_module(__package__).load_all()" in base
+
+
+def test_package_init_is_lazy():
+    result = create_models(
+        ddl, models_type="dataclass", package_mode="table", dump=False
+    )
+    init = result["code"]["__init__"]
+    assert "def __getattr__(name: str):" in init
+    assert '"Users": ".users",' in init
+    assert '"Status": ".enums",' in init
+    assert "import_module(module, __name__)" in init
+    assert "from .users import" not in init.split("if TYPE_CHECKING:")[0]
+
+
+def test_package_module_per_schema():
+    ddl = """
+    CREATE TABLE "shop"."orders" (id INT PRIMARY KEY);
+    CREATE TABLE "shop"."items" (id INT PRIMARY KEY);
+    CREATE TABLE "auth"."users" (id INT PRIMARY KEY);
+    """
+    result = create_models(
+        ddl, models_type="pydantic_v2", package_mode="schema", dump=False
+    )
+    modules = result["code"]
+    assert sorted(modules) == ["__init__", "auth", "shop"]
+    assert "class Orders(BaseModel):" in modules["shop"]
+    assert "class Items(BaseModel):" in modules["shop"]
+    assert modules["shop"].count("from __future__ import annotations") == 1
+
+
+def test_package_mode_not_supported_for_gino():
+    with pytest.raises(ValueError, match="Package output is not supported"):
+        create_models(ddl, models_type="gino", package_mode="table", dump=False)
@@ -0,0 +1,73 @@
+"""Tests for partitioned tables: postgresql_partition_by & create_partitions option."""
+
+import pytest
+
+from omymodels import create_models
+
+ddl = """
+CREATE TABLE events (
+    id BIGINT NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE events_2024 PARTITION OF events FOR VALUES FROM ('2024-01-01') TO ('2025-01-01');
+CREATE TABLE events_default PARTITION OF events DEFAULT;
+"""
+
+listener = """
+event.listen(
+    {table},
+    "after_create",
+    DDL("CREATE TABLE events_2024 PARTITION OF events FOR VALUES FROM ('2024-01-01') TO ('2025-01-01')").execute_if(dialect="postgresql"),
+)
+"""
+
+
+def generate(models_type, **options):
+    return create_models(
+        ddl, models_type=models_type, generator_options=options, dump=False
+    )["code"]
+
+
+def test_partitions_are_collapsed_into_parent():
+    result = create_models(ddl, models_type="sqlalchemy", dump=False)
+    assert [table.name for table in result["metadata"]["tables"]] == ["events"]
+    assert "class Events2024" not in result["code"]
+    assert "event.listen" not in result["code"]
+
+
+def test_sqlalchemy_partition_by():
+    code = generate("sqlalchemy", create_partitions=True)
+    assert "dict(postgresql_partition_by='RANGE (created_at)')" in code
+    assert "from sqlalchemy import DDL, event\n" in code
+    assert listener.format(table="Events.__table__") in code
+    assert "DDL('CREATE TABLE events_default PARTITION OF events DEFAULT')" in code
+
+
+def test_sqlalchemy_v2_partition_by_with_schema():
+    code = create_models(
+        ddl.replace("TABLE events (", "TABLE stats.events ("),
+        models_type="sqlalchemy_v2",
+        schema_global=False,
+        dump=False,
+    )["code"]
+    assert (
+        "dict(schema=\"stats\", postgresql_partition_by='RANGE (created_at)')" in code
+    )
+
+
+def test_sqlalchemy_core_partition_by():
+    code = generate("sqlalchemy_core", create_partitions=True)
+    assert "        postgresql_partition_by='RANGE (created_at)',\n)" in code
+    assert listener.format(table="events") in code
+
+
+@pytest.mark.parametrize("models_type", ["sqlalchemy", "sqlalchemy_v2", "gino"])
+def test_one_index_with_partition_by(models_type):
+    indexed = ddl + "\nCREATE INDEX ix_events_created_at ON events (created_at);\n"
+    code = create_models(indexed, models_type=models_type, dump=False)["code"]
+    assert ",," not in code
+    assert "Index('ix_events_created_at'" in code
+    assert "dict(postgresql_partition_by='RANGE (created_at)')" in code
+    compile(code, "models.py", "exec")
@@ -370,3 +370,41 @@ class Codes(BaseModel):
     description: Optional[str] = Field(default=None, max_length=200)
 """
     assert expected == result["code"]
+
+
+def test_pydantic_row_constructors():
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER NOT NULL,
+        "class" VARCHAR(10)
+    );
+    """
+    result = create_models(
+        ddl, models_type="pydantic", generator_options={"row_constructors": True}
+    )["code"]
+    assert "from typing import Callable, Iterable, List, Optional, Sequence\n" in result
+    assert '''    __columns__ = ("id", "class")
+
+    @classmethod
+    def from_row(cls, row: Sequence) -> "Users":
+        return cls.parse_obj(
+            {
+                "id": row[0],
+                "class": row[1],
+            }
+        )
+''' in result
+    assert "return lambda values: cls.parse_obj(dict(zip(names, values)))" in result
+
+    result = create_models(
+        ddl,
+        models_type="pydantic",
+        generator_options={"row_constructors": True, "trusted_rows": True},
+    )["code"]
+    # construct() takes field names
+    assert '''        return cls.construct(
+            id=row[0],
+            f_class=row[1],
+        )
+''' in result
+    assert "return lambda values: cls.construct(**dict(zip(names, values)))" in result
@@ -1,3 +1,5 @@
+import pytest
+
 from omymodels import create_models
 
 
@@ -295,3 +297,142 @@ class Codes(BaseModel):
     description: str | None = Field(default=None, max_length=200)
 """
     assert expected == result["code"]
+
+
+def test_pydantic_v2_model_config():
+    ddl = """
+    CREATE TABLE users (
+        id INT NOT NULL,
+        name VARCHAR(10)
+    );
+    CREATE TABLE logs (
+        id INT NOT NULL
+    );
+    """
+    result = create_models(
+        ddl,
+        models_type="pydantic_v2",
+        generator_options={
+            "defer_build": True,
+            "revalidate_instances": "never",
+            "config_overrides": {"logs": {"frozen": True, "defer_build": None}},
+        },
+        dump=False,
+    )
+    expected = """from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class Users(BaseModel):
+
+    model_config = ConfigDict(defer_build=True, revalidate_instances='never')
+
+    id: int
+    name: str | None = Field(default=None, max_length=10)
+
+
+class Logs(BaseModel):
+
+    model_config = ConfigDict(frozen=True, revalidate_instances='never')
+
+    id: int
+"""
+    assert expected == result["code"]
+
+
+def test_pydantic_v2_model_config_unknown_option():
+    ddl = "CREATE TABLE users (id INT NOT NULL);"
+    with pytest.raises(ValueError, match="extra"):
+        create_models(
+            ddl,
+            models_type="pydantic_v2",
+            generator_options={"config_overrides": {"users": {"extra": "forbid"}}},
+            dump=False,
+        )
+
+
+def test_pydantic_v2_bulk_helpers():
+    ddl = """
+    CREATE TABLE users (
+        id INT NOT NULL
+    );
+    """
+    result = create_models(
+        ddl,
+        models_type="pydantic_v2",
+        generator_options={"bulk_helpers": True},
+        dump=False,
+    )
+    expected = """from __future__ import annotations
+
+from typing import Any, Iterable
+from pydantic import BaseModel, TypeAdapter
+
+
+_list_adapters: dict = {}
+
+
+def _list_adapter(model: type) -> TypeAdapter:
+    adapter = _list_adapters.get(model)
+    if adapter is None:
+        adapter = _list_adapters[model] = TypeAdapter(list[model])
+    return adapter
+
+
+class Users(BaseModel):
+
+    id: int
+
+    @classmethod
+    def validate_many(cls, rows: Iterable[Any]) -> list[Users]:
+        return _list_adapter(cls).validate_python(rows)
+
+    @classmethod
+    def validate_many_json(cls, data: str | bytes) -> list[Users]:
+        return _list_adapter(cls).validate_json(data)
+
+    @classmethod
+    def dump_many(cls, objs: list[Users], **kwargs: Any) -> list[dict]:
+        return _list_adapter(cls).dump_python(objs, **kwargs)
+"""
+    assert expected == result["code"]
+
+
+def test_pydantic_v2_row_constructors():
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER NOT NULL,
+        name VARCHAR(10)
+    );
+    """
+    result = create_models(
+        ddl, models_type="pydantic_v2", generator_options={"row_constructors": True}
+    )["code"]
+    assert "from typing import Callable, Iterable, Sequence\n" in result
+    assert '''    __columns__ = ("id", "name")
+
+    @classmethod
+    def from_row(cls, row: Sequence) -> Users:
+        return cls.model_validate(
+            {
+                "id": row[0],
+                "name": row[1],
+            }
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> list[Users]:
+''' in result
+
+    result = create_models(
+        ddl,
+        models_type="pydantic_v2",
+        generator_options={"row_constructors": True, "trusted_rows": True},
+    )["code"]
+    assert '''        return cls.model_construct(
+            id=row[0],
+            name=row[1],
+        )
+''' in result
+    assert "return lambda values: cls.model_construct(**dict(zip(names, values)))" in result
@@ -0,0 +1,97 @@
+"""Tests for namedtuple & typeddict generators."""
+
+from omymodels import create_models
+
+ddl = """
+CREATE TYPE "status" AS ENUM ('active', 'blocked');
+
+CREATE TABLE users (
+    id INT NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    status status,
+    tags TEXT[],
+    created_at TIMESTAMP DEFAULT now(),
+    is_admin BOOLEAN DEFAULT false,
+    settings JSONB
+);
+"""
+
+
+def test_namedtuple():
+    result = create_models(ddl, models_type="namedtuple", dump=False)
+    expected = """from enum import Enum
+import datetime
+from typing import List, NamedTuple, Optional, Union
+
+
+Status = Enum(
+    value='Status',
+    names=[
+        ('active', 'active'),
+        ('blocked', 'blocked')
+    ]
+)
+
+
+class Users(NamedTuple):
+
+    id: int
+    name: str
+    status: Optional[Status]
+    tags: Optional[List[str]]
+    created_at: Optional[datetime.datetime]
+    is_admin: Optional[bool] = False
+    settings: Optional[Union[dict, list]] = None
+"""
+    assert expected == result["code"]
+
+
+def test_namedtuple_defaults_off():
+    result = create_models(ddl, models_type="namedtuple", defaults_off=True, dump=False)
+    assert " = " not in result["code"].split("class Users")[1]
+
+
+def test_namedtuple_from_cursor_row():
+    code = create_models(ddl, models_type="namedtuple", dump=False)["code"]
+    namespace = {}
+    exec(compile(code, "<generated>", "exec"), namespace)
+    row = (1, "John", None, ["a"], None)
+    user = namespace["Users"]._make(row + (True, {}))
+    assert user.name == "John"
+    assert namespace["Users"](*row).settings is None
+
+
+def test_typeddict():
+    result = create_models(ddl, models_type="typeddict", dump=False)
+    expected = """from enum import Enum
+import datetime
+from typing import List, Optional, TypedDict, Union
+
+
+Status = Enum(
+    value='Status',
+    names=[
+        ('active', 'active'),
+        ('blocked', 'blocked')
+    ]
+)
+
+
+class Users(TypedDict):
+
+    id: int
+    name: str
+    status: Optional[Status]
+    tags: Optional[List[str]]
+    created_at: Optional[datetime.datetime]
+    is_admin: Optional[bool]
+    settings: Optional[Union[dict, list]]
+"""
+    assert expected == result["code"]
+
+
+def test_typeddict_total_false():
+    result = create_models(
+        ddl, models_type="typeddict", generator_options={"total": False}, dump=False
+    )
+    assert "class Users(TypedDict, total=False):" in result["code"]
@@ -0,0 +1,65 @@
+"""Tests for Sequence() objects from CREATE SEQUENCE & nextval() defaults."""
+
+from omymodels import create_models
+
+ddl = """
+CREATE SEQUENCE orders_id_seq INCREMENT BY 10 START WITH 1000 CACHE 50;
+
+CREATE TABLE orders (
+    id BIGINT DEFAULT nextval('orders_id_seq'::regclass) NOT NULL,
+    number INT DEFAULT nextval('orders_id_seq'),
+    PRIMARY KEY (id)
+);
+"""
+
+
+def generate(models_type):
+    return create_models(ddl, models_type=models_type, dump=False)["code"]
+
+
+def test_sqlalchemy_sequence():
+    code = generate("sqlalchemy")
+    assert code.count("orders_id_seq = sa.Sequence(") == 1
+    assert (
+        "\n\norders_id_seq = sa.Sequence('orders_id_seq', start=1000, increment=10, cache=50)\n"
+        "\n\nclass Orders(Base):"
+    ) in code
+    assert (
+        "id = sa.Column(sa.BigInteger(), orders_id_seq, "
+        "server_default=orders_id_seq.next_value(), primary_key=True)"
+    ) in code
+    assert "nextval" not in code
+
+
+def test_sqlalchemy_v2_sequence():
+    code = generate("sqlalchemy_v2")
+    assert "from sqlalchemy import Sequence\n" in code
+    assert (
+        "orders_id_seq = Sequence('orders_id_seq', start=1000, increment=10, cache=50)"
+        in code
+    )
+    assert (
+        "number: Mapped[int | None] = mapped_column(Integer, orders_id_seq, "
+        "server_default=orders_id_seq.next_value())"
+    ) in code
+
+
+def test_sequences_in_metadata():
+    result = create_models(ddl, models_type="sqlalchemy", dump=False)
+    assert result["metadata"]["sequences"] == [
+        {"name": "orders_id_seq", "schema": None, "start": 1000, "increment": 10, "cache": 50}
+    ]
+    assert result["metadata"]["tables"][0].sequences["id"]["cache"] == 50
+
+
+def test_sequences_with_same_name_in_different_schemas():
+    schemas_ddl = """
+    CREATE SEQUENCE a.seq CACHE 10;
+    CREATE SEQUENCE b.seq CACHE 20;
+    CREATE TABLE a.items (id BIGINT DEFAULT nextval('a.seq') NOT NULL, PRIMARY KEY (id));
+    CREATE TABLE b.items (id BIGINT DEFAULT nextval('b.seq') NOT NULL, PRIMARY KEY (id));
+    """
+    code = create_models(schemas_ddl, models_type="sqlalchemy", dump=False)["code"]
+    assert "a_seq = sa.Sequence('seq', cache=10, schema='a')" in code
+    assert "b_seq = sa.Sequence('seq', cache=20, schema='b')" in code
+    assert "server_default=b_seq.next_value()" in code
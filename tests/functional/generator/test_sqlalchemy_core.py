@@ -165,3 +165,169 @@ class Measurements(Base):
 
     result = create_models(ddl, models_type="sqlalchemy")["code"]
     assert result == expected
+
+
+def test_bulk_helpers():
+    ddl = """
+    CREATE TABLE events (
+        id INTEGER PRIMARY KEY,
+        tags TEXT[],
+        payload JSON
+    );
+    """
+    result = create_models(
+        ddl, models_type="sqlalchemy_core", generator_options={"bulk_helpers": True}
+    )["code"]
+    assert "import json\nfrom typing import Iterable, Mapping, Sequence\n" in result
+    assert result.count("def _copy_data(") == 1
+    expected_helpers = '''
+
+events_columns = ("id", "tags", "payload")
+events_copy_kinds = ("", "array", "json")
+
+
+def events_to_row(record: Mapping) -> tuple:
+    return (
+        record.get("id"),
+        record.get("tags"),
+        record.get("payload"),
+    )
+
+
+def events_rows_from_dicts(records: Iterable[Mapping]) -> list:
+    return [events_to_row(record) for record in records]
+
+
+def events_copy_data(rows: Iterable[Sequence], csv: bool = False) -> str:
+    return _copy_data(rows, events_copy_kinds, csv)
+'''
+    assert result.endswith(expected_helpers)
+
+
+def test_bulk_helpers_single_column_tuple():
+    ddl = "CREATE TABLE counters (id INTEGER);"
+    result = create_models(
+        ddl, models_type="sqlalchemy_core", generator_options={"bulk_helpers": True}
+    )["code"]
+    assert 'counters_columns = ("id",)' in result
+    assert 'counters_copy_kinds = ("",)' in result
+
+
+def test_unique_constraint_is_kept_for_upsert():
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER,
+        tenant_id INTEGER,
+        login VARCHAR(50),
+        CONSTRAINT uq_users_tenant_login UNIQUE (tenant_id, login)
+    );
+    """
+    constraint = "UniqueConstraint('tenant_id','login', name='uq_users_tenant_login')"
+    result = create_models(ddl, models_type="sqlalchemy_core")["code"]
+    assert constraint not in result
+    result = create_models(
+        ddl, models_type="sqlalchemy_core", generator_options={"upsert_helpers": True}
+    )["code"]
+    assert constraint in result
+    assert 'users_unique_keys = (("tenant_id", "login"),)' in result
+
+
+def test_upsert_helpers():
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        email VARCHAR(255) UNIQUE,
+        name TEXT
+    );
+    CREATE TABLE logs (message TEXT);
+    """
+    result = create_models(
+        ddl, models_type="sqlalchemy_core", generator_options={"upsert_helpers": True}
+    )["code"]
+    assert "from sqlalchemy.dialects import mysql, postgresql, sqlite\n" in result
+    assert result.count("def _upsert(") == 1
+    assert '''
+
+users_unique_keys = (("id",), ("email",))
+
+
+def users_upsert(on: tuple = ("id",), update=None, dialect: str = "postgresql"):
+    return _upsert(users, on, users_unique_keys, update, dialect)
+''' in result
+    # no conflict target - no upsert
+    assert "logs_upsert" not in result
+
+
+def test_lookup_helpers():
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        tenant_id INTEGER,
+        login VARCHAR(50),
+        CONSTRAINT uq_users_tenant_login UNIQUE (tenant_id, login)
+    );
+    CREATE TABLE logs (message TEXT);
+    """
+    result = create_models(
+        ddl, models_type="sqlalchemy_core", generator_options={"lookup_helpers": True}
+    )["code"]
+    assert "from sqlalchemy import bindparam, lambda_stmt, select, tuple_\n" in result
+    assert "from typing import Iterable, Iterator\n" in result
+    assert result.count("def _chunks(") == 1
+    assert '''
+
+def users_get_by_id(conn, id):
+    return conn.execute(
+        lambda_stmt(
+            lambda: select(users).where(
+                users.c["id"] == bindparam("id"),
+            )
+        ),
+        {"id": id},
+    ).first()
+
+
+def users_get_many_by_id(
+    conn, values: Iterable, chunk_size: int = 1000
+) -> list:
+    """Rows with id in values, sent in chunks of chunk_size."""
+    rows = []
+    for chunk in _chunks(values, chunk_size):
+        rows.extend(
+            conn.execute(
+                lambda_stmt(
+                    lambda: select(users).where(
+                        users.c["id"].in_(bindparam("values", expanding=True))
+                    )
+                ),
+                {"values": chunk},
+            )
+        )
+    return rows
+''' in result
+    assert "def users_get_by_tenant_id_and_login(conn, tenant_id, login):" in result
+    assert (
+        'tuple_(users.c["tenant_id"], users.c["login"]).in_(bindparam("values", expanding=True))'
+        in result
+    )
+    assert "logs_get_by" not in result
+
+
+def test_lookup_helpers_parameter_names():
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        class VARCHAR(10) UNIQUE,
+        "values" VARCHAR(10) UNIQUE,
+        users INTEGER UNIQUE
+    );
+    """
+    result = create_models(
+        ddl, models_type="sqlalchemy_core", generator_options={"lookup_helpers": True}
+    )["code"]
+    assert "def users_get_by_class(conn, class_):" in result
+    assert "def users_get_by_values(conn, values_):" in result
+    assert "def users_get_by_users(conn, users_):" in result
+    assert 'users.c["class"] == bindparam("class"),' in result
+    assert '{"values": values_},' in result
+    compile(result, "models.py", "exec")
@@ -1,5 +1,7 @@
 """Tests for SQLAlchemy 2.0 ORM model generation."""
 
+import pytest
+
 from omymodels import create_models
 
 
@@ -274,3 +276,114 @@ CREATE TABLE schema1.users (
     assert "class Users(Schema1Base):" in schema1_code
     assert "id: Mapped[int]" in schema1_code
     assert 'dict(schema="schema1")' in schema1_code
+
+
+def test_relationships_loading_strategies():
+    """Test lazy loading options & passive_deletes for ON DELETE CASCADE."""
+    ddl = """
+CREATE TABLE users (
+  id int PRIMARY KEY
+);
+
+CREATE TABLE posts (
+  id int PRIMARY KEY,
+  user_id int REFERENCES users (id) ON DELETE CASCADE
+);
+
+CREATE TABLE comments (
+  id int PRIMARY KEY,
+  post_id int REFERENCES posts (id)
+);
+"""
+    result = create_models(
+        ddl,
+        models_type="sqlalchemy_v2",
+        relationships=True,
+        generator_options={
+            "lazy_one_to_many": "selectin",
+            "lazy_many_to_one": "joined",
+            "lazy_overrides": {"comments": {"many_to_one": "raise_on_sql"}},
+        },
+    )
+    code = result["code"]
+
+    assert "ForeignKey('users.id', ondelete=\"CASCADE\"))" in code
+    assert (
+        'posts: Mapped[List["Posts"]] = relationship("Posts", back_populates="user", '
+        'lazy="selectin", cascade="all, delete", passive_deletes=True)'
+    ) in code
+    assert 'user: Mapped["Users"] = relationship("Users", back_populates="posts", lazy="joined")' in code
+    assert (
+        'comments: Mapped[List["Comments"]] = relationship("Comments", back_populates="post", lazy="selectin")'
+    ) in code
+    assert 'post: Mapped["Posts"] = relationship("Posts", back_populates="comments", lazy="raise_on_sql")' in code
+
+
+def test_relationships_unknown_loading_strategy():
+    ddl = """
+CREATE TABLE users (id int PRIMARY KEY);
+CREATE TABLE posts (id int PRIMARY KEY, user_id int REFERENCES users (id));
+"""
+    with pytest.raises(ValueError, match="Unsupported relationship loading strategy"):
+        create_models(
+            ddl,
+            models_type="sqlalchemy_v2",
+            relationships=True,
+            generator_options={"lazy_many_to_one": "eager"},
+        )
+
+
+def test_upsert_helpers():
+    ddl = """
+CREATE TABLE users (
+    id int PRIMARY KEY,
+    tenant_id int,
+    login varchar(50),
+    CONSTRAINT uq_users_tenant_login UNIQUE (tenant_id, login)
+);
+"""
+    code = create_models(
+        ddl, models_type="sqlalchemy_v2", generator_options={"upsert_helpers": True}
+    )["code"]
+    assert "from sqlalchemy.dialects import mysql, postgresql, sqlite\n" in code
+    assert '''            )
+
+    __unique_keys__ = (("id",), ("tenant_id", "login"))
+
+    @classmethod
+    def upsert(cls, on: tuple = ("id",), update=None, dialect: str = "postgresql"):
+        return _upsert(cls.__table__, on, cls.__unique_keys__, update, dialect)
+''' in code
+
+
+def test_lookup_helpers():
+    ddl = """
+CREATE TABLE users (
+    id int PRIMARY KEY,
+    email varchar(255) UNIQUE
+);
+"""
+    code = create_models(
+        ddl, models_type="sqlalchemy_v2", generator_options={"lookup_helpers": True}
+    )["code"]
+    assert "from sqlalchemy import bindparam, lambda_stmt, select\n" in code
+    assert "from typing import Iterable, Iterator, List\n" in code
+    assert '''
+
+def users_get_by_email(session, email) -> Users | None:
+    return session.execute(
+        lambda_stmt(
+            lambda: select(Users).where(
+                Users.email == bindparam("email"),
+            )
+        ),
+        {"email": email},
+    ).scalar_one_or_none()
+
+
+def users_get_many_by_email(
+    session, values: Iterable, chunk_size: int = 1000
+) -> List[Users]:
+    """Models with email in values, sent in chunks of chunk_size."""
+''' in code
+    assert "def users_get_by_id(session, id) -> Users | None:" in code
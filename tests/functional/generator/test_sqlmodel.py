@@ -417,3 +417,13 @@ class TestTable(SQLModel, table=True):
     scores: List[int] = Field(sa_type=ARRAY(sa.Integer))
 """
     assert expected == result
+
+
+def test_sqlmodel_nextval_default():
+    ddl = "CREATE TABLE t (id int DEFAULT nextval('t_id_seq') PRIMARY KEY, name text);"
+    code = create_models(ddl, models_type="sqlmodel", dump=False)["code"]
+    assert "Sequence" not in code
+    assert (
+        "id: Optional[int] = Field(sa_column_kwargs={'server_default': nextval('t_id_seq')}, "
+        "default=None, primary_key=True)"
+    ) in code
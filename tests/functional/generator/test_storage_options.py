@@ -0,0 +1,74 @@
+"""Tests for table storage options in generated table args."""
+
+import pytest
+
+from omymodels import create_models
+
+
+def generate(ddl, models_type):
+    return create_models(ddl, models_type=models_type, dump=False)["code"]
+
+
+postgresql_ddl = """
+CREATE UNLOGGED TABLE cache (
+    id INT PRIMARY KEY,
+    body TEXT
+) WITH (fillfactor=70) TABLESPACE fast;
+"""
+
+
+def test_sqlalchemy_postgresql_storage():
+    code = generate(postgresql_ddl, "sqlalchemy")
+    assert (
+        "dict(prefixes=['UNLOGGED'], postgresql_with={'fillfactor': 70}, "
+        "postgresql_tablespace='fast')"
+    ) in code
+
+
+def test_sqlalchemy_core_postgresql_storage():
+    code = generate(postgresql_ddl, "sqlalchemy_core")
+    assert (
+        "        prefixes=['UNLOGGED'],\n"
+        "        postgresql_with={'fillfactor': 70},\n"
+        "        postgresql_tablespace='fast',\n)"
+    ) in code
+
+
+def test_sqlalchemy_v2_mysql_storage():
+    code = generate(
+        "CREATE TABLE logs (id INT PRIMARY KEY) ENGINE=InnoDB ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8;",
+        "sqlalchemy_v2",
+    )
+    assert (
+        "dict(mysql_engine='InnoDB', mysql_row_format='COMPRESSED', "
+        "mysql_key_block_size='8')"
+    ) in code
+
+
+def test_sqlalchemy_v2_sqlite_storage():
+    code = generate(
+        "CREATE TABLE tags (id INT PRIMARY KEY, name TEXT) STRICT, WITHOUT ROWID;",
+        "sqlalchemy_v2",
+    )
+    assert "dict(sqlite_with_rowid=False, sqlite_strict=True)" in code
+
+
+@pytest.mark.parametrize("models_type", ["sqlalchemy", "sqlalchemy_v2", "gino"])
+@pytest.mark.parametrize(
+    "storage, kwargs",
+    [
+        ("WITH (fillfactor=70)", "postgresql_with={'fillfactor': 70}"),
+        ("TABLESPACE fast", "postgresql_tablespace='fast'"),
+        ("ENGINE=InnoDB", "mysql_engine='InnoDB'"),
+    ],
+)
+def test_one_index_with_storage_options(models_type, storage, kwargs):
+    ddl = (
+        f"CREATE TABLE cache (id INT PRIMARY KEY, body TEXT) {storage};\n"
+        "CREATE INDEX ix_cache_body ON cache (body);"
+    )
+    code = generate(ddl, models_type)
+    assert ",," not in code
+    assert "Index('ix_cache_body'" in code
+    assert f"dict({kwargs})" in code
+    compile(code, "models.py", "exec")
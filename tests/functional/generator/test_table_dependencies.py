@@ -0,0 +1,108 @@
+"""Tests for FK dependency based table selection & ordering."""
+
+import pytest
+
+from omymodels import create_models
+from omymodels.errors import NoTablesError
+
+ddl = """
+CREATE TABLE order_items (
+    id SERIAL PRIMARY KEY,
+    order_id INT NOT NULL REFERENCES orders (id),
+    product_id INT NOT NULL
+);
+
+CREATE TABLE orders (
+    id SERIAL PRIMARY KEY,
+    user_id INT NOT NULL REFERENCES users (id)
+);
+
+CREATE TABLE products (
+    id SERIAL PRIMARY KEY
+);
+
+CREATE TABLE users (
+    id SERIAL PRIMARY KEY
+);
+
+CREATE TABLE logs (
+    id SERIAL PRIMARY KEY
+);
+
+ALTER TABLE order_items ADD FOREIGN KEY (product_id) REFERENCES products (id);
+"""
+
+
+def get_table_names(result):
+    return [table.name for table in result["metadata"]["tables"]]
+
+
+def test_tables_subset():
+    result = create_models(ddl, models_type="sqlalchemy", tables=["orders"], dump=False)
+    assert get_table_names(result) == ["orders"]
+
+
+def test_tables_with_dependencies_includes_alter_references():
+    result = create_models(
+        ddl,
+        models_type="sqlalchemy",
+        tables=["order_items"],
+        with_dependencies=True,
+        dump=False,
+    )
+    assert get_table_names(result) == ["order_items", "orders", "products", "users"]
+
+
+def test_sort_by_dependencies():
+    result = create_models(
+        ddl, models_type="sqlalchemy", sort_by_dependencies=True, dump=False
+    )
+    assert get_table_names(result) == [
+        "products",
+        "users",
+        "orders",
+        "order_items",
+        "logs",
+    ]
+    code = result["code"]
+    assert code.index("class Users(Base)") < code.index("class Orders(Base)")
+    assert code.index("class Orders(Base)") < code.index("class OrderItems(Base)")
+
+
+def test_relationships_only_between_selected_tables():
+    result = create_models(
+        ddl,
+        models_type="sqlalchemy",
+        tables=["orders", "order_items"],
+        relationships=True,
+        dump=False,
+    )
+    code = result["code"]
+    assert 'order = relationship("Orders", back_populates="order_items")' in code
+    assert "Users" not in code
+    assert "Products" not in code
+
+
+@pytest.mark.parametrize("with_dependencies", [False, True])
+def test_unknown_table_raises(with_dependencies):
+    with pytest.raises(NoTablesError, match="Tables not found in DDL"):
+        create_models(
+            ddl,
+            models_type="sqlalchemy",
+            tables=["missing"],
+            with_dependencies=with_dependencies,
+        )
+
+
+def test_sort_by_dependencies_warns_about_cycles():
+    cycle_ddl = """
+    CREATE TABLE a (id INT PRIMARY KEY, b_id INT);
+    CREATE TABLE b (id INT PRIMARY KEY, a_id INT REFERENCES a (id));
+    CREATE TABLE c (id INT PRIMARY KEY);
+    ALTER TABLE a ADD FOREIGN KEY (b_id) REFERENCES b (id);
+    """
+    with pytest.warns(UserWarning, match="cycle: a, b"):
+        result = create_models(
+            cycle_ddl, models_type="sqlalchemy", dump=False, sort_by_dependencies=True
+        )
+    assert [table.name for table in result["metadata"]["tables"]] == ["c", "a", "b"]
@@ -0,0 +1,82 @@
+"""Tests for include_tables / exclude_tables / include_schemas filters."""
+
+import re
+
+from omymodels import create_models, from_ddl
+
+ddl = """
+CREATE TABLE "public"."users" (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(100)
+);
+
+CREATE TABLE "public"."events_2024_01" (
+    id SERIAL PRIMARY KEY
+);
+
+CREATE TABLE "public"."events_2024_02" (
+    id SERIAL PRIMARY KEY
+);
+
+CREATE TABLE "audit"."log" (
+    id SERIAL PRIMARY KEY
+);
+"""
+
+
+def get_table_names(result):
+    return [table.name for table in result["metadata"]["tables"]]
+
+
+def test_include_tables_glob():
+    result = create_models(
+        ddl, models_type="sqlalchemy", include_tables=["events_*"], dump=False
+    )
+    assert get_table_names(result) == ["events_2024_01", "events_2024_02"]
+    assert "class Users(Base)" not in result["code"]
+    assert "class Events202401(Base)" in result["code"]
+
+
+def test_exclude_tables_glob():
+    result = create_models(
+        ddl, models_type="sqlalchemy", exclude_tables=["events_*"], dump=False
+    )
+    assert get_table_names(result) == ["users", "log"]
+
+
+def test_filters_match_schema_qualified_name():
+    result = create_models(
+        ddl, models_type="sqlalchemy", include_tables=["audit.*"], dump=False
+    )
+    assert get_table_names(result) == ["log"]
+
+
+def test_include_schemas():
+    result = create_models(
+        ddl, models_type="sqlalchemy", include_schemas=["public"], dump=False
+    )
+    assert get_table_names(result) == ["users", "events_2024_01", "events_2024_02"]
+
+
+def test_regex_filters_combined():
+    result = create_models(
+        ddl,
+        models_type="sqlalchemy",
+        include_tables=[re.compile(r"events_\d{4}_\d{2}"), "users"],
+        exclude_tables=[re.compile(r".*_02")],
+        dump=False,
+    )
+    assert get_table_names(result) == ["users", "events_2024_01"]
+
+
+def test_filters_are_applied_before_table_details(monkeypatch):
+    seen = []
+    add_index_details = from_ddl.add_index_details
+
+    def spy(tables, ddl):
+        seen.extend(table["table_name"] for table in tables)
+        return add_index_details(tables, ddl)
+
+    monkeypatch.setattr(from_ddl, "add_index_details", spy)
+    create_models(ddl, dump=False, include_tables=["users"])
+    assert seen == ["users"]
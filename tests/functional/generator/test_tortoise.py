@@ -0,0 +1,120 @@
+from omymodels import create_models
+
+ddl = """
+CREATE TYPE "status" AS ENUM ('active', 'blocked');
+
+CREATE TABLE groups (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(64) NOT NULL UNIQUE,
+    created_at TIMESTAMP DEFAULT now()
+);
+
+CREATE TABLE users (
+    id BIGINT PRIMARY KEY,
+    group_id INT REFERENCES groups (id) ON DELETE CASCADE,
+    email VARCHAR(100) NOT NULL,
+    status status DEFAULT 'active',
+    score NUMERIC(10, 2) DEFAULT 0,
+    active BOOLEAN DEFAULT true,
+    payload JSONB
+);
+CREATE INDEX ix_users_group_status ON users (group_id, status);
+CREATE INDEX ix_users_payload ON users USING gin (payload);
+CREATE UNIQUE INDEX uq_users_email ON users (email);
+"""
+
+
+def test_tortoise_models():
+    result = create_models(ddl, models_type="tortoise", dump=False)
+    expected = """from enum import Enum
+from tortoise import fields
+from tortoise.models import Model
+from tortoise.indexes import Index
+from tortoise.contrib.postgres.indexes import GinIndex
+
+Status = Enum(
+    value='Status',
+    names=[
+        ('active', 'active'),
+        ('blocked', 'blocked')
+    ]
+)
+
+
+class Groups(Model):
+    id = fields.IntField(primary_key=True)
+    name = fields.CharField(max_length=64, unique=True)
+    created_at = fields.DatetimeField(null=True, auto_now_add=True)
+
+    class Meta:
+        table = "groups"
+
+
+class Users(Model):
+    id = fields.BigIntField(primary_key=True, generated=False)
+    group = fields.ForeignKeyField("models.Groups", related_name="users", on_delete=fields.CASCADE, null=True)
+    email = fields.CharField(max_length=100)
+    status = fields.CharEnumField(Status, null=True, default=Status('active'))
+    score = fields.DecimalField(max_digits=10, decimal_places=2, null=True, default=0)
+    active = fields.BooleanField(null=True, default=True)
+    payload = fields.JSONField(null=True)
+
+    class Meta:
+        table = "users"
+        unique_together = (("email",),)
+        indexes = (Index(fields=("group_id", "status"), name="ix_users_group_status"), GinIndex(fields=("payload",), name="ix_users_payload"))
+"""
+    assert expected == result["code"]
+
+
+def test_tortoise_foreign_keys():
+    ddl = """
+    CREATE TABLE users (id INT PRIMARY KEY, name TEXT);
+    CREATE TABLE tasks (
+        id INT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+        author_id INT REFERENCES users (id),
+        reviewer INT,
+        parent_id INT,
+        FOREIGN KEY (reviewer) REFERENCES users (id) ON DELETE SET NULL
+    );
+    ALTER TABLE tasks ADD FOREIGN KEY (parent_id) REFERENCES tasks (id);
+    """
+    code = create_models(
+        ddl, models_type="tortoise", dump=False, generator_options={"app": "core"}
+    )["code"]
+    assert "    id = fields.IntField(primary_key=True)\n    author = " in code
+    assert (
+        'author = fields.ForeignKeyField("core.Users", related_name="author_tasks", '
+        "on_delete=fields.NO_ACTION, null=True)"
+    ) in code
+    assert (
+        'reviewer = fields.ForeignKeyField("core.Users", related_name="reviewer_tasks", '
+        'source_field="reviewer", on_delete=fields.SET_NULL, null=True)'
+    ) in code
+    assert (
+        'parent = fields.ForeignKeyField("core.Tasks", related_name="tasks", '
+        "on_delete=fields.NO_ACTION, null=True)"
+    ) in code
+
+
+def test_tortoise_tables_without_single_primary_key_are_skipped():
+    ddl = """
+    CREATE TABLE groups (id INT PRIMARY KEY);
+    CREATE TABLE memberships (
+        user_id INT NOT NULL,
+        group_id INT NOT NULL REFERENCES groups (id),
+        PRIMARY KEY (user_id, group_id)
+    );
+    CREATE TABLE audit_log (message TEXT);
+    """
+    code = create_models(ddl, models_type="tortoise", dump=False)["code"]
+    assert "class Groups(Model):" in code
+    assert (
+        "# memberships is skipped: composite primary key (not supported by Tortoise ORM)\n"
+    ) in code
+    assert (
+        "# audit_log is skipped: no primary key (Tortoise ORM adds an implicit 'id' field)\n"
+    ) in code
+    assert "class Memberships" not in code
+    assert "class AuditLog" not in code
+    compile(code, "models.py", "exec")
@@ -108,3 +108,71 @@ def test_dataclass_multiple_tables(load_generated_code) -> None:
     assert post.title == "Hello"
 
     os.remove(os.path.abspath(module.__file__))
+
+
+def test_dataclass_slots_fallback_is_valid(load_generated_code) -> None:
+    """Integration test: _add_slots fallback keeps defaults & default_factory working."""
+    import dataclasses
+
+    ddl = """
+    CREATE TABLE events (
+        id INTEGER NOT NULL,
+        name VARCHAR(100),
+        created_at TIMESTAMP DEFAULT NOW()
+    );
+    """
+    result = create_models(
+        ddl,
+        models_type="dataclass",
+        generator_options={"slots": True, "frozen": True, "target_python": "3.9"},
+    )["code"]
+
+    module = load_generated_code(result)
+
+    event = module.Events(id=1)
+    assert event.name is None
+    assert event.created_at is not None
+    assert module.Events.__slots__ == ("id", "name", "created_at")
+    assert not hasattr(event, "__dict__")
+    assert is_dataclass(event)
+    try:
+        event.id = 2
+        raise AssertionError("frozen dataclass must not allow assignment")
+    except dataclasses.FrozenInstanceError:
+        pass
+
+    os.remove(os.path.abspath(module.__file__))
+
+
+def test_dataclass_row_constructors(load_generated_code) -> None:
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER NOT NULL,
+        email VARCHAR(255),
+        name VARCHAR(50) NOT NULL
+    );
+    """
+    result = create_models(
+        ddl, models_type="dataclass", generator_options={"row_constructors": True}
+    )["code"]
+
+    module = load_generated_code(result)
+
+    row = (1, "ann@example.com", "Ann")
+    user = module.Users.from_row(row)
+    assert (user.id, user.email, user.name) == row
+    assert module.Users.from_rows([row, (2, None, "Bob")])[1].name == "Bob"
+
+    class Cursor:
+        def __init__(self, *names):
+            self.description = [type("Column", (), {"name": name}) for name in names]
+
+    # same columns order - positional constructor
+    factory = module.Users.row_factory(Cursor("id", "email", "name"))
+    assert factory == module.Users.from_row
+    assert factory(row) == user
+    # other columns - values are matched by names
+    factory = module.Users.row_factory(Cursor("name", "id"))
+    assert factory(("Ann", 1)) == module.Users(id=1, name="Ann")
+
+    os.remove(os.path.abspath(module.__file__))
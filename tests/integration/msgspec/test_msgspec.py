@@ -0,0 +1,62 @@
+"""Integration tests for msgspec Struct generation."""
+
+import datetime
+import os
+
+import pytest
+
+from omymodels import create_models
+
+msgspec = pytest.importorskip("msgspec")
+
+ddl = """
+CREATE TABLE events (
+    id BIGINT NOT NULL,
+    kind VARCHAR(8) NOT NULL,
+    amount DECIMAL(10, 2),
+    created_at TIMESTAMP NOT NULL DEFAULT now()
+);
+"""
+
+
+def test_msgspec_struct_round_trip(load_generated_code) -> None:
+    result = create_models(ddl, models_type="msgspec", dump=False)["code"]
+    module = load_generated_code(result)
+
+    event = module.Events(id=1, kind="click")
+    assert isinstance(event.created_at, datetime.datetime)
+    assert event.amount is None
+
+    data = msgspec.json.encode(event)
+    assert msgspec.json.decode(data, type=module.Events) == event
+
+    with pytest.raises(msgspec.ValidationError):
+        msgspec.json.decode(b'{"id": 1, "kind": "too long kind"}', type=module.Events)
+
+    os.remove(module.__file__)
+
+
+def test_msgspec_array_like_struct(load_generated_code) -> None:
+    result = create_models(
+        ddl,
+        models_type="msgspec",
+        generator_options={
+            "array_like": True,
+            "frozen": True,
+            "gc": False,
+            "kw_only": True,
+        },
+        dump=False,
+    )["code"]
+    module = load_generated_code(result)
+
+    # fields keep DDL column order, so rows can be decoded from arrays
+    row = b'[1, "click", 10.5, "2024-01-01T00:00:00"]'
+    event = msgspec.json.decode(row, type=module.Events)
+    assert event.amount == 10.5
+    assert msgspec.json.encode(event) == b'[1,"click",10.5,"2024-01-01T00:00:00"]'
+
+    with pytest.raises(AttributeError):
+        event.id = 2
+
+    os.remove(module.__file__)
@@ -66,3 +66,35 @@ def test_pydantic_max_length_validation(load_generated_code) -> None:
     assert "email" in str(exc_info.value)
 
     os.remove(os.path.abspath(module.__file__))
+
+
+def test_pydantic_row_constructors(load_generated_code) -> None:
+    from pydantic import ValidationError
+
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER NOT NULL,
+        name VARCHAR(10)
+    );
+    """
+    result = create_models(
+        ddl, models_type="pydantic", generator_options={"row_constructors": True}
+    )["code"]
+    module = load_generated_code(result)
+
+    assert module.Users.from_row(("1", "Ann")) == module.Users(id=1, name="Ann")
+    assert [user.id for user in module.Users.from_rows([(1, None), (2, "Bob")])] == [1, 2]
+    with pytest.raises(ValidationError):
+        module.Users.from_row((1, "too long name"))
+    os.remove(os.path.abspath(module.__file__))
+
+    result = create_models(
+        ddl,
+        models_type="pydantic",
+        generator_options={"row_constructors": True, "trusted_rows": True},
+    )["code"]
+    module = load_generated_code(result)
+
+    # trusted rows are not validated
+    assert module.Users.from_row(("1", "too long name")).id == "1"
+    os.remove(os.path.abspath(module.__file__))
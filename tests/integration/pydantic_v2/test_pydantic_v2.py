@@ -1,6 +1,7 @@
 import os
 import sys
 
+import pydantic
 import pytest
 
 from omymodels import create_models
@@ -146,3 +147,95 @@ def test_pydantic_v2_max_length_validation(load_generated_code) -> None:
     assert "email" in str(exc_info.value)
 
     os.remove(os.path.abspath(module.__file__))
+
+
+@pytest.mark.skipif(
+    pydantic.VERSION.startswith("1."), reason="model_config requires Pydantic 2"
+)
+def test_pydantic_v2_model_config_is_applied(load_generated_code) -> None:
+    ddl = """
+    CREATE TABLE users (
+        id INT NOT NULL,
+        name VARCHAR(10)
+    );
+    """
+    result = create_models(
+        ddl,
+        models_type="pydantic_v2",
+        generator_options={"defer_build": True, "frozen": True, "from_attributes": True},
+    )["code"]
+    module = load_generated_code(result)
+
+    class Row:
+        id = 1
+        name = "John"
+
+    user = module.Users.model_validate(Row())
+    assert user.name == "John"
+    with pytest.raises(pydantic.ValidationError):
+        user.name = "Bob"
+
+    os.remove(module.__file__)
+
+
+@pytest.mark.skipif(
+    pydantic.VERSION.startswith("1."), reason="TypeAdapter requires Pydantic 2"
+)
+def test_pydantic_v2_bulk_helpers(load_generated_code) -> None:
+    ddl = """
+    CREATE TABLE users (
+        id INT NOT NULL,
+        name VARCHAR(10)
+    );
+    """
+    result = create_models(
+        ddl, models_type="pydantic_v2", generator_options={"bulk_helpers": True}
+    )["code"]
+    module = load_generated_code(result)
+
+    users = module.Users.validate_many([{"id": 1, "name": "John"}, {"id": "2"}])
+    assert [user.id for user in users] == [1, 2]
+    assert module.Users.validate_many_json(b'[{"id": 3}]')[0].id == 3
+    assert module.Users.dump_many(users, exclude_none=True) == [
+        {"id": 1, "name": "John"},
+        {"id": 2},
+    ]
+    # adapter is built once per model
+    assert list(module._list_adapters) == [module.Users]
+    with pytest.raises(pydantic.ValidationError):
+        module.Users.validate_many([{"id": 1, "name": "too long name"}])
+
+    os.remove(module.__file__)
+
+
+@pytest.mark.skipif(
+    pydantic.VERSION.startswith("1."), reason="model_validate requires Pydantic 2"
+)
+def test_pydantic_v2_row_constructors(load_generated_code) -> None:
+    ddl = """
+    CREATE TABLE users (
+        id INT NOT NULL,
+        name VARCHAR(10)
+    );
+    """
+    result = create_models(
+        ddl, models_type="pydantic_v2", generator_options={"row_constructors": True}
+    )["code"]
+    module = load_generated_code(result)
+
+    assert module.Users.from_row(("1", "Ann")) == module.Users(id=1, name="Ann")
+    assert [user.id for user in module.Users.from_rows([(1, None), (2, "Bob")])] == [1, 2]
+    with pytest.raises(pydantic.ValidationError):
+        module.Users.from_row((1, "too long name"))
+    os.remove(module.__file__)
+
+    result = create_models(
+        ddl,
+        models_type="pydantic_v2",
+        generator_options={"row_constructors": True, "trusted_rows": True},
+    )["code"]
+    module = load_generated_code(result)
+
+    # trusted rows are not validated
+    assert module.Users.from_row(("1", "too long name")).id == "1"
+    os.remove(module.__file__)
@@ -137,3 +137,128 @@ def test_sqlalchemy_core_with_index(load_generated_code) -> None:
     assert isinstance(module.products, Table)
 
     os.remove(os.path.abspath(module.__file__))
+
+
+def test_sqlalchemy_core_bulk_helpers(load_generated_code) -> None:
+    """Integration test: rows in columns order & COPY data encoding."""
+    ddl = """
+    CREATE TABLE users (
+        id SERIAL PRIMARY KEY,
+        email VARCHAR(255) NOT NULL,
+        tags TEXT[],
+        meta JSONB,
+        is_active BOOLEAN
+    );
+    """
+    result = create_models(
+        ddl, models_type="sqlalchemy_core", generator_options={"bulk_helpers": True}
+    )["code"]
+
+    module = load_generated_code(result)
+
+    assert module.users_columns == tuple(module.users.c.keys())
+    rows = module.users_rows_from_dicts(
+        [
+            {
+                "email": "a\tb\\c",
+                "id": 1,
+                "tags": ["x", 'y"z', None],
+                "meta": {"k": [1]},
+                "is_active": True,
+            },
+            {"id": 2, "email": ""},
+        ]
+    )
+    assert rows == [
+        (1, "a\tb\\c", ["x", 'y"z', None], {"k": [1]}, True),
+        (2, "", None, None, None),
+    ]
+
+    assert module.users_copy_data(rows) == (
+        '1\ta\\tb\\\\c\t{"x","y\\\\"z",NULL}\t{"k": [1]}\tt\n'
+        "2\t\t\\N\t\\N\t\\N\n"
+    )
+    assert module.users_copy_data(rows, csv=True) == (
+        '1,a\tb\\c,"{""x"",""y\\""z"",NULL}","{""k"": [1]}",t\n'
+        '2,"",,,\n'
+    )
+
+    os.remove(os.path.abspath(module.__file__))
+
+
+def test_sqlalchemy_core_upsert_helpers(load_generated_code) -> None:
+    """Integration test: upsert statements for unique keys."""
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.dialects import mysql, postgresql
+
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        email VARCHAR(255) NOT NULL UNIQUE,
+        name TEXT
+    );
+    """
+    result = create_models(
+        ddl, models_type="sqlalchemy_core", generator_options={"upsert_helpers": True}
+    )["code"]
+
+    module = load_generated_code(result)
+
+    assert str(module.users_upsert(on=("email",)).compile(dialect=postgresql.dialect())).endswith(
+        "ON CONFLICT (email) DO UPDATE SET name = excluded.name"
+    )
+    assert str(module.users_upsert(dialect="mysql").compile(dialect=mysql.dialect())).endswith(
+        "ON DUPLICATE KEY UPDATE email = VALUES(email), name = VALUES(name)"
+    )
+    with pytest.raises(ValueError):
+        module.users_upsert(on=("name",))
+
+    engine = create_engine("sqlite://")
+    module.metadata.create_all(engine)
+    with engine.begin() as conn:
+        upsert = module.users_upsert(on=("email",), dialect="sqlite")
+        conn.execute(upsert, [{"id": 1, "email": "a", "name": "first"}])
+        conn.execute(upsert, [{"id": 2, "email": "a", "name": "second"}])
+        rows = conn.execute(select(module.users)).all()
+    assert rows == [(1, "a", "second")]
+
+    os.remove(os.path.abspath(module.__file__))
+
+
+def test_sqlalchemy_core_lookup_helpers(load_generated_code) -> None:
+    """Integration test: lookups by primary & unique keys."""
+    from sqlalchemy import create_engine
+
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        tenant_id INTEGER NOT NULL,
+        login VARCHAR(50) NOT NULL,
+        CONSTRAINT uq_users_tenant_login UNIQUE (tenant_id, login)
+    );
+    """
+    result = create_models(
+        ddl, models_type="sqlalchemy_core", generator_options={"lookup_helpers": True}
+    )["code"]
+
+    module = load_generated_code(result)
+
+    engine = create_engine("sqlite://")
+    module.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            module.users.insert(),
+            [{"id": i, "tenant_id": i % 2, "login": f"user{i}"} for i in range(10)],
+        )
+        assert module.users_get_by_id(conn, 3) == (3, 1, "user3")
+        assert module.users_get_by_id(conn, 42) is None
+        assert module.users_get_by_tenant_id_and_login(conn, 0, "user4").id == 4
+        rows = module.users_get_many_by_id(conn, range(8), chunk_size=3)
+        assert sorted(row.id for row in rows) == list(range(8))
+        rows = module.users_get_many_by_tenant_id_and_login(
+            conn, [(1, "user1"), (0, "user2"), (0, "user3")]
+        )
+        assert sorted(row.id for row in rows) == [1, 2]
+        assert module.users_get_many_by_id(conn, []) == []
+
+    os.remove(os.path.abspath(module.__file__))
@@ -249,3 +249,137 @@ def test_sqlalchemy_v2_relationships_with_back_populates(load_generated_code) ->
     assert "author" in book_relationships.keys()
 
     os.remove(os.path.abspath(module.__file__))
+
+
+def test_sqlalchemy_v2_relationship_loading_strategies(load_generated_code) -> None:
+    """Integration test: lazy options and passive_deletes are valid relationship() args."""
+    ddl = """
+    CREATE TABLE authors (
+        id SERIAL PRIMARY KEY
+    );
+
+    CREATE TABLE books (
+        id SERIAL PRIMARY KEY,
+        author_id INT REFERENCES authors (id) ON DELETE CASCADE
+    );
+    """
+    result = create_models(
+        ddl,
+        models_type="sqlalchemy_v2",
+        relationships=True,
+        generator_options={"lazy_one_to_many": "selectin", "lazy_many_to_one": "raise"},
+    )["code"]
+
+    module = load_generated_code(result)
+
+    from sqlalchemy.orm import configure_mappers
+    configure_mappers()
+
+    books = module.Authors.__mapper__.relationships["books"]
+    assert books.lazy == "selectin"
+    assert books.passive_deletes is True
+    assert books.cascade.delete and not books.cascade.delete_orphan
+    assert module.Books.__mapper__.relationships["author"].lazy == "raise"
+    foreign_key = next(iter(module.Books.__table__.c.author_id.foreign_keys))
+    assert foreign_key.ondelete == "CASCADE"
+
+    os.remove(os.path.abspath(module.__file__))
+
+
+def test_sqlalchemy_v2_deferred_large_columns(load_generated_code) -> None:
+    ddl = """
+    CREATE TABLE documents (
+        id SERIAL PRIMARY KEY,
+        title VARCHAR(100),
+        body TEXT,
+        meta JSON
+    );
+    """
+    result = create_models(
+        ddl,
+        models_type="sqlalchemy_v2",
+        generator_options={"defer_large_columns": True, "deferred_group": "content"},
+    )["code"]
+
+    module = load_generated_code(result)
+
+    from sqlalchemy import select
+
+    query = str(select(module.Documents))
+    assert "documents.title" in query
+    assert "documents.body" not in query
+    assert "documents.meta" not in query
+    body = module.Documents.__mapper__.column_attrs["body"]
+    assert body.deferred is True
+    assert body.group == "content"
+
+    os.remove(os.path.abspath(module.__file__))
+
+
+def test_sqlalchemy_v2_upsert_helpers(load_generated_code) -> None:
+    ddl = """
+    CREATE TABLE users (
+        id SERIAL PRIMARY KEY,
+        tenant_id INTEGER NOT NULL,
+        login VARCHAR(50) NOT NULL,
+        name TEXT,
+        CONSTRAINT uq_users_tenant_login UNIQUE (tenant_id, login)
+    );
+    """
+    result = create_models(
+        ddl, models_type="sqlalchemy_v2", generator_options={"upsert_helpers": True}
+    )["code"]
+
+    module = load_generated_code(result)
+
+    from sqlalchemy import create_engine, select
+
+    engine = create_engine("sqlite://")
+    module.Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        upsert = module.Users.upsert(on=("tenant_id", "login"), dialect="sqlite")
+        conn.execute(
+            upsert,
+            [
+                {"id": 1, "tenant_id": 1, "login": "a", "name": "first"},
+                {"id": 2, "tenant_id": 1, "login": "b", "name": "other"},
+            ],
+        )
+        conn.execute(upsert, [{"id": 3, "tenant_id": 1, "login": "a", "name": "second"}])
+        rows = conn.execute(select(module.Users.__table__)).all()
+    assert rows == [(1, 1, "a", "second"), (2, 1, "b", "other")]
+
+    os.remove(os.path.abspath(module.__file__))
+
+
+def test_sqlalchemy_v2_lookup_helpers(load_generated_code) -> None:
+    ddl = """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        email VARCHAR(255) NOT NULL UNIQUE
+    );
+    """
+    result = create_models(
+        ddl, models_type="sqlalchemy_v2", generator_options={"lookup_helpers": True}
+    )["code"]
+
+    module = load_generated_code(result)
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    engine = create_engine("sqlite://")
+    module.Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [module.Users(id=i, email=f"user{i}@example.com") for i in range(5)]
+        )
+        session.flush()
+        user = module.users_get_by_email(session, "user2@example.com")
+        assert isinstance(user, module.Users)
+        assert user.id == 2
+        assert module.users_get_by_id(session, 10) is None
+        users = module.users_get_many_by_id(session, [4, 1, 10], chunk_size=2)
+        assert sorted(user.id for user in users) == [1, 4]
+
+    os.remove(os.path.abspath(module.__file__))
@@ -0,0 +1,60 @@
+import importlib
+import sys
+
+import pytest
+
+from omymodels import create_models
+
+try:
+    import sqlalchemy  # noqa: F401
+    HAS_SQLALCHEMY = True
+except ImportError:
+    HAS_SQLALCHEMY = False
+
+pytestmark = [
+    pytest.mark.skipif(
+        sys.version_info < (3, 10),
+        reason="sqlalchemy_v2 syntax requires Python 3.10+ for runtime evaluation"
+    ),
+    pytest.mark.skipif(
+        not HAS_SQLALCHEMY,
+        reason="SQLAlchemy is not installed"
+    ),
+]
+
+
+def test_sqlalchemy_v2_package_lazy_import_and_relationships(tmp_path, monkeypatch) -> None:
+    """Integration test: package modules are imported on access and mappers configure."""
+    from sqlalchemy.orm import configure_mappers
+
+    ddl = """
+    CREATE TABLE users (id SERIAL PRIMARY KEY);
+    CREATE TABLE posts (id SERIAL PRIMARY KEY, user_id INT REFERENCES users (id));
+    CREATE TABLE tags (id SERIAL PRIMARY KEY);
+    """
+    create_models(
+        ddl,
+        models_type="sqlalchemy_v2",
+        package_mode="table",
+        relationships=True,
+        dump_path=str(tmp_path / "lazy_models.py"),
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    package = importlib.import_module("lazy_models")
+    assert "lazy_models.tags" not in sys.modules
+
+    tags = package.Tags
+    assert tags.__tablename__ == "tags"
+    assert "lazy_models.tags" in sys.modules
+    assert "lazy_models.users" not in sys.modules
+
+    posts = package.Posts
+    # related model is resolved by name, base.py imports it on configure
+    assert "lazy_models.users" not in sys.modules
+    configure_mappers()
+    assert "lazy_models.users" in sys.modules
+    assert posts.user.property.mapper.class_ is package.Users
+
+    package.load_all()
+    assert set(package.Base.metadata.tables) == {"users", "posts", "tags"}
@@ -0,0 +1,52 @@
+from table_meta import TableMeta
+
+from omymodels.dependencies import ForeignKeyGraph
+
+
+def make_table(name, references=None):
+    columns = [{"name": "id", "type": "int"}]
+    for column, ref_table in (references or {}).items():
+        columns.append(
+            {
+                "name": column,
+                "type": "int",
+                "references": {"table": ref_table, "column": "id"},
+            }
+        )
+    return TableMeta(table_name=name, columns=columns, primary_key=["id"])
+
+
+def test_sort_puts_referenced_tables_first():
+    graph = ForeignKeyGraph(
+        [
+            make_table("c", {"b_id": "b"}),
+            make_table("b", {"a_id": "a"}),
+            make_table("a"),
+        ]
+    )
+    assert graph.sort(["c", "b", "a"]) == ["a", "b", "c"]
+
+
+def test_self_reference_is_not_a_cycle():
+    graph = ForeignKeyGraph([make_table("tree", {"parent_id": "tree"})])
+    assert graph.find_cycles() == []
+    assert graph.sort(["tree"]) == ["tree"]
+
+
+def test_cycles_are_detected_and_kept_in_order():
+    graph = ForeignKeyGraph(
+        [
+            make_table("x", {"y_id": "y"}),
+            make_table("y", {"x_id": "x"}),
+            make_table("z", {"unknown_id": "unknown"}),
+        ]
+    )
+    assert graph.find_cycles() == [["x", "y"]]
+    assert graph.sort(["x", "y", "z"]) == ["z", "x", "y"]
+
+
+def test_closure_skips_tables_missing_in_ddl():
+    graph = ForeignKeyGraph(
+        [make_table("a", {"b_id": "b", "ext_id": "external"}), make_table("b")]
+    )
+    assert graph.closure(["a"]) == ["a", "b"]
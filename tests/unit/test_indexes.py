@@ -0,0 +1,187 @@
+from table_meta import TableMeta
+
+from omymodels.indexes import (
+    add_index_details,
+    find_unindexed_foreign_keys,
+    index_name,
+    index_options,
+    parse_index_statements,
+    table_indexes,
+    unique_keys,
+)
+
+
+def make_table(indexes=None, primary_key=("id",), alter=None):
+    columns = [
+        {"name": "id", "type": "int"},
+        {"name": "user_id", "type": "int", "references": {"table": "users", "column": "id"}},
+        {"name": "shop_id", "type": "int"},
+    ]
+    return TableMeta(
+        table_name="orders",
+        columns=columns,
+        primary_key=list(primary_key),
+        index=indexes or [],
+        alter=alter or {},
+    )
+
+
+def make_index(name, columns, unique=False):
+    return {"index_name": name, "columns": columns, "unique": unique}
+
+
+def test_unindexed_foreign_key_reported():
+    assert find_unindexed_foreign_keys([make_table()]) == [
+        {
+            "table": "orders",
+            "column": "user_id",
+            "ref_table": "users",
+            "ref_column": "id",
+            "index_name": "ix_orders_user_id",
+        }
+    ]
+
+
+def test_only_leading_index_column_covers_foreign_key():
+    table = make_table(indexes=[make_index("ix_orders", ["id", "user_id"])])
+    assert [fk["column"] for fk in find_unindexed_foreign_keys([table])] == ["user_id"]
+    table = make_table(indexes=[make_index("ix_orders", ["user_id", "id"])])
+    assert find_unindexed_foreign_keys([table]) == []
+
+
+def test_partial_index_does_not_cover_foreign_key():
+    partial = {**make_index("ix_orders_user_id", ["user_id"]), "where": "shop_id IS NULL"}
+    table = make_table(indexes=[partial])
+    assert [fk["index_name"] for fk in find_unindexed_foreign_keys([table])] == [
+        "ix_orders_user_id_fk"
+    ]
+
+
+def test_primary_key_covers_foreign_key():
+    table = make_table(primary_key=("user_id", "id"))
+    assert find_unindexed_foreign_keys([table]) == []
+
+
+def test_alter_foreign_key_reported():
+    alter = {
+        "columns": [
+            {
+                "name": "shop_id",
+                "constraint_name": None,
+                "references": {"table": "shops", "column": "id"},
+            }
+        ]
+    }
+    result = find_unindexed_foreign_keys([make_table(alter=alter)])
+    assert [fk["column"] for fk in result] == ["user_id", "shop_id"]
+
+
+def test_table_indexes_adds_fk_indexes_only_when_asked():
+    table = make_table(indexes=[make_index("ix_orders_id", ["id"])])
+    assert table_indexes(table) == [make_index("ix_orders_id", ["id"])]
+    assert table_indexes(table, fk_indexes=True) == [
+        make_index("ix_orders_id", ["id"]),
+        make_index("ix_orders_user_id", ["user_id"]),
+    ]
+
+
+def test_index_name_is_truncated():
+    assert len(index_name("t" * 60, ["column"])) == 63
+
+
+def test_unique_keys():
+    table = make_table(
+        indexes=[
+            make_index("ix_orders_user_id", ["user_id"]),
+            make_index("uq_orders_user_shop", ["user_id", "shop_id"], unique=True),
+            make_index("uq_orders_id", ["id"], unique=True),
+        ]
+    )
+    assert unique_keys(table) == [("id",), ("user_id", "shop_id")]
+    assert unique_keys(make_table(primary_key=())) == []
+
+
+def test_unique_keys_skip_partial_indexes():
+    partial = make_index("uq_orders_shop", ["shop_id"], unique=True)
+    partial["where"] = "deleted_at IS NULL"
+    assert unique_keys(make_table(indexes=[partial])) == [("id",)]
+
+
+def test_parse_index_statements_details():
+    ddl = """
+    CREATE INDEX ix_docs_active ON public.docs (created_at DESC NULLS FIRST, title(10))
+        WHERE status = 'active';
+    CREATE UNIQUE INDEX IF NOT EXISTS "ix_docs_body" ON docs USING gin (body jsonb_path_ops)
+        INCLUDE (id);
+    """
+    active, body = parse_index_statements(ddl)
+    assert active["table_name"] == "docs" and active["schema"] == "public"
+    assert active["where"] == "status = 'active'"
+    assert active["columns"] == ["created_at", "title"]
+    assert active["detailed_columns"][0]["order"] == "DESC"
+    assert active["detailed_columns"][0]["nulls"] == "FIRST"
+    assert active["detailed_columns"][1]["length"] == 10
+    assert body["index_name"] == "ix_docs_body" and body["unique"]
+    assert body["using"] == "gin"
+    assert body["include"] == ["id"]
+    assert body["detailed_columns"][0]["opclass"] == "jsonb_path_ops"
+
+
+def test_parse_index_statements_skips_expression_indexes():
+    assert parse_index_statements("CREATE INDEX ix ON users (lower(email));") == []
+
+
+def test_add_index_details_replaces_parsed_index():
+    tables = [
+        {
+            "table_name": "docs",
+            "schema": None,
+            "index": [
+                {
+                    "index_name": "ix_title",
+                    "columns": ["title"],
+                    "detailed_columns": [{"name": "title", "nulls": "varchar_pattern_ops"}],
+                    "unique": False,
+                }
+            ],
+        }
+    ]
+    ddl = """CREATE INDEX ix_title ON docs (title varchar_pattern_ops);
+    CREATE INDEX ix_body ON docs USING gin (body);"""
+    indexes = add_index_details(tables, ddl)[0]["index"]
+    assert [index["index_name"] for index in indexes] == ["ix_title", "ix_body"]
+    assert indexes[0]["detailed_columns"][0]["opclass"] == "varchar_pattern_ops"
+    assert indexes[0]["detailed_columns"][0]["nulls"] is None
+
+
+def test_add_index_details_by_schema():
+    tables = [
+        {"table_name": "docs", "schema": "a", "index": []},
+        {"table_name": "docs", "schema": "b", "index": []},
+        {"table_name": "docs", "schema": None, "index": []},
+    ]
+    ddl = """CREATE INDEX ix_title ON docs (title);
+    CREATE INDEX ix_body ON a.docs USING gin (body);
+    CREATE INDEX ix_title ON b.docs (title DESC);"""
+    a, b, public = add_index_details(tables, ddl)
+    assert [index["index_name"] for index in a["index"]] == ["ix_title", "ix_body"]
+    assert b["index"][0]["detailed_columns"][0]["order"] == "DESC"
+    assert [index["index_name"] for index in public["index"]] == ["ix_title"]
+
+
+def test_index_options():
+    index = {
+        "index_name": "ix",
+        "columns": ["title"],
+        "unique": False,
+        "detailed_columns": [{"name": "title", "opclass": "gin_trgm_ops", "length": 10}],
+        "using": "gin",
+        "include": ["id"],
+        "where": "status = 'active'",
+    }
+    assert index_options(index) == (
+        ", postgresql_using='gin', postgresql_include=['id'], "
+        "postgresql_where=sa.text(\"status = 'active'\"), "
+        "postgresql_ops={'title': 'gin_trgm_ops'}, mysql_length={'title': 10}"
+    )
+    assert index_options(make_index("ix", ["title"])) == ""
@@ -0,0 +1,51 @@
+from omymodels.partitions import (
+    add_partitions,
+    parse_partition_statements,
+    partition_statements,
+)
+
+
+ddl = """
+CREATE TABLE events (id INT, created_at TIMESTAMP) PARTITION BY RANGE (created_at);
+CREATE TABLE IF NOT EXISTS events_2024 PARTITION OF events
+    FOR VALUES FROM ('2024-01-01') TO ('2025-01-01') PARTITION BY LIST (id);
+CREATE TABLE events_2024_one PARTITION OF events_2024 FOR VALUES IN (1);
+CREATE TABLE archive.events_default PARTITION OF public.events DEFAULT;
+"""
+
+
+def test_parse_partition_statements():
+    year, one, default = parse_partition_statements(ddl)
+    assert year["table_name"] == "events_2024"
+    assert year["parent"] == "events"
+    assert year["bound"] == (
+        "FOR VALUES FROM ('2024-01-01') TO ('2025-01-01') PARTITION BY LIST (id)"
+    )
+    assert one["parent"] == "events_2024"
+    assert default["schema"] == "archive"
+    assert default["parent_schema"] == "public"
+    assert default["bound"] == "DEFAULT"
+
+
+def test_add_partitions_collapses_children_into_root():
+    tables = [
+        {"table_name": "events", "schema": None},
+        {"table_name": "events_2024", "schema": None},
+    ]
+    tables = add_partitions(tables, ddl)
+    assert [table["table_name"] for table in tables] == ["events"]
+    assert [partition["table_name"] for partition in tables[0]["partitions"]] == [
+        "events_2024",
+        "events_2024_one",
+        "events_default",
+    ]
+
+
+def test_partition_statements():
+    class Table:
+        partitions = parse_partition_statements(ddl)
+
+    assert partition_statements(Table)[1:] == [
+        "CREATE TABLE events_2024_one PARTITION OF events_2024 FOR VALUES IN (1)",
+        "CREATE TABLE archive.events_default PARTITION OF public.events DEFAULT",
+    ]
@@ -0,0 +1,59 @@
+from omymodels.sequences import (
+    column_sequences,
+    normalize_sequence,
+    sequence_arguments,
+    sequence_var_name,
+)
+
+
+def test_normalize_sequence():
+    assert normalize_sequence(
+        {
+            "sequence_name": "orders_id_seq",
+            "schema": "public",
+            "increment_by": 10,
+            "start_with": 1000,
+            "cache": 50,
+            "maxvalue": False,
+        }
+    ) == {
+        "name": "orders_id_seq",
+        "schema": "public",
+        "start": 1000,
+        "increment": 10,
+        "cache": 50,
+    }
+    # CACHE 20 CYCLE is reported as cache: "CYCLE"
+    assert normalize_sequence({"sequence_name": "s", "start": 5, "cache": "CYCLE"}) == {
+        "name": "s",
+        "schema": None,
+        "start": 5,
+    }
+
+
+def test_column_sequences():
+    sequences = [{"name": "orders_id_seq", "schema": "public", "cache": 50}]
+    table = {
+        "columns": [
+            {"name": "id", "default": "nextval('public.orders_id_seq',::regclass)"},
+            {"name": "number", "default": "nextval('numbers')"},
+            {"name": "title", "default": "'x'"},
+        ]
+    }
+    assert column_sequences(table, sequences) == {
+        "id": sequences[0],
+        "number": {"name": "numbers", "schema": None},
+    }
+
+
+def test_sequence_arguments():
+    assert (
+        sequence_arguments({"name": "s", "schema": "public", "increment": 10, "cache": 50})
+        == "'s', increment=10, cache=50, schema='public'"
+    )
+
+
+def test_sequence_var_name():
+    assert sequence_var_name({"name": "orders_id_seq", "schema": None}) == "orders_id_seq"
+    assert sequence_var_name({"name": "seq", "schema": "a"}) == "a_seq"
+    assert sequence_var_name({"name": "seq", "schema": "b"}) == "b_seq"
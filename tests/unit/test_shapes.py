@@ -0,0 +1,69 @@
+from table_meta.model import TableMeta
+
+from omymodels.shapes import group_tables_by_shape, shape_base_name, table_shape
+
+
+def table(name, columns, schema=None):
+    return TableMeta(
+        table_name=name,
+        schema=schema,
+        columns=[{"name": column, "type": "int"} for column in columns],
+        primary_key=[columns[0]],
+    )
+
+
+def test_table_shape():
+    assert table_shape(table("a", ["id", "value"])) == table_shape(
+        table("b", ["id", "value"], schema="other")
+    )
+    assert table_shape(table("a", ["id", "value"])) != table_shape(table("a", ["id"]))
+
+
+def test_shape_base_name():
+    tables = [table("events_2024_01", ["id"]), table("events_2024_02", ["id"])]
+    assert shape_base_name(tables) == "EventsBase"
+    assert shape_base_name([table("users", ["id"]), table("users", ["id"])]) == "UsersBase"
+
+
+def test_group_tables_by_shape():
+    tables = [
+        table("events_1", ["id", "value"]),
+        table("events_2", ["id", "value"]),
+        table("users", ["id"]),
+        table("events_base", ["id", "name"]),
+        table("events_copy", ["id", "name"]),
+    ]
+    assert group_tables_by_shape(tables) == {
+        (None, "events_1"): "EventsBase2",
+        (None, "events_2"): "EventsBase2",
+        (None, "events_base"): "EventsBase3",
+        (None, "events_copy"): "EventsBase3",
+    }
+
+
+def test_table_shape_references_to_own_schema():
+    def orders(schema, ref_schema):
+        return TableMeta(
+            table_name="orders",
+            schema=schema,
+            columns=[
+                {
+                    "name": "user_id",
+                    "type": "int",
+                    "references": {
+                        "table": "users",
+                        "schema": ref_schema,
+                        "column": "id",
+                        "on_delete": None,
+                        "on_update": None,
+                    },
+                }
+            ],
+            primary_key=[],
+        )
+
+    assert table_shape(orders("a", "a")) == table_shape(orders("b", "b"))
+    assert table_shape(orders("a", "shared")) != table_shape(orders("b", "b"))
+    assert table_shape(orders("a", "a"), schema_global=False) != table_shape(
+        orders("b", "b"), schema_global=False
+    )
@@ -0,0 +1,50 @@
+from omymodels.storage import add_storage_options, storage_kwargs
+
+
+def test_add_storage_options_postgresql():
+    tables = [
+        {
+            "table_name": "cache",
+            "tablespace": {"tablespace_name": "fast", "temporary": False},
+            "table_properties": {
+                "with": {
+                    "on": None,
+                    "properties": [
+                        {"name": "fillfactor", "value": "70"},
+                        {"name": "autovacuum_enabled", "value": "false"},
+                    ],
+                }
+            },
+        }
+    ]
+    add_storage_options(tables, "CREATE UNLOGGED TABLE IF NOT EXISTS public.cache (id int);")
+    assert tables[0]["tablespace"] == "fast"
+    assert tables[0]["storage"] == {
+        "with": {"fillfactor": 70, "autovacuum_enabled": "false"},
+        "unlogged": True,
+        "tablespace": "fast",
+    }
+
+
+def test_add_storage_options_sqlite_strict_is_not_check():
+    tables = [{"table_name": "t", "checks": "STRICT", "table_properties": {"without": "ROWID"}}]
+    add_storage_options(tables, "")
+    assert tables[0]["checks"] == []
+    assert tables[0]["storage"] == {"without_rowid": True, "strict": True}
+
+
+def test_storage_kwargs():
+    class Table:
+        storage = {
+            "unlogged": True,
+            "engine": "InnoDB",
+            "key_block_size": "8",
+            "without_rowid": True,
+        }
+
+    assert storage_kwargs(Table) == {
+        "prefixes": "['UNLOGGED']",
+        "mysql_engine": "'InnoDB'",
+        "mysql_key_block_size": "'8'",
+        "sqlite_with_rowid": "False",
+    }